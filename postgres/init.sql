@@ -1,6 +1,7 @@
 CREATE TABLE IF NOT EXISTS errors (
     id SERIAL PRIMARY KEY,
     experiment_id VARCHAR(255) NOT NULL,
+    experiment_key BIGINT,
     file_path TEXT NOT NULL,
     error_message TEXT,
     execution_profile VARCHAR(20),
@@ -10,6 +11,7 @@ CREATE TABLE IF NOT EXISTS errors (
 CREATE TABLE IF NOT EXISTS skipped_computations (
     id SERIAL PRIMARY KEY,
     computation_id VARCHAR(255) NOT NULL,
+    computation_key BIGINT,
     reason TEXT,
     execution_profile VARCHAR(20),
     created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Europe/Athens')
@@ -18,11 +20,14 @@ CREATE TABLE IF NOT EXISTS skipped_computations (
 CREATE TABLE IF NOT EXISTS evaluations (
     evaluation_id VARCHAR(100) NOT NULL,
     experiment_id VARCHAR(255) NOT NULL,
+    evaluation_key BIGINT,
+    experiment_key BIGINT,
     first_target VARCHAR(5) NOT NULL,
     second_target VARCHAR(5),
     result NUMERIC NOT NULL,
     notes JSONB,
     execution_time NUMERIC NOT NULL,
+    fidelity NUMERIC NOT NULL DEFAULT 1,
     execution_profile VARCHAR(20),
     created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Europe/Athens'),
     PRIMARY KEY(evaluation_id, experiment_id)
@@ -30,12 +35,15 @@ CREATE TABLE IF NOT EXISTS evaluations (
 
 CREATE TABLE IF NOT EXISTS experiments (
     experiment_id VARCHAR(255) PRIMARY KEY,
+    experiment_key BIGINT,
     experiment_type VARCHAR(10) NOT NULL,
     dataset_name VARCHAR(100) NOT NULL,
     random_seed VARCHAR(10) NOT NULL,
+    seed INTEGER,
     data_perfectness VARCHAR(10) NOT NULL,
     data_error VARCHAR(10),
     error_rate VARCHAR(3),
+    error_rate_pct SMALLINT,
     generator VARCHAR(50) NOT NULL,
     training_size NUMERIC NOT NULL,
     synthetic_size NUMERIC NOT NULL,
@@ -46,4 +54,42 @@ CREATE TABLE IF NOT EXISTS experiments (
     created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Europe/Athens')
 );
 
+CREATE TABLE IF NOT EXISTS script_runs (
+    id SERIAL PRIMARY KEY,
+    script_path TEXT NOT NULL,
+    profile_name VARCHAR(100),
+    kernel_slug VARCHAR(255),
+    status VARCHAR(10) NOT NULL,
+    runtime_seconds NUMERIC NOT NULL,
+    execution_profile VARCHAR(20),
+    created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Europe/Athens')
+);
+
+-- The computations that the workers of a sharded sweep have started, so that a worker does not take over the job of
+-- another one (see synqtab.utils.scheduling_utils.claim_normal_experiment)
+CREATE TABLE IF NOT EXISTS computation_claims (
+    computation_id VARCHAR(255) PRIMARY KEY,
+    computation_key BIGINT,
+    worker_index INTEGER NOT NULL,
+    execution_profile VARCHAR(20),
+    created_at TIMESTAMP DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Europe/Athens')
+);
+
+-- The typed keys of the IDs (see ExperimentKey and EvaluationKey) and the fidelity of the evaluations for databases created before them.
+-- Fill in the keys of the existing rows afterwards: python -m synqtab.utils.backfill_keys
+ALTER TABLE errors ADD COLUMN IF NOT EXISTS experiment_key BIGINT;
+ALTER TABLE skipped_computations ADD COLUMN IF NOT EXISTS computation_key BIGINT;
+ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS evaluation_key BIGINT;
+ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS experiment_key BIGINT;
+ALTER TABLE evaluations ADD COLUMN IF NOT EXISTS fidelity NUMERIC NOT NULL DEFAULT 1;
+ALTER TABLE experiments ADD COLUMN IF NOT EXISTS experiment_key BIGINT;
+ALTER TABLE experiments ADD COLUMN IF NOT EXISTS seed INTEGER;
+ALTER TABLE experiments ADD COLUMN IF NOT EXISTS error_rate_pct SMALLINT;
+
+CREATE INDEX IF NOT EXISTS idx_errors_experiment_key ON errors(experiment_key);
+CREATE INDEX IF NOT EXISTS idx_skipped_computations_computation_key ON skipped_computations(computation_key);
+CREATE INDEX IF NOT EXISTS idx_evaluations_keys ON evaluations(experiment_key, evaluation_key);
+CREATE INDEX IF NOT EXISTS idx_experiments_experiment_key ON experiments(experiment_key);
+CREATE INDEX IF NOT EXISTS idx_experiments_configuration ON experiments(dataset_name, seed, generator, data_error, error_rate_pct);
+
 CREATE INDEX idx_seed_evaluation_shortname ON evaluation_results(evaluation_shortname, random_seed)
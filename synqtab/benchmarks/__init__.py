@@ -0,0 +1,28 @@
+"""
+Benchmarks package for SynQTab project.
+Measures the throughput (rows per second) and the peak memory of the corruption, generation and
+evaluation hot paths on synthetic tables, against in-memory stand-ins for MinIO and Postgres.
+
+Example:
+    python -m synqtab.benchmarks --rows 1000 10000 --output benchmarks.json
+"""
+from .measurement import measure
+from .stand_ins import LocalMinioClient, LocalPostgresClient, local_stand_ins
+from .suites import (
+    CHEAP_GENERATORS, run_benchmarks, run_corruption_benchmarks,
+    run_evaluation_benchmarks, run_generation_benchmarks,
+)
+from .tables import make_synthetic_table
+
+__all__ = [
+    'CHEAP_GENERATORS',
+    'LocalMinioClient',
+    'LocalPostgresClient',
+    'local_stand_ins',
+    'make_synthetic_table',
+    'measure',
+    'run_benchmarks',
+    'run_corruption_benchmarks',
+    'run_evaluation_benchmarks',
+    'run_generation_benchmarks',
+]
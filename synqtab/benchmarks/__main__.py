@@ -0,0 +1,40 @@
+import argparse
+import json
+
+from synqtab.benchmarks import run_benchmarks
+from synqtab.enums import ProblemType
+
+
+parser = argparse.ArgumentParser(description='Benchmark the corruption, generation and evaluation hot paths.')
+parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000], help='the row counts of the tables.')
+parser.add_argument('--numerical-columns', type=int, default=8)
+parser.add_argument('--categorical-columns', type=int, default=4)
+parser.add_argument('--cardinality', type=int, default=10)
+parser.add_argument('--problem-types', nargs='+', default=[str(problem_type) for problem_type in ProblemType],
+                    choices=[str(problem_type) for problem_type in ProblemType])
+parser.add_argument('--suites', nargs='+', default=['corruption', 'generation', 'evaluation'],
+                    choices=['corruption', 'generation', 'evaluation'])
+parser.add_argument('--repeats', type=int, default=1, help='timed runs per case; the best one is reported.')
+parser.add_argument('--seed', type=int, default=42)
+parser.add_argument('--output', default='benchmarks.json', help='the JSON file to write the results to.')
+args = parser.parse_args()
+
+report = run_benchmarks(
+    row_counts=args.rows,
+    n_numerical_columns=args.numerical_columns,
+    n_categorical_columns=args.categorical_columns,
+    cardinality=args.cardinality,
+    problem_types=[ProblemType(problem_type) for problem_type in args.problem_types],
+    suites=args.suites,
+    repeats=args.repeats,
+    random_seed=args.seed,
+)
+with open(args.output, 'w') as f:
+    json.dump(report, f, indent=2)
+
+for result in report['results']:
+    if result['error']:
+        print(f"{result['suite']:>10} {result['name']:<24} {result['n_rows']:>8} rows: {result['error']}")
+    else:
+        print(f"{result['suite']:>10} {result['name']:<24} {result['n_rows']:>8} rows: "
+              f"{result['rows_per_second']:>12.0f} rows/s, {result['peak_memory_mb']:>8.1f} MB")
@@ -0,0 +1,159 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+import pandas as pd
+
+
+class LocalMinioClient:
+    """In-memory stand-in for `MinioClient` with the same classmethod interface for the operations that the
+    corruption, generation and evaluation paths use. Objects are kept as bytes, so (de)serialization costs
+    are still measured, but no network round-trips are."""
+    _objects: dict[tuple[str, str], bytes] = dict()
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._objects = dict()
+
+    @classmethod
+    def ensure_bucket_exists(cls, bucket_name) -> None:
+        pass
+
+    @classmethod
+    def object_exists(cls, bucket_name, object_name: str) -> bool:
+        return (str(bucket_name), object_name) in cls._objects
+
+    @classmethod
+    def read_bytes_from_bucket(cls, bucket_name, object_name: str) -> bytes:
+        return cls._objects[(str(bucket_name), object_name)]
+
+    @classmethod
+    def upload_bytes_to_bucket(cls, data: bytes, bucket_name, object_name: str, content_type: Optional[str] = None) -> None:
+        cls._objects[(str(bucket_name), object_name)] = bytes(data)
+
+    @classmethod
+    def list_bucket_objects(cls, bucket_name, prefix: str = "") -> list[dict[str, Any]]:
+        return [
+            {'Key': object_name, 'Size': len(data)}
+            for (object_bucket_name, object_name), data in cls._objects.items()
+            if object_bucket_name == str(bucket_name) and object_name.startswith(prefix)
+        ]
+
+    @classmethod
+    def read_parquet_from_bucket(
+        cls, bucket_name, object_name: str, columns: Optional[list[str]] = None,
+        categorical_columns: Optional[list[str]] = None, **pandas_kwargs,
+    ) -> pd.DataFrame:
+        import io
+
+        df = pd.read_parquet(io.BytesIO(cls.read_bytes_from_bucket(bucket_name, object_name)), columns=columns)
+        for column in categorical_columns or []:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
+
+    @classmethod
+    def upload_dataframe_as_parquet_to_bucket(cls, df: pd.DataFrame, bucket_name, object_name: str, **kwargs) -> None:
+        cls.upload_bytes_to_bucket(df.to_parquet(index=False), bucket_name, object_name)
+
+    @classmethod
+    def read_json_from_bucket(cls, bucket_name, prefix: str) -> dict[str, Any]:
+        import json
+
+        return json.loads(cls.read_bytes_from_bucket(bucket_name, prefix).decode('utf-8'))
+
+    @classmethod
+    def upload_json_to_bucket(cls, data: dict[str, Any], bucket_name, folder: Optional[str], file_name: str) -> None:
+        import json
+
+        object_name = f"{folder}/{file_name}" if folder else file_name
+        cls.upload_bytes_to_bucket(json.dumps(data).encode('utf-8'), bucket_name, object_name)
+
+
+class LocalPostgresClient:
+    """In-memory stand-in for `PostgresClient`: the written rows are appended to per-table lists."""
+    tables: dict[str, list[dict[str, Any]]] = dict()
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.tables = dict()
+
+    @classmethod
+    def execute_insert_query(cls, table_name: str, query_params: dict[str, Any]) -> None:
+        cls.tables.setdefault(table_name, []).append(dict(query_params))
+
+    @classmethod
+    def write_runtime_error(cls, experiment_id: str, file_path: str, error_message: str, errors_table_name: str = 'errors'):
+        cls.execute_insert_query(errors_table_name, {
+            'experiment_id': experiment_id, 'file_path': file_path, 'error_message': error_message,
+        })
+
+    @classmethod
+    def write_runtime_errors(cls, runtime_errors: list[dict[str, Any]], errors_table_name: str = 'errors') -> None:
+        for runtime_error in runtime_errors:
+            cls.execute_insert_query(errors_table_name, runtime_error)
+
+    @classmethod
+    def write_skipped_computation(cls, computation_id: str, reason: str, skipped_computations_table_name: str = 'skipped_computations'):
+        cls.execute_insert_query(skipped_computations_table_name, {'computation_id': computation_id, 'reason': reason})
+
+    @classmethod
+    def write_experiment(cls, experiment_results_table_name: str = 'experiments', **experiment) -> None:
+        cls.execute_insert_query(experiment_results_table_name, experiment)
+
+    @classmethod
+    def write_evaluation_result(cls, evaluation_results_table_name: str = 'evaluations', **evaluation_result) -> None:
+        cls.execute_insert_query(evaluation_results_table_name, evaluation_result)
+
+    @classmethod
+    def write_evaluation_results(cls, evaluation_results: list[dict[str, Any]], evaluation_results_table_name: str = 'evaluations'):
+        for evaluation_result in evaluation_results:
+            cls.execute_insert_query(evaluation_results_table_name, evaluation_result)
+
+    @classmethod
+    def experiment_exists(cls, experiment_id: str, experiments_table_name: str = 'experiments', **kwargs) -> bool:
+        return any(row.get('experiment_id') == experiment_id for row in cls.tables.get(experiments_table_name, []))
+
+    @classmethod
+    def evaluation_exists(cls, evaluation_id: str, experiment_id: str, evaluations_table_name: str = 'evaluations') -> bool:
+        return cls.read_evaluation_result(evaluation_id, experiment_id, evaluations_table_name) is not None
+
+    @classmethod
+    def read_evaluation_result(cls, evaluation_id: str, experiment_id: str, evaluations_table_name: str = 'evaluations'):
+        for row in reversed(cls.tables.get(evaluations_table_name, [])):
+            if row.get('evaluation_id') == evaluation_id and row.get('experiment_id') == experiment_id:
+                return row.get('result')
+        return None
+
+
+@contextmanager
+def local_stand_ins() -> Iterator[tuple[type[LocalMinioClient], type[LocalPostgresClient]]]:
+    """Replaces the storage backend and the results store with the in-memory stand-ins for the duration of the
+    block, through `StorageClient.use_backend()` and `ResultsClient.use_backend()`. The code base imports the
+    clients lazily inside functions, so patching the `synqtab.data` package and the client modules covers the
+    direct uses of the clients."""
+    import synqtab.data as data_package
+    from synqtab.data.clients.ResultsClient import ResultsClient
+    from synqtab.data.clients.StorageClient import StorageClient
+    import synqtab.data.clients.MinioClient as minio_client_module
+    import synqtab.data.clients.PostgresClient as postgres_client_module
+
+    LocalMinioClient.reset()
+    LocalPostgresClient.reset()
+    patches = [
+        (data_package, 'MinioClient', LocalMinioClient),
+        (data_package, 'PostgresClient', LocalPostgresClient),
+        (minio_client_module, 'MinioClient', LocalMinioClient),
+        (postgres_client_module, 'PostgresClient', LocalPostgresClient),
+    ]
+    originals = [(module, name, getattr(module, name)) for module, name, _ in patches]
+    previous_storage_backend = StorageClient.use_backend(LocalMinioClient)
+    previous_results_backend = ResultsClient.use_backend(LocalPostgresClient)
+    try:
+        for module, name, stand_in in patches:
+            setattr(module, name, stand_in)
+        yield LocalMinioClient, LocalPostgresClient
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
+        StorageClient.use_backend(previous_storage_backend)
+        ResultsClient.use_backend(previous_results_backend)
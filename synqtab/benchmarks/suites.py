@@ -0,0 +1,226 @@
+from typing import Any, Optional
+
+import pandas as pd
+
+from synqtab.benchmarks.measurement import measure
+from synqtab.benchmarks.tables import TARGET_COLUMN_NAME, get_sdmetrics_metadata, make_synthetic_table
+from synqtab.enums import DataErrorType, EvaluationMethod, GeneratorModel, Metadata, ProblemType
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+# the generators that are cheap enough to benchmark on every change
+CHEAP_GENERATORS: list[GeneratorModel] = [
+    GeneratorModel.MARGINAL_DISTRIBUTIONS,
+    GeneratorModel.BAYESIAN_NETWORK,
+]
+
+
+def _run_case(case: dict[str, Any], computation, n_rows: int, repeats: int) -> dict[str, Any]:
+    """Measures one benchmark case. A case that cannot run here, e.g., because an optional dependency is
+    missing, is reported with its error instead of stopping the suite."""
+    try:
+        return {**case, **measure(computation, n_rows=n_rows, repeats=repeats), 'error': None}
+    except Exception as e:
+        LOG.warning(f"Benchmark case {case} failed: {e!r}")
+        return {**case, 'seconds': None, 'rows_per_second': None, 'peak_memory_mb': None, 'error': repr(e)}
+
+
+def run_corruption_benchmarks(
+    df: pd.DataFrame,
+    metadata: dict[str, Any],
+    data_error_types: Optional[list[DataErrorType]] = None,
+    row_fraction: float = 0.2,
+    repeats: int = 1,
+) -> list[dict[str, Any]]:
+    """Measures `DataError.corrupt()` of every data error type on the table."""
+    categorical_columns = metadata[str(Metadata.CATEGORICAL_FEATURES)]
+    target_column = metadata[str(Metadata.TARGET_FEATURE)]
+
+    results = []
+    for data_error_type in data_error_types or list(DataErrorType):
+        def corrupt():
+            data_error_instance = data_error_type.get_class()(row_fraction=row_fraction)
+            return data_error_instance.corrupt(data=df, categorical_columns=categorical_columns, target_column=target_column)
+
+        case = {'suite': 'corruption', 'name': str(data_error_type), 'row_fraction': row_fraction}
+        results.append(_run_case(case, corrupt, n_rows=len(df), repeats=repeats))
+    return results
+
+
+def run_generation_benchmarks(
+    df: pd.DataFrame,
+    metadata: dict[str, Any],
+    generator_models: Optional[list[GeneratorModel]] = None,
+    repeats: int = 1,
+) -> list[dict[str, Any]]:
+    """Measures `Generator.generate()` of the given generators (by default, the cheap ones) on the table;
+    the generators sample as many rows as they are trained on."""
+    from synqtab.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+
+    target_column = metadata[str(Metadata.TARGET_FEATURE)]
+    X_initial, y_initial = df.drop(columns=[target_column]), df[target_column]
+
+    results = []
+    for generator_model in generator_models or CHEAP_GENERATORS:
+        def generate():
+            return GENERATOR_MODEL_TO_GENERATOR_INSTANCE[generator_model].generate(
+                X_initial=X_initial, y_initial=y_initial, n_samples=len(df), metadata=metadata,
+            )
+
+        case = {'suite': 'generation', 'name': str(generator_model)}
+        results.append(_run_case(case, generate, n_rows=len(df), repeats=repeats))
+    return results
+
+
+def _build_evaluator_params(
+    evaluation_method: EvaluationMethod,
+    real_df: pd.DataFrame,
+    synthetic_df: pd.DataFrame,
+    validation_df: pd.DataFrame,
+    metadata: dict[str, Any],
+    sdmetrics_metadata: dict[str, Any],
+    encoded_data: Optional[tuple],
+) -> dict[str, Any]:
+    """Builds the same evaluator parameters as `EvaluationSession.build_params()` for the (R, S) pair."""
+    import uuid
+    from synqtab.enums import EvaluationInput, ENCODED_INPUT_EVALUATORS
+
+    target_column = metadata[str(Metadata.TARGET_FEATURE)]
+    return {
+        str(EvaluationInput.PROBLEM_TYPE): metadata[str(Metadata.PROBLEM_TYPE)],
+        str(EvaluationInput.METADATA): sdmetrics_metadata,
+        str(EvaluationInput.REAL_VALIDATION_DATA): validation_df,
+        str(EvaluationInput.NOTES): True,
+        str(EvaluationInput.PREDICTION_COLUMN_NAME): target_column,
+        str(EvaluationInput.KNOWN_COLUMN_NAMES): [column for column in real_df.columns if column != target_column],
+        str(EvaluationInput.SENSITIVE_COLUMN_NAMES): [target_column],
+        str(EvaluationInput.REAL_TRAINING_DATA): real_df,
+        str(EvaluationInput.DATA): real_df,
+        str(EvaluationInput.SYNTHETIC_DATA): synthetic_df,
+        str(EvaluationInput.MINORITY_CLASS_LABEL): validation_df[target_column].value_counts(ascending=True).index[0],
+        str(EvaluationInput.REFERENCE_FIT): False,
+        str(EvaluationInput.REFERENCE_DATA): real_df,
+        str(EvaluationInput.REFERENCE_ID): 'benchmark',
+        # a new baseline id per run, so that every run fits its baseline instead of hitting the cache
+        str(EvaluationInput.BASELINE_ID): f"benchmark/{uuid.uuid4().hex}",
+        str(EvaluationInput.ENCODED_DATA): encoded_data if evaluation_method in ENCODED_INPUT_EVALUATORS else None,
+    }
+
+
+def run_evaluation_benchmarks(
+    df: pd.DataFrame,
+    metadata: dict[str, Any],
+    evaluation_methods: Optional[list[EvaluationMethod]] = None,
+    repeats: int = 1,
+    random_seed: int = 42,
+) -> list[dict[str, Any]]:
+    """Measures `Evaluator.evaluate()` of every evaluator that is compatible with the table's problem type.
+    The table is the real data; a table with the same schema and another seed plays the synthetic data and
+    a third one the validation data. Encoded inputs are prepared once, as in an evaluation session."""
+    from types import SimpleNamespace
+    from synqtab.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
+    from synqtab.utils.detection_utils import encode_for_detection
+
+    n_rows = len(df)
+    n_numerical_columns = sum(1 for column in df.columns if column.startswith('num_'))
+    n_categorical_columns = sum(1 for column in df.columns if column.startswith('cat_'))
+    cardinality = max([len(df[column].cat.categories) for column in df.columns if column.startswith('cat_')], default=1)
+    problem_type = ProblemType(metadata[str(Metadata.PROBLEM_TYPE)])
+
+    def make_table_like(seed: int) -> pd.DataFrame:
+        return make_synthetic_table(
+            n_rows, n_numerical_columns, n_categorical_columns, cardinality, problem_type, random_seed=seed)[0]
+
+    synthetic_df = make_table_like(random_seed + 1)
+    validation_df = make_table_like(random_seed + 2)
+    sdmetrics_metadata = get_sdmetrics_metadata(df, metadata)
+    dataset = SimpleNamespace(problem_type=str(problem_type))
+
+    encoded_data = None
+    results = []
+    for evaluation_method in evaluation_methods or list(EvaluationMethod):
+        evaluator_class = EVALUATION_METHOD_TO_EVALUATION_CLASS[evaluation_method]
+        case = {'suite': 'evaluation', 'name': str(evaluation_method)}
+        if not evaluator_class(params=dict()).is_compatible_with(dataset):
+            results.append({**case, 'seconds': None, 'rows_per_second': None, 'peak_memory_mb': None,
+                            'error': f"Not compatible with {problem_type} problems."})
+            continue
+
+        if encoded_data is None:
+            encoded_data = encode_for_detection(df, synthetic_df, metadata=sdmetrics_metadata)
+
+        def evaluate():
+            params = _build_evaluator_params(
+                evaluation_method, df, synthetic_df, validation_df, metadata, sdmetrics_metadata, encoded_data)
+            return evaluator_class(params).evaluate()
+
+        results.append(_run_case(case, evaluate, n_rows=n_rows, repeats=repeats))
+    return results
+
+
+def run_benchmarks(
+    row_counts: list[int],
+    n_numerical_columns: int = 8,
+    n_categorical_columns: int = 4,
+    cardinality: int = 10,
+    problem_types: Optional[list[ProblemType]] = None,
+    suites: Optional[list[str]] = None,
+    repeats: int = 1,
+    random_seed: int = 42,
+) -> dict[str, Any]:
+    """Runs the benchmark suites on synthetic tables of every row count and problem type, against the
+    in-memory MinIO and Postgres stand-ins.
+
+    Args:
+        row_counts (list[int]): the numbers of rows of the tables.
+        n_numerical_columns (int, optional): numerical feature columns per table. Defaults to 8.
+        n_categorical_columns (int, optional): categorical feature columns per table. Defaults to 4.
+        cardinality (int, optional): categories per categorical column. Defaults to 10.
+        problem_types (list[ProblemType], optional): Defaults to classification and regression.
+        suites (list[str], optional): any of 'corruption', 'generation', 'evaluation'. Defaults to all.
+        repeats (int, optional): timed runs per case; the best one is reported. Defaults to 1.
+        random_seed (int, optional): the seed of the tables and of `ReproducibleOperations`. Defaults to 42.
+
+    Returns:
+        dict[str, Any]: the environment of the run and one result per case, ready to be dumped as JSON.
+    """
+    import platform
+    from datetime import datetime, timezone
+    from synqtab.benchmarks.stand_ins import local_stand_ins
+    from synqtab.reproducibility import ReproducibleOperations
+
+    suites = suites or ['corruption', 'generation', 'evaluation']
+    problem_types = problem_types or [ProblemType.CLASSIFICATION, ProblemType.REGRESSION]
+    ReproducibleOperations.set_random_seed(random_seed)
+
+    results = []
+    with local_stand_ins():
+        for problem_type in problem_types:
+            for n_rows in row_counts:
+                df, metadata = make_synthetic_table(
+                    n_rows, n_numerical_columns, n_categorical_columns, cardinality, problem_type, random_seed)
+                table = {
+                    'problem_type': str(problem_type), 'n_rows': n_rows, 'n_columns': df.shape[1], 'cardinality': cardinality,
+                }
+                LOG.info(f"Benchmarking {suites} on table {table}.")
+
+                suite_results = []
+                if 'corruption' in suites:
+                    suite_results += run_corruption_benchmarks(df, metadata, repeats=repeats)
+                if 'generation' in suites:
+                    suite_results += run_generation_benchmarks(df, metadata, repeats=repeats)
+                if 'evaluation' in suites:
+                    suite_results += run_evaluation_benchmarks(df, metadata, repeats=repeats, random_seed=random_seed)
+                results += [{**table, **suite_result} for suite_result in suite_results]
+
+    return {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'random_seed': random_seed,
+        'repeats': repeats,
+        'results': results,
+    }
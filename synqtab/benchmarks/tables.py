@@ -0,0 +1,83 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from synqtab.enums import Metadata, ProblemType
+
+
+TARGET_COLUMN_NAME = 'target'
+
+
+def make_synthetic_table(
+    n_rows: int,
+    n_numerical_columns: int = 8,
+    n_categorical_columns: int = 4,
+    cardinality: int = 10,
+    problem_type: ProblemType = ProblemType.CLASSIFICATION,
+    random_seed: int = 0,
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Creates a table of controlled size and cardinality to benchmark on. Numerical columns are correlated
+    Gaussians, categorical columns have `cardinality` Zipf-distributed, integer-coded categories, and the target depends
+    on both, so that the ML evaluators have a signal to learn. Classification targets are imbalanced (roughly 3:1).
+
+    Args:
+        n_rows (int): the number of rows.
+        n_numerical_columns (int, optional): the number of numerical feature columns. Defaults to 8.
+        n_categorical_columns (int, optional): the number of categorical feature columns. Defaults to 4.
+        cardinality (int, optional): the number of categories per categorical column. Defaults to 10.
+        problem_type (ProblemType, optional): the problem type of the target. Defaults to classification.
+        random_seed (int, optional): the seed of the table. Defaults to 0.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, Any]]: the table and its dataset metadata, i.e., the same keys as the
+        metadata of the real datasets in MinIO.
+    """
+    random_generator = np.random.default_rng(random_seed)
+    columns = dict()
+
+    mixing = random_generator.normal(size=(n_numerical_columns, n_numerical_columns))
+    numerical_values = random_generator.normal(size=(n_rows, n_numerical_columns)) @ mixing
+    for column_index in range(n_numerical_columns):
+        columns[f'num_{column_index}'] = numerical_values[:, column_index]
+
+    category_weights = 1 / np.arange(1, cardinality + 1)
+    category_weights /= category_weights.sum()
+    categorical_columns = [f'cat_{column_index}' for column_index in range(n_categorical_columns)]
+    for column_name in categorical_columns:
+        codes = random_generator.choice(cardinality, size=n_rows, p=category_weights)
+        columns[column_name] = pd.Categorical.from_codes(codes, categories=list(range(cardinality)))
+
+    df = pd.DataFrame(columns)
+
+    signal = numerical_values[:, 0] if n_numerical_columns > 0 else np.zeros(n_rows)
+    if n_categorical_columns > 0:
+        signal = signal + (df[categorical_columns[0]].cat.codes.to_numpy() % 2)
+    signal = signal + random_generator.normal(scale=0.5, size=n_rows)
+
+    if problem_type == ProblemType.CLASSIFICATION:
+        df[TARGET_COLUMN_NAME] = pd.Categorical((signal > np.quantile(signal, 0.75)).astype(int))
+        categorical_features = categorical_columns + [TARGET_COLUMN_NAME]
+    else:
+        df[TARGET_COLUMN_NAME] = signal
+        categorical_features = categorical_columns
+
+    metadata = {
+        str(Metadata.NAME): f'synthetic_{n_rows}x{n_numerical_columns + n_categorical_columns}_c{cardinality}_{problem_type}',
+        str(Metadata.PROBLEM_TYPE): str(problem_type),
+        str(Metadata.TARGET_FEATURE): TARGET_COLUMN_NAME,
+        str(Metadata.CATEGORICAL_FEATURES): categorical_features,
+    }
+    return df, metadata
+
+
+def get_sdmetrics_metadata(df: pd.DataFrame, metadata: dict[str, Any]) -> dict[str, Any]:
+    """Returns the sdmetrics metadata of a table made by `make_synthetic_table()`; same format as
+    `Dataset.get_sdmetrics_single_table_metadata()`."""
+    categorical_features = metadata[str(Metadata.CATEGORICAL_FEATURES)]
+    return {
+        'columns': {
+            column: {'sdtype': 'categorical' if column in categorical_features else 'numerical'}
+            for column in df.columns
+        }
+    }
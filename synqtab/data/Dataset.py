@@ -39,7 +39,7 @@ class Dataset:
     }
 
     def _fetch_metadata(self):
-        from synqtab.data import MinioClient
+        from synqtab.data import StorageClient
         from synqtab.enums import MinioBucket, MinioFolder
         
         bucket_name = MinioBucket.REAL.value
@@ -48,13 +48,13 @@ class Dataset:
             MinioFolder.METADATA,
             f"{self.dataset_name}.yaml"
         )
-        return MinioClient.read_yaml_from_bucket(
+        return StorageClient.read_yaml_from_bucket(
             bucket_name=bucket_name,
             object_name=object_name
         )
         
     def _fetch_real_perfect_dataframe(self) -> pd.DataFrame:
-        from synqtab.data import MinioClient
+        from synqtab.data import StorageClient
         from synqtab.enums import MinioBucket, MinioFolder
         
         bucket_name = MinioBucket.REAL.value
@@ -64,19 +64,14 @@ class Dataset:
             f"{self.dataset_name}.parquet"
         )
 
-        df = MinioClient.read_parquet_from_bucket(
+        # the categorical columns are explicitly declared as such while reading
+        return StorageClient.read_parquet_from_bucket(
             bucket_name=bucket_name,
-            object_name=object_name
+            object_name=object_name,
+            categorical_columns=self.categorcal_features,
         )
 
-        # ensure that the categorical columns are explicitly declared in the pd DataFrame
-        for column in self.categorcal_features:
-            if column in df.columns:
-                df[column] = df[column].astype('category')
-
-        return df
-
-    def get_sdmetrics_single_table_metadata(self) -> dict[str, Any]:
+    def get_sdmetrics_single_table_metadata(self, columns: Optional[list[str]] = None) -> dict[str, Any]:
         """Example based on https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
         {
             "columns": {
@@ -92,13 +87,17 @@ class Dataset:
             }
         }
 
+        Args:
+            columns (list[str], optional): The columns of the dataset. If absent, they are read from the
+            real perfect dataframe, which requires fetching it from MinIO. Defaults to None.
+
         Returns:
             dict[str, Any]: An sdmetrics metadata dictionary
         """
         from synqtab.enums import ProblemType
         
         columns_dict: dict[str, str] = dict()
-        all_columns = self._fetch_real_perfect_dataframe().columns
+        all_columns = columns if columns is not None else self._fetch_real_perfect_dataframe().columns
         
         # Create one sub-dictionary per feature column
         for column in all_columns:
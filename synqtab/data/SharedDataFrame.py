@@ -0,0 +1,117 @@
+import os
+import tempfile
+import uuid
+from typing import Optional, Self
+
+import numpy as np
+import pandas as pd
+
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def _get_shared_memory_directory() -> str:
+    # /dev/shm is RAM-backed on Linux; elsewhere the temporary directory is the closest alternative
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+class SharedDataFrame:
+    """A handle to a dataframe that is stored once as an Arrow IPC file in shared memory (`/dev/shm`). The handle
+    itself only holds the path of the file, so it is cheap to pickle and send to worker processes, which memory-map
+    the file read-only instead of receiving their own pickled copy of the data.
+
+    The process that creates the handle owns the file and must `unlink()` it (or use the handle as a context manager).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, name: Optional[str] = None) -> Self:
+        """Writes `df` to shared memory and returns a handle to it. Categorical columns are kept as
+        Arrow dictionaries, so they come back as categorical columns.
+
+        Args:
+            df (pd.DataFrame): the dataframe to share.
+            name (str, optional): a readable part of the file name, e.g., 'R'. Defaults to None.
+
+        Returns:
+            SharedDataFrame: the handle to the shared dataframe.
+        """
+        import pyarrow as pa
+
+        path = os.path.join(_get_shared_memory_directory(), f"synqtab-{name or 'df'}-{uuid.uuid4().hex}.arrow")
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        LOG.info(f"Shared a dataframe of shape {df.shape} at {path}")
+        return cls(path)
+
+    def to_arrow(self):
+        """Returns the shared data as a `pyarrow.Table` whose buffers point into the memory-mapped file (no copy)."""
+        import pyarrow as pa
+
+        return pa.ipc.open_file(pa.memory_map(self.path, 'r')).read_all()
+
+    def to_numpy(self, column_name: str) -> np.ndarray:
+        """Returns one column as a read-only NumPy view of the memory-mapped file. Only numeric columns without
+        missing values can be viewed without a copy; other columns are copied.
+        """
+        column = self.to_arrow().column(column_name)
+        try:
+            return column.to_numpy(zero_copy_only=True)
+        except Exception:
+            return column.to_numpy(zero_copy_only=False)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Returns the shared data as a pandas dataframe. Numeric columns without missing values are backed by the
+        memory-mapped file where pandas allows it; they are read-only and must not be modified in place.
+        """
+        return self.to_arrow().to_pandas(split_blocks=True, self_destruct=False)
+
+    def unlink(self) -> None:
+        """Removes the shared file. Existing memory maps stay valid until they are closed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+    def __repr__(self) -> str:
+        return f"SharedDataFrame({self.path!r})"
+
+
+class SharedArray:
+    """A handle to a NumPy array stored once as an `.npy` file in shared memory. Worker processes load it with
+    `np.load(..., mmap_mode='r')`, i.e., as a read-only view without copying. See also `SharedDataFrame`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, name: Optional[str] = None) -> Self:
+        path = os.path.join(_get_shared_memory_directory(), f"synqtab-{name or 'array'}-{uuid.uuid4().hex}.npy")
+        np.save(path, np.ascontiguousarray(array), allow_pickle=False)
+        return cls(path)
+
+    def to_numpy(self) -> np.ndarray:
+        return np.load(self.path, mmap_mode='r', allow_pickle=False)
+
+    def unlink(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
+
+    def __repr__(self) -> str:
+        return f"SharedArray({self.path!r})"
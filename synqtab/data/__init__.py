@@ -1,11 +1,28 @@
 from .Dataset import Dataset
+from .SharedDataFrame import SharedArray, SharedDataFrame
+from .clients.DuckDBClient import DuckDBClient
 from .clients.FileSystemClient import FileSystemClient
+from .clients.LocalStorageClient import LocalStorageClient
 from .clients.MinioClient import MinioClient
 from .clients.PostgresClient import PostgresClient
+from .clients.ResultsClient import ResultsClient
+from .clients.ResultsStore import ResultsStore
+from .clients.SQLiteClient import SQLiteClient
+from .clients.StorageBackend import StorageBackend
+from .clients.StorageClient import StorageClient
 
 __all__ = [
     'Dataset',
+    'DuckDBClient',
     'FileSystemClient',
+    'LocalStorageClient',
     'MinioClient',
-    'PostgresClient'
+    'PostgresClient',
+    'ResultsClient',
+    'ResultsStore',
+    'SQLiteClient',
+    'SharedArray',
+    'SharedDataFrame',
+    'StorageBackend',
+    'StorageClient',
 ]
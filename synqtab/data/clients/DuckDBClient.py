@@ -0,0 +1,58 @@
+import re
+from abc import ABCMeta
+
+from synqtab.data.clients.EmbeddedResultsStore import EmbeddedResultsStore
+
+
+class SingletonDuckDBClient(ABCMeta): # the metaclass of ResultsStore
+    _instances = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(SingletonDuckDBClient, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+class DuckDBClient(EmbeddedResultsStore, metaclass=SingletonDuckDBClient):
+    """Results store in a DuckDB file, for sweeps whose results are analyzed in place. A DuckDB file is opened
+    by a single process at a time, so use it with in-process (thread) parallelism; see `SQLiteClient` for
+    stores that many processes write to. Needs the `duckdb` and `duckdb-engine` packages."""
+    _default_file_name = 'results.duckdb'
+
+    @classmethod
+    def _create_database_engine(cls, database_path: str):
+        from sqlalchemy import create_engine
+
+        try:
+            import duckdb_engine # noqa: F401; registers the duckdb dialect of SQLAlchemy
+        except ImportError as e:
+            raise ImportError(
+                "The DuckDB results store needs the 'duckdb' and 'duckdb-engine' packages: "
+                "pip install duckdb duckdb-engine"
+            ) from e
+
+        return create_engine(f"duckdb:///{database_path}", echo=False)
+
+    @classmethod
+    def _translate_create_table(cls, table_name: str, statement: str) -> list[str]:
+        statements = []
+        for column_name in re.findall(r'(\w+) (?:BIG)?SERIAL PRIMARY KEY\b', statement, flags=re.IGNORECASE):
+            sequence_name = f"{table_name}_{column_name}_seq"
+            statements.append(f"CREATE SEQUENCE IF NOT EXISTS {sequence_name}")
+            statement = re.sub(
+                rf'\b{column_name} (?:BIG)?SERIAL PRIMARY KEY\b',
+                f"{column_name} BIGINT PRIMARY KEY DEFAULT nextval('{sequence_name}')",
+                statement,
+                flags=re.IGNORECASE,
+            )
+        # DuckDB's NUMERIC without precision is DECIMAL(18,3), which would round the results
+        statement = re.sub(r'\bNUMERIC\b(?!\s*\()', 'DOUBLE', statement, flags=re.IGNORECASE)
+        statement = re.sub(r'\bJSONB?\b', 'VARCHAR', statement, flags=re.IGNORECASE)
+        statements.append(statement)
+        return statements
+
+    @classmethod
+    def _translate_column_definition(cls, column_definition: str) -> str:
+        column_definition = re.sub(r'\bNUMERIC\b(?!\s*\()', 'DOUBLE', column_definition, flags=re.IGNORECASE)
+        # DuckDB cannot add a column with constraints; the default still fills in the existing rows
+        return re.sub(r'\s*\bNOT NULL\b', '', column_definition, flags=re.IGNORECASE)
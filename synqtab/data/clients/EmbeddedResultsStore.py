@@ -0,0 +1,127 @@
+import os
+import re
+from abc import abstractmethod
+from typing import Any, Optional
+
+from synqtab.data.clients.ResultsStore import ResultsStore
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+_CREATE_TABLE_PATTERN = re.compile(r'^CREATE TABLE (?:IF NOT EXISTS )?(\w+)', re.IGNORECASE)
+_CREATE_INDEX_PATTERN = re.compile(r'^CREATE (UNIQUE )?INDEX (?:IF NOT EXISTS )?(\w+) ON (\w+)', re.IGNORECASE)
+_ADD_COLUMN_PATTERN = re.compile(r'^ALTER TABLE (\w+) ADD COLUMN (?:IF NOT EXISTS )?(\w+) ', re.IGNORECASE)
+_TIMESTAMP_DEFAULT_PATTERN = re.compile(r'DEFAULT \(CURRENT_TIMESTAMP AT TIME ZONE \'[^\']+\'\)', re.IGNORECASE)
+
+
+class EmbeddedResultsStore(ResultsStore):
+    """A results store in a local, in-process database file, for single-node sweeps and benchmarks. The tables
+    are created from `postgres/init.sql` on first use, translated to the dialect of the database, so that the
+    results can be synced to the central Postgres as they are (see `synqtab.utils.sync_results`).
+    """
+    # the database file; None for the RESULTS_DATABASE_PATH environment variable
+    _database_path: Optional[str] = None
+    _default_file_name: str = 'results.db'
+
+    @classmethod
+    def get_database_path(cls) -> str:
+        if cls._database_path is None:
+            from synqtab.environment import RESULTS_DATABASE_PATH
+            database_path = RESULTS_DATABASE_PATH or os.path.join('~', '.synqtab', cls._default_file_name)
+            cls._database_path = os.path.abspath(os.path.expanduser(database_path))
+        return cls._database_path
+
+    @classmethod
+    def set_database_path(cls, database_path: str) -> None:
+        """Points the store to another database file; the engine of the previous file is not reused."""
+        cls._database_path = os.path.abspath(os.path.expanduser(database_path))
+        cls.reset_engine()
+
+    @classmethod
+    @abstractmethod
+    def _create_database_engine(cls, database_path: str):
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def _translate_create_table(cls, table_name: str, statement: str) -> list[str]:
+        """Translates a Postgres CREATE TABLE statement to the statements of the dialect of the database."""
+        raise NotImplementedError
+
+    @classmethod
+    def _translate_column_definition(cls, column_definition: str) -> str:
+        """Translates the definition of a column that a Postgres ALTER TABLE adds, e.g., 'NUMERIC NOT NULL DEFAULT 1'."""
+        return column_definition
+
+    @classmethod
+    def _create_engine(cls):
+        database_path = cls.get_database_path()
+        os.makedirs(os.path.dirname(database_path), exist_ok=True)
+        engine = cls._create_database_engine(database_path)
+        cls._create_schema(engine)
+        LOG.info(f"Using the results database '{database_path}'.")
+        return engine
+
+    @classmethod
+    def _get_schema_statements(cls) -> list[str]:
+        from synqtab.environment import RESULTS_SCHEMA_FILE
+
+        with open(RESULTS_SCHEMA_FILE) as f:
+            schema = f.read()
+        schema = '\n'.join(line for line in schema.splitlines() if not line.strip().startswith('--'))
+
+        statements, table_names = [], set()
+        for statement in (statement.strip() for statement in schema.split(';')):
+            if match := _CREATE_TABLE_PATTERN.match(statement):
+                table_names.add(match.group(1))
+                statement = _TIMESTAMP_DEFAULT_PATTERN.sub('DEFAULT CURRENT_TIMESTAMP', statement)
+                statements += cls._translate_create_table(match.group(1), statement)
+            elif match := _CREATE_INDEX_PATTERN.match(statement):
+                unique, index_name, table_name = match.groups()
+                if table_name not in table_names:
+                    LOG.warning(f"Skipping index '{index_name}' of the schema; there is no table '{table_name}'.")
+                    continue
+                statements.append(
+                    f"CREATE {unique or ''}INDEX IF NOT EXISTS {index_name} ON {table_name}{statement[match.end():].strip()}"
+                )
+            elif match := _ADD_COLUMN_PATTERN.match(statement):
+                # SQLite has no ADD COLUMN IF NOT EXISTS; `_create_schema()` adds only the missing columns
+                table_name, column_name = match.groups()
+                column_definition = cls._translate_column_definition(statement[match.end():].strip())
+                statements.append(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_definition}")
+            elif statement:
+                LOG.warning(f"Skipping a statement of the schema that embedded stores do not support: {statement[:50]}")
+        return statements
+
+    @classmethod
+    def _create_schema(cls, engine) -> None:
+        from sqlalchemy import text
+
+        with engine.begin() as connection:
+            added_columns = False
+            for statement in cls._get_schema_statements():
+                if match := _ADD_COLUMN_PATTERN.match(statement):
+                    table_name, column_name = match.groups()
+                    # the inspector of SQLAlchemy does not support DuckDB; the columns of an empty result do
+                    if column_name in connection.execute(text(f"SELECT * FROM {table_name} LIMIT 0")).keys():
+                        continue
+                    LOG.info(f"Adding the column '{column_name}' to the table '{table_name}' of the results database.")
+                    added_columns = True
+                connection.execute(text(statement))
+
+            # the rows of a database that was created before the typed columns of the IDs
+            if added_columns:
+                cls.backfill_key_columns(connection=connection)
+
+    @classmethod
+    def _prepare_row(cls, row: dict[str, Any]) -> dict[str, Any]:
+        # the schema's default is in the server's zone; fill in the zone of the central Postgres instead
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+
+        row = super()._prepare_row(row)
+        if row.get('created_at') is None:
+            row['created_at'] = datetime.now(ZoneInfo('Europe/Athens')).replace(tzinfo=None).isoformat(sep=' ')
+        return row
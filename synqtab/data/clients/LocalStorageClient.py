@@ -0,0 +1,252 @@
+from abc import ABCMeta
+import os
+import shutil
+import uuid
+from typing import Any, Iterable, Iterator, Optional
+
+import pandas as pd
+import yaml
+
+from synqtab.data.clients.StorageBackend import StorageBackend
+from synqtab.enums import MinioBucket
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class SingletonLocalStorageClient(ABCMeta): # the metaclass of StorageBackend
+    _instances = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(SingletonLocalStorageClient, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+class _LocalStorageClient:
+    _root_directory: Optional[str] = None
+
+
+class LocalStorageClient(_LocalStorageClient, StorageBackend, metaclass=SingletonLocalStorageClient):
+    """Local-disk storage backend with the same interface as `MinioClient`, for single-node runs without
+    MinIO. The object `<bucket>/<key>` is the file `<LOCAL_STORAGE_ROOT>/<bucket>/<key>`. Writes go to a
+    temporary file that is renamed into place, so readers never see partial objects, and Parquet is read
+    through memory maps instead of HTTP.
+    """
+
+    @classmethod
+    def get_root_directory(cls) -> str:
+        if cls._root_directory is None:
+            from synqtab.environment import LOCAL_STORAGE_ROOT
+            cls._root_directory = os.path.abspath(os.path.expanduser(LOCAL_STORAGE_ROOT))
+        return cls._root_directory
+
+    @classmethod
+    def set_root_directory(cls, root_directory: str) -> None:
+        cls._root_directory = os.path.abspath(os.path.expanduser(root_directory))
+
+    @classmethod
+    def _get_path(cls, bucket_name: str | MinioBucket, object_name: str = "") -> str:
+        bucket_directory = os.path.join(cls.get_root_directory(), str(bucket_name))
+        path = os.path.normpath(os.path.join(bucket_directory, object_name))
+        if os.path.commonpath([bucket_directory, path]) != bucket_directory:
+            raise ValueError(f"Object key '{object_name}' points outside of bucket '{bucket_name}'.")
+        return path
+
+    @classmethod
+    def _write_atomically(cls, path: str, write) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp-{uuid.uuid4().hex}"
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    @classmethod
+    def ensure_bucket_exists(cls, bucket_name: str | MinioBucket) -> None:
+        os.makedirs(cls._get_path(bucket_name), exist_ok=True)
+
+    @classmethod
+    def object_exists(cls, bucket_name: str | MinioBucket, object_name: str) -> bool:
+        return os.path.isfile(cls._get_path(bucket_name, object_name))
+
+    @classmethod
+    def iter_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> Iterator[dict[str, Any]]:
+        from datetime import datetime, timezone
+
+        bucket_directory = cls._get_path(bucket_name)
+        for directory, directory_names, file_names in os.walk(bucket_directory):
+            directory_names.sort()
+            for file_name in sorted(file_names):
+                if '.tmp-' in file_name:
+                    continue # an object that is still being written
+                path = os.path.join(directory, file_name)
+                object_name = os.path.relpath(path, bucket_directory).replace(os.sep, '/')
+                if not object_name.startswith(prefix):
+                    continue
+                stat_result = os.stat(path)
+                yield {
+                    'Key': object_name,
+                    'Size': stat_result.st_size,
+                    'LastModified': datetime.fromtimestamp(stat_result.st_mtime, timezone.utc),
+                }
+
+    @classmethod
+    def list_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> list[dict[str, Any]]:
+        contents = list(cls.iter_bucket_objects(bucket_name=bucket_name, prefix=prefix))
+        LOG.info(f"Found {len(contents)} objects in '{bucket_name}' with prefix '{prefix}'.")
+        return contents
+
+    @classmethod
+    def read_bytes_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str) -> bytes:
+        with open(cls._get_path(bucket_name, object_name), 'rb') as f:
+            content = f.read()
+        LOG.info(f"Loaded {len(content)} bytes from '{bucket_name}/{object_name}'.")
+        return content
+
+    @classmethod
+    def upload_bytes_to_bucket(
+        cls, data: bytes, bucket_name: str | MinioBucket, object_name: str, content_type: str = 'application/octet-stream',
+    ) -> None:
+        def write(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+
+        cls._write_atomically(cls._get_path(bucket_name, object_name), write)
+        LOG.info(f"Uploaded {len(data)} bytes to '{bucket_name}/{object_name}'.")
+
+    @classmethod
+    def read_parquet_shape(cls, bucket_name: str | MinioBucket, object_name: str) -> tuple[int, int]:
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(cls._get_path(bucket_name, object_name), memory_map=True)
+        return metadata.num_rows, metadata.num_columns
+
+    @classmethod
+    def read_parquet_from_bucket(
+        cls,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        columns: Optional[list[str]] = None,
+        categorical_columns: Optional[list[str]] = None,
+        **pandas_kwargs,
+    ) -> pd.DataFrame:
+        """Reads a Parquet object through a memory map and converts it to pandas exactly once; see
+        `MinioClient.read_parquet_from_bucket()` for the arguments."""
+        import pyarrow.parquet as pq
+        from synqtab.utils.arrow_utils import arrow_table_to_pandas
+
+        table = pq.read_table(cls._get_path(bucket_name, object_name), columns=columns, memory_map=True)
+        df = arrow_table_to_pandas(table, categorical_columns=categorical_columns, **pandas_kwargs)
+        LOG.info(f"Loaded Parquet from '{bucket_name}/{object_name}' into DataFrame with shape {df.shape}.")
+        return df
+
+    @classmethod
+    def upload_dataframe_as_parquet_to_bucket(
+        cls,
+        df: pd.DataFrame,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+    ) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from synqtab.environment import PARQUET_COMPRESSION, PARQUET_ROW_GROUP_SIZE
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        cls._write_atomically(
+            cls._get_path(bucket_name, object_name),
+            lambda path: pq.write_table(
+                table,
+                path,
+                compression=compression or PARQUET_COMPRESSION,
+                row_group_size=row_group_size or PARQUET_ROW_GROUP_SIZE,
+            ),
+        )
+        LOG.info(f"Uploaded Parquet of shape {df.shape} to '{bucket_name}/{object_name}'.")
+
+    @classmethod
+    def read_json_from_bucket(cls, bucket_name: str | MinioBucket, prefix: str) -> dict[Any]:
+        import json
+
+        data = json.loads(cls.read_bytes_from_bucket(bucket_name, prefix).decode('utf-8'))
+        LOG.info(f"Loaded JSON from '{bucket_name}/{prefix}'.")
+        return data
+
+    @classmethod
+    def upload_json_to_bucket(
+        cls, data: dict[str, Any], bucket_name: str | MinioBucket, folder: Optional[str], file_name: str,
+    ) -> None:
+        import json
+
+        object_key = f"{folder}/{file_name}" if folder else file_name
+        cls.upload_bytes_to_bucket(json.dumps(data, indent=2).encode('utf-8'), bucket_name, object_key)
+
+    @classmethod
+    def read_yaml_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str, **yaml_kwargs) -> dict[str, Any]:
+        data = yaml.safe_load(cls.read_bytes_from_bucket(bucket_name, object_name).decode('utf-8'), **yaml_kwargs)
+        LOG.info(f"Loaded YAML from '{bucket_name}/{object_name}'.")
+        return data
+
+    @classmethod
+    def upload_yaml_to_bucket(cls, data: dict[str, Any], bucket_name: str | MinioBucket, object_name: str) -> None:
+        cls.upload_bytes_to_bucket(yaml.safe_dump(data).encode('utf-8'), bucket_name, object_name)
+
+    @classmethod
+    def upload_file_to_bucket(cls, local_file_path: str, bucket_name: str | MinioBucket, object_name: Optional[str]) -> None:
+        local_file_path = str(local_file_path)
+        object_name = object_name or os.path.basename(local_file_path)
+        cls._write_atomically(
+            cls._get_path(bucket_name, object_name), lambda path: shutil.copyfile(local_file_path, path)
+        )
+        LOG.info(f"Uploaded '{local_file_path}' to '{bucket_name}/{object_name}'.")
+
+    @classmethod
+    def download_file_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str, local_file_path: str) -> None:
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+        shutil.copyfile(cls._get_path(bucket_name, object_name), local_file_path)
+        LOG.info(f"Downloaded '{bucket_name}/{object_name}' to '{local_file_path}'.")
+
+    @classmethod
+    def delete_file_from_bucket(cls, bucket_name: str | MinioBucket, object_key: str) -> None:
+        path = cls._get_path(bucket_name, object_key)
+        if os.path.exists(path):
+            os.remove(path)
+        LOG.info(f"Successfully deleted file '{object_key}' from bucket '{bucket_name}'")
+
+    @classmethod
+    def delete_files_from_bucket(cls, bucket_name: str | MinioBucket, object_keys: Iterable[str]) -> None:
+        object_keys = list(object_keys)
+        for object_key in object_keys:
+            path = cls._get_path(bucket_name, object_key)
+            if os.path.exists(path):
+                os.remove(path)
+        LOG.info(f"Successfully deleted {len(object_keys)} files from bucket '{bucket_name}'.")
+
+    @classmethod
+    def copy_file(
+        cls,
+        source_bucket_name: str | MinioBucket, source_prefix: str,
+        destination_bucket_name: str | MinioBucket, destination_prefix: str
+    ) -> None:
+        source_path = cls._get_path(source_bucket_name, source_prefix)
+        cls._write_atomically(
+            cls._get_path(destination_bucket_name, destination_prefix), lambda path: shutil.copyfile(source_path, path)
+        )
+
+    @classmethod
+    def move_file(
+        cls,
+        source_bucket_name: str | MinioBucket, source_prefix: str,
+        destination_bucket_name: str | MinioBucket, destination_prefix: str
+    ) -> None:
+        destination_path = cls._get_path(destination_bucket_name, destination_prefix)
+        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+        os.replace(cls._get_path(source_bucket_name, source_prefix), destination_path)
+        LOG.info(
+            f"Successfully moved '{source_bucket_name}/{source_prefix}' to '{destination_bucket_name}/{destination_prefix}'"
+        )
@@ -1,17 +1,25 @@
 import io
+from abc import ABCMeta
 import json
 import os
-from typing import Any, Optional
+import threading
+from typing import Any, Iterable, Iterator, Optional
 import yaml
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 import pandas as pd
 
+from synqtab.data.clients.StorageBackend import StorageBackend
 from synqtab.enums import MinioBucket
 from synqtab.environment import (
     MINIO_ROOT_USER, MINIO_ROOT_PASSWORD,
     MINIO_API_MAPPED_PORT, MINIO_HOST,
+    MINIO_MAX_POOL_CONNECTIONS, MINIO_MAX_RETRY_ATTEMPTS,
+    MINIO_CONNECT_TIMEOUT, MINIO_READ_TIMEOUT,
+    MINIO_MULTIPART_THRESHOLD_MB, MINIO_MULTIPART_CHUNKSIZE_MB,
+    MINIO_TRANSFER_MAX_CONCURRENCY,
 )
 from synqtab.utils import get_logger
 
@@ -19,7 +27,7 @@ from synqtab.utils import get_logger
 LOG = get_logger(__file__)
 
 
-class SingletonMinioClient(type):
+class SingletonMinioClient(ABCMeta): # the metaclass of StorageBackend
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
@@ -28,16 +36,63 @@ class SingletonMinioClient(type):
         return cls._instances[cls]
 
 
+class _LazyS3Client:
+    """Creates the S3 client on first access instead of at import time, once per process: a forked worker
+    gets its own client (and connection pool) instead of sharing the sockets of its parent. Creation is
+    guarded by a lock, because boto3 client creation itself is not thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._pid = None
+        if hasattr(os, 'register_at_fork'):
+            # a lock held by another thread at fork time would never be released in the child
+            os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner):
+        if self._pid == os.getpid():
+            return self._client
+
+        with self._lock:
+            if self._pid != os.getpid():
+                self._client = self._create_client()
+                self._pid = os.getpid()
+        return self._client
+
+    @staticmethod
+    def _create_client():
+        from botocore.config import Config
+
+        return boto3.session.Session().client(
+            "s3",
+            endpoint_url=f"http://{MINIO_HOST}:{MINIO_API_MAPPED_PORT}",
+            aws_access_key_id=MINIO_ROOT_USER,
+            aws_secret_access_key=MINIO_ROOT_PASSWORD,
+            config=Config(
+                max_pool_connections=MINIO_MAX_POOL_CONNECTIONS,
+                retries={'max_attempts': MINIO_MAX_RETRY_ATTEMPTS, 'mode': 'adaptive'},
+                connect_timeout=MINIO_CONNECT_TIMEOUT,
+                read_timeout=MINIO_READ_TIMEOUT,
+                tcp_keepalive=True,
+            ),
+        )
+
+
 class _MinioClient:
-    _client = boto3.client(
-        "s3",
-        endpoint_url=f"http://{MINIO_HOST}:{MINIO_API_MAPPED_PORT}",
-        aws_access_key_id=MINIO_ROOT_USER,
-        aws_secret_access_key=MINIO_ROOT_PASSWORD,
+    _client = _LazyS3Client()
+    _transfer_config = TransferConfig(
+        multipart_threshold=MINIO_MULTIPART_THRESHOLD_MB * 1024 ** 2,
+        multipart_chunksize=MINIO_MULTIPART_CHUNKSIZE_MB * 1024 ** 2,
+        max_concurrency=MINIO_TRANSFER_MAX_CONCURRENCY,
     )
-    
+    # buckets known to exist; each bucket is checked (or created) once per process
+    _existing_buckets: set[str] = set()
+
 
-class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
+class MinioClient(_MinioClient, StorageBackend, metaclass=SingletonMinioClient):
     
     @classmethod
     def get_existing_buckets(cls) -> list[str]:
@@ -53,6 +108,8 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
     @classmethod
     def ensure_bucket_exists(cls, bucket_name: str | MinioBucket) -> None:
         bucket_name = str(bucket_name)
+        if bucket_name in cls._existing_buckets:
+            return
         try:
             cls._client.head_bucket(Bucket=bucket_name)
             LOG.info(f"Bucket '{bucket_name}' exists and is accessible.")
@@ -64,51 +121,31 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             except ClientError as e:
                 LOG.error(f"Failed to create bucket '{bucket_name}'. {e}")
                 raise
+        cls._existing_buckets.add(bucket_name)
     
+    # the maximum number of keys of a single delete_objects request
+    _DELETE_BATCH_SIZE: int = 1000
+
     @classmethod
-    def list_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> list[dict[str, Any]]:
+    def iter_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> Iterator[dict[str, Any]]:
+        """Yields every object of the bucket under the prefix, following the continuation tokens of
+        `list_objects_v2`, i.e., without the 1000-key cap of a single listing call."""
         bucket_name = str(bucket_name)
         try:
-            response = cls._client.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-            contents = response.get("Contents", [])
-            LOG.info(f"Found {len(contents)} objects in '{bucket_name}' with prefix '{prefix}'.")
-            return contents
+            paginator = cls._client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                yield from page.get("Contents", [])
         except ClientError as e:
             LOG.error(f"Failed to list objects in bucket '{bucket_name}'. {e}")
             raise
-        
+
     @classmethod
-    def list_files_in_bucket_by_file_extension(
-        cls,
-        file_extension: str,
-        bucket_name: str | MinioBucket,
-        prefix: str="",
-        include_extension: bool=False,
-        txt_output_file: Optional[str]=None,
-    ):
+    def list_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> list[dict[str, Any]]:
         bucket_name = str(bucket_name)
-        objects = cls.list_bucket_objects(bucket_name=bucket_name, prefix=prefix)
-        relevant_files = [
-            os.path.splitext(os.path.basename(obj['Key']))[0]
-            for obj in objects
-            if obj['Key'].endswith(file_extension)
-        ]
-        LOG.info(f"Found {len(relevant_files)} files with {file_extension} \
-            extension in bucket '{bucket_name}' and prefix {prefix}.")
+        contents = list(cls.iter_bucket_objects(bucket_name=bucket_name, prefix=prefix))
+        LOG.info(f"Found {len(contents)} objects in '{bucket_name}' with prefix '{prefix}'.")
+        return contents
         
-        if not include_extension:
-            relevant_files = [file_name.split('.')[0] for file_name in relevant_files]
-            
-        if not txt_output_file:
-            return relevant_files
-        
-        with open(txt_output_file, 'w') as f:
-            for file_name in relevant_files:
-                f.write(f"{file_name}\n")
-
-        LOG.info(f"Written {len(relevant_files)} file names to '{txt_output_file}'.")
-        return relevant_files
-    
     @classmethod
     def delete_file_from_bucket(cls, bucket_name: str | MinioBucket, object_key: str) -> None:
         bucket_name = str(bucket_name)
@@ -134,7 +171,7 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
                 "Bucket": str(source_bucket_name),
                 "Key": str(source_prefix)
             }
-            cls._client.copy(copy_source, destination_bucket_name, destination_prefix)
+            cls._client.copy(copy_source, destination_bucket_name, destination_prefix, Config=cls._transfer_config)
             LOG.info(
                 f"Successfully copied '{source_bucket_name + '/' + source_prefix}'to '{destination_bucket_name + '/' + destination_prefix}'"
             )
@@ -167,24 +204,31 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             raise
         
     @classmethod
-    def move_whole_bucket(
-        cls, source_bucket: str | MinioBucket, destination_bucket: str | MinioBucket
-    ) -> None:
-        source_bucket = str(source_bucket)
-        destination_bucket = str(destination_bucket)
-        while True:
-            files = cls.list_bucket_objects(bucket_name=source_bucket)
-            if len(files) == 0:
-                break
-            
-            for file in files:
-                file_name = file["Key"]
-                cls.move_file(
-                    source_bucket_name=source_bucket,
-                    source_prefix=file_name,
-                    destination_bucket_name=destination_bucket,
-                    destination_prefix=file_name
+    def delete_files_from_bucket(cls, bucket_name: str | MinioBucket, object_keys: Iterable[str]) -> None:
+        """Deletes the objects with batched `delete_objects` requests of up to 1000 keys each.
+
+        Raises:
+            RuntimeError: if some objects could not be deleted.
+        """
+        bucket_name = str(bucket_name)
+        object_keys = list(object_keys)
+        failed_keys = []
+        for start in range(0, len(object_keys), cls._DELETE_BATCH_SIZE):
+            batch = object_keys[start:start + cls._DELETE_BATCH_SIZE]
+            try:
+                response = cls._client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={'Objects': [{'Key': object_key} for object_key in batch], 'Quiet': True},
                 )
+            except (ClientError, NoCredentialsError) as e:
+                LOG.error(f"Failed to delete {len(batch)} files from bucket '{bucket_name}'. Error {e}.")
+                raise
+            failed_keys.extend(error['Key'] for error in response.get('Errors', []))
+
+        if failed_keys:
+            LOG.error(f"Failed to delete {len(failed_keys)} files from bucket '{bucket_name}', e.g., '{failed_keys[0]}'.")
+            raise RuntimeError(f"Failed to delete {len(failed_keys)} files from bucket '{bucket_name}'.")
+        LOG.info(f"Successfully deleted {len(object_keys)} files from bucket '{bucket_name}'.")
 
     @classmethod
     def upload_file_to_bucket(
@@ -199,7 +243,7 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
         LOG.info(f"Attempting to upload file: {local_file_path} to bucket: '{bucket_name}'")
         try:
             cls.ensure_bucket_exists(bucket_name=bucket_name)
-            cls._client.upload_file(local_file_path, bucket_name, object_name)
+            cls._client.upload_file(local_file_path, bucket_name, object_name, Config=cls._transfer_config)
             LOG.info(f"Uploaded '{local_file_path}' to '{bucket_name}/{object_name}'.")
         except FileNotFoundError:
             LOG.error(f"The file '{local_file_path}' was not found.")
@@ -215,26 +259,119 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
         bucket_name = str(bucket_name)
         try:
             os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-            cls._client.download_file(bucket_name, object_name, local_file_path)
+            cls._client.download_file(bucket_name, object_name, local_file_path, Config=cls._transfer_config)
             LOG.info(f"Downloaded '{bucket_name}/{object_name}' to '{local_file_path}'.")
         except (ClientError, NoCredentialsError):
             LOG.error(f"Failed to download object '{object_name}' from bucket '{bucket_name}'.")
             raise
         
+    @classmethod
+    def read_parquet_shape(cls, bucket_name: str | MinioBucket, object_name: str) -> tuple[int, int]:
+        """Returns the (rows, columns) of a Parquet object with two ranged reads: the footer length, then
+        the footer. The data pages are not transferred."""
+        import struct
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        bucket_name = str(bucket_name)
+        try:
+            tail = cls._client.get_object(Bucket=bucket_name, Key=object_name, Range='bytes=-8')['Body'].read()
+            footer_length = struct.unpack('<I', tail[:4])[0]
+            footer = cls._client.get_object(
+                Bucket=bucket_name, Key=object_name, Range=f"bytes=-{footer_length + 8}"
+            )['Body'].read()
+            metadata = pq.read_metadata(pa.BufferReader(footer))
+            return metadata.num_rows, metadata.num_columns
+        except ClientError as e:
+            LOG.error(f"Failed to read the Parquet footer of '{bucket_name}/{object_name}'. Error: {e}")
+            raise
+
     @classmethod
     def read_parquet_from_bucket(
-        cls, bucket_name: str | MinioBucket, object_name: str, **pandas_kwargs
+        cls,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        columns: Optional[list[str]] = None,
+        categorical_columns: Optional[list[str]] = None,
+        **pandas_kwargs,
     ) -> pd.DataFrame:
+        """Reads a Parquet object with pyarrow and converts it to pandas exactly once.
+
+        Args:
+            bucket_name (str | MinioBucket): the bucket of the object.
+            object_name (str): the key of the object.
+            columns (list[str], optional): the columns to decode; the rest are skipped. Defaults to None (all).
+            categorical_columns (list[str], optional): the columns to return as `category`. They are
+            dictionary-encoded in Arrow, so no `astype('category')` pass is needed afterwards. Columns
+            that do not exist in the object are ignored. Defaults to None.
+            pandas_kwargs: passed to `pyarrow.Table.to_pandas()`.
+
+        Returns:
+            pd.DataFrame: the dataframe.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from synqtab.utils.arrow_utils import arrow_table_to_pandas
+
         bucket_name = str(bucket_name)
         try:
             response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
-            df = pd.read_parquet(io.BytesIO(response['Body'].read()), **pandas_kwargs)
-            LOG.info(f"Loaded Parquet from '{bucket_name}/{object_name}' into DataFrame with shape {df.shape}.")
-            return df
+            # wrap the downloaded bytes without copying them into another buffer
+            table = pq.read_table(pa.BufferReader(response['Body'].read()), columns=columns)
         except (ClientError, NoCredentialsError):
             LOG.error(f"Failed to read Parquet from bucket '{bucket_name}'.")
             raise
 
+        df = arrow_table_to_pandas(table, categorical_columns=categorical_columns, **pandas_kwargs)
+        LOG.info(f"Loaded Parquet from '{bucket_name}/{object_name}' into DataFrame with shape {df.shape}.")
+        return df
+
+    @classmethod
+    def object_exists(cls, bucket_name: str | MinioBucket, object_name: str) -> bool:
+        bucket_name = str(bucket_name)
+        try:
+            cls._client.head_object(Bucket=bucket_name, Key=object_name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in {'404', 'NoSuchKey', 'NoSuchBucket', 'NotFound'}:
+                return False
+            LOG.error(f"Failed to check existence of '{bucket_name}/{object_name}'. {e}")
+            raise
+
+    @classmethod
+    def read_bytes_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str) -> bytes:
+        bucket_name = str(bucket_name)
+        try:
+            response = cls._client.get_object(Bucket=bucket_name, Key=object_name)
+            content = response['Body'].read()
+            LOG.info(f"Loaded {len(content)} bytes from '{bucket_name}/{object_name}'.")
+            return content
+        except (ClientError, NoCredentialsError):
+            LOG.error(f"Failed to read bytes from bucket '{bucket_name}'.")
+            raise
+
+    @classmethod
+    def upload_bytes_to_bucket(
+        cls,
+        data: bytes,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        content_type: str = 'application/octet-stream',
+    ) -> None:
+        bucket_name = str(bucket_name)
+        cls.ensure_bucket_exists(bucket_name=bucket_name)
+        try:
+            cls._client.put_object(
+                Bucket=bucket_name,
+                Key=object_name,
+                Body=data,
+                ContentType=content_type,
+            )
+            LOG.info(f"Uploaded {len(data)} bytes to '{bucket_name}/{object_name}'.")
+        except ClientError:
+            LOG.error(f"Failed to upload bytes to '{bucket_name}/{object_name}'.")
+            raise
+
     @classmethod
     def read_yaml_from_bucket(
         cls, bucket_name: str | MinioBucket, object_name: str, **yaml_kwargs
@@ -250,6 +387,15 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
             LOG.error(f"Failed to read YAML from bucket '{bucket_name}'.")
             raise
 
+    @classmethod
+    def upload_yaml_to_bucket(cls, data: dict[str, Any], bucket_name: str | MinioBucket, object_name: str) -> None:
+        cls.upload_bytes_to_bucket(
+            data=yaml.safe_dump(data).encode('utf-8'),
+            bucket_name=bucket_name,
+            object_name=object_name,
+            content_type='application/yaml',
+        )
+
     @classmethod
     def read_json_from_bucket(cls, bucket_name: str | MinioBucket, prefix: str) -> dict[Any]:
         try:
@@ -291,21 +437,41 @@ class MinioClient(_MinioClient, metaclass=SingletonMinioClient):
         df: pd.DataFrame,
         bucket_name: str | MinioBucket,
         object_name: str,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
     ) -> None:
-        temp_file_path = None
+        """Writes the dataframe as Parquet into memory and uploads it without a temporary file. Large objects
+        are uploaded in parts by boto3.
+
+        Args:
+            df (pd.DataFrame): the dataframe to upload. Its index is not written.
+            bucket_name (str | MinioBucket): the bucket to upload to.
+            object_name (str): the key of the object.
+            compression (str, optional): the Parquet compression codec, e.g., 'zstd' or 'snappy'.
+            Defaults to None, i.e., the PARQUET_COMPRESSION environment variable.
+            row_group_size (int, optional): the maximum number of rows per row group. Defaults to None,
+            i.e., the PARQUET_ROW_GROUP_SIZE environment variable.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from synqtab.environment import PARQUET_COMPRESSION, PARQUET_ROW_GROUP_SIZE
+
         bucket_name = str(bucket_name)
+        cls.ensure_bucket_exists(bucket_name=bucket_name)
+
+        sink = pa.BufferOutputStream()
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False),
+            sink,
+            compression=compression or PARQUET_COMPRESSION,
+            row_group_size=row_group_size or PARQUET_ROW_GROUP_SIZE,
+        )
+        buffer = sink.getvalue()
+
         try:
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                df.to_parquet(tmp.name, index=False)
-                temp_file_path = tmp.name
-                MinioClient.upload_file_to_bucket(
-                    local_file_path=temp_file_path,
-                    bucket_name=bucket_name,
-                    object_name=object_name,
-                )
-        finally:
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-    
-        
+            cls._client.upload_fileobj(
+                pa.BufferReader(buffer), bucket_name, object_name, Config=cls._transfer_config)
+            LOG.info(f"Uploaded Parquet of shape {df.shape} ({buffer.size} bytes) to '{bucket_name}/{object_name}'.")
+        except (ClientError, NoCredentialsError):
+            LOG.error(f"Failed to upload Parquet to '{bucket_name}/{object_name}'.")
+            raise
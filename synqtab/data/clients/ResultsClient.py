@@ -0,0 +1,73 @@
+import threading
+from typing import Optional
+
+from synqtab.data.clients.ResultsStore import ResultsStore
+
+
+_RESULTS_BACKEND_NAMES = ('postgres', 'sqlite', 'duckdb')
+
+
+class _ResultsClientMeta(type):
+    """Forwards every attribute lookup that `ResultsClient` itself does not define to the selected store."""
+
+    def __getattr__(cls, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(cls.get_backend(), name)
+
+
+class ResultsClient(metaclass=_ResultsClientMeta):
+    """The results store of the pipeline. Resolves to the store that the RESULTS_BACKEND environment variable
+    selects ('postgres', the default, 'sqlite' or 'duckdb') and forwards every `ResultsStore` operation to it,
+    e.g., `ResultsClient.write_evaluation_results(...)`.
+    """
+    _backend: Optional[type[ResultsStore]] = None
+    _backend_lock = threading.Lock()
+
+    @staticmethod
+    def _check_backend(backend: Optional[type]) -> Optional[type]:
+        """Instantiates a `ResultsStore` subclass once, so that a store that misses an abstract operation raises
+        a TypeError when it is selected instead of when the operation is first called."""
+        if isinstance(backend, type) and issubclass(backend, ResultsStore):
+            backend()
+        return backend
+
+    @classmethod
+    def resolve_backend(cls, backend_name: str) -> type[ResultsStore]:
+        if backend_name == 'postgres':
+            from synqtab.data.clients.PostgresClient import PostgresClient
+            return cls._check_backend(PostgresClient)
+        if backend_name == 'sqlite':
+            from synqtab.data.clients.SQLiteClient import SQLiteClient
+            return cls._check_backend(SQLiteClient)
+        if backend_name == 'duckdb':
+            from synqtab.data.clients.DuckDBClient import DuckDBClient
+            return cls._check_backend(DuckDBClient)
+        raise ValueError(f"Unknown results backend '{backend_name}'. Expected one of {_RESULTS_BACKEND_NAMES}.")
+
+    @classmethod
+    def get_backend(cls) -> type[ResultsStore]:
+        if cls._backend is None:
+            from synqtab.environment.results import RESULTS_BACKEND
+
+            with cls._backend_lock:
+                if cls._backend is None:
+                    cls._backend = cls.resolve_backend(RESULTS_BACKEND)
+        return cls._backend
+
+    @classmethod
+    def use_backend(cls, backend: Optional[str | type]) -> Optional[type]:
+        """Selects the store for the rest of the process, overriding RESULTS_BACKEND.
+
+        Args:
+            backend (Optional[str | type]): 'postgres', 'sqlite', 'duckdb', or a class with the `ResultsStore`
+            classmethods. None goes back to the store of RESULTS_BACKEND.
+
+        Returns:
+            Optional[type]: the previously selected store (None if none was resolved yet), so that
+            callers can restore it.
+        """
+        backend = cls.resolve_backend(backend.lower()) if isinstance(backend, str) else cls._check_backend(backend)
+        with cls._backend_lock:
+            previous_backend, cls._backend = cls._backend, backend
+        return previous_backend
@@ -0,0 +1,748 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class _LazyEngine:
+    """Creates the SQLAlchemy engine of a results store on first access instead of at import time, once per
+    store class and process: a forked worker gets its own engine (and connection pool) instead of sharing the
+    connections of its parent. The engine is built by the `_create_engine()` classmethod of the store."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines = dict()
+        if hasattr(os, 'register_at_fork'):
+            # a lock held by another thread at fork time would never be released in the child
+            os.register_at_fork(after_in_child=self._reset_lock)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner):
+        pid, engine = self._engines.get(owner, (None, None))
+        if pid == os.getpid():
+            return engine
+
+        with self._lock:
+            pid, engine = self._engines.get(owner, (None, None))
+            if pid != os.getpid():
+                engine = owner._create_engine()
+                self._engines[owner] = (os.getpid(), engine)
+        return engine
+
+    def reset(self, owner) -> None:
+        with self._lock:
+            pid, engine = self._engines.pop(owner, (None, None))
+        if engine is not None and pid == os.getpid():
+            engine.dispose()
+
+
+_ENGINES = _LazyEngine()
+
+
+class ResultsStore(ABC):
+    """The interface of the databases of the experiment results, e.g., `PostgresClient`, `SQLiteClient` and
+    `DuckDBClient`. Every store has the tables of `postgres/init.sql`, and the queries below are written in the
+    SQL that all of them understand, so a store only has to provide its engine. Use `ResultsClient` to reach
+    the configured store.
+    """
+    _engine = _ENGINES
+
+    # the tables of the schema and their primary keys; None for the tables that are keyed by a serial id
+    TABLE_KEYS: dict[str, Optional[tuple[str, ...]]] = {
+        'experiments': ('experiment_id',),
+        'evaluations': ('evaluation_id', 'experiment_id'),
+        'errors': None,
+        'skipped_computations': None,
+        'script_runs': None,
+    }
+
+    # the typed columns of the tables, which are derived from their ID columns when a row is written
+    TABLE_KEY_COLUMNS: dict[str, tuple[str, ...]] = {
+        'experiments': ('experiment_key', 'seed', 'error_rate_pct'),
+        'evaluations': ('evaluation_key', 'experiment_key'),
+        'errors': ('experiment_key',),
+        'skipped_computations': ('computation_key',),
+    }
+
+    @classmethod
+    @abstractmethod
+    def _create_engine(cls):
+        raise NotImplementedError
+
+    @classmethod
+    def reset_engine(cls) -> None:
+        """Closes the connections of the store; the next query creates a new engine."""
+        _ENGINES.reset(cls)
+
+    @staticmethod
+    def _to_int(value: Any) -> Optional[int]:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _add_key_columns(cls, row: dict[str, Any]) -> dict[str, Any]:
+        """Fills in the typed columns that are missing from the row: the stable 64-bit hash of each ID (e.g., the
+        `experiment_key` of the `experiment_id`; see `ExperimentKey`), and the integer seed and error rate of an
+        experiment. So rows that are synced from stores without these columns get them as well."""
+        from synqtab.utils.general_utils import stable_hash64
+
+        row = dict(row)
+        for id_column_name in ('experiment_id', 'evaluation_id', 'computation_id'):
+            key_column_name = id_column_name.removesuffix('_id') + '_key'
+            if row.get(id_column_name) is not None and row.get(key_column_name) is None:
+                row[key_column_name] = stable_hash64(row[id_column_name])
+        if 'random_seed' in row and row.get('seed') is None:
+            row['seed'] = cls._to_int(row['random_seed'])
+        if 'error_rate' in row and row.get('error_rate_pct') is None:
+            row['error_rate_pct'] = cls._to_int(row['error_rate'])
+        return row
+
+    @classmethod
+    def _prepare_row(cls, row: dict[str, Any]) -> dict[str, Any]:
+        """Fills in the values that every written row carries."""
+        from synqtab.environment import EXECUTION_PROFILE
+
+        row = cls._add_key_columns(row)
+        return {**row, 'execution_profile': row.get('execution_profile', EXECUTION_PROFILE)}
+
+    @classmethod
+    def backfill_key_columns(
+        cls,
+        table_names: Optional[list[str]] = None,
+        batch_size: int = 1000,
+        connection=None,
+    ) -> dict[str, int]:
+        """Fills in the typed columns of the rows that were written before the columns existed, in batches.
+
+        Args:
+            table_names (list[str], optional): the tables to backfill. Defaults to all tables with typed columns.
+            batch_size (int, optional): rows per batch. Defaults to 1000.
+            connection (optional): the connection to use, in one transaction; defaults to one transaction per batch.
+
+        Returns:
+            dict[str, int]: the number of rows that were updated, per table.
+        """
+        from sqlalchemy import text
+
+        updated_rows = dict()
+        for table_name in table_names or list(cls.TABLE_KEY_COLUMNS):
+            key_column_names = cls.TABLE_KEY_COLUMNS[table_name]
+            primary_key = cls.TABLE_KEYS[table_name] or ('id',)
+            select_query = text(f"""SELECT * FROM {table_name} WHERE {key_column_names[0]} IS NULL LIMIT :batch_size""")
+            update_query = text(
+                f"""UPDATE {table_name} SET {', '.join(f'{name} = :{name}' for name in key_column_names)} """ +
+                f"""WHERE {' AND '.join(f'{name} = :{name}' for name in primary_key)}"""
+            )
+
+            def backfill_batch(connection) -> int:
+                rows = [dict(row) for row in connection.execute(select_query, {'batch_size': batch_size}).mappings()]
+                if rows:
+                    connection.execute(update_query, [
+                        {name: row[name] for name in key_column_names + primary_key}
+                        for row in map(cls._add_key_columns, rows)
+                    ])
+                return len(rows)
+
+            updated_rows[table_name] = 0
+            while True:
+                if connection is not None:
+                    nof_rows = backfill_batch(connection)
+                else:
+                    with cls._engine.begin() as batch_connection:
+                        nof_rows = backfill_batch(batch_connection)
+                updated_rows[table_name] += nof_rows
+                if nof_rows < batch_size:
+                    break
+            LOG.info(f"Backfilled the typed columns of {updated_rows[table_name]} rows of '{table_name}'.")
+        return updated_rows
+
+    @classmethod
+    def move_perfect_baselines(cls, evaluations_table_name: str = 'evaluations') -> dict[str, int]:
+        """Moves the perfect baselines (the R-S evaluations) that were written under the non-perfect experiments
+        of the first error rate, before the baselines belonged to the perfect experiment, to the perfect experiment
+        of the same (dataset, seed, generator), where the existence checks look for them. A baseline that the
+        perfect experiment already has is deleted instead.
+
+        Returns:
+            dict[str, int]: the number of 'moved' and 'deleted' rows.
+        """
+        from dataclasses import replace
+        from sqlalchemy import text
+        from synqtab.enums import DataPerfectness
+        from synqtab.experiments.ExperimentKey import ExperimentKey
+
+        select_query = text(f"""
+            SELECT evaluation_id, experiment_id FROM {evaluations_table_name} \
+            WHERE first_target IN ('R', 'S') AND (second_target IS NULL OR second_target IN ('R', 'S'))
+        """)
+        exists_query = text(
+            f"""SELECT 1 FROM {evaluations_table_name} WHERE evaluation_id = :evaluation_id AND experiment_id = :perfect_experiment_id"""
+        )
+        update_query = text(
+            f"""UPDATE {evaluations_table_name} SET experiment_id = :perfect_experiment_id, experiment_key = :perfect_experiment_key """ +
+            f"""WHERE evaluation_id = :evaluation_id AND experiment_id = :experiment_id"""
+        )
+        delete_query = text(
+            f"""DELETE FROM {evaluations_table_name} WHERE evaluation_id = :evaluation_id AND experiment_id = :experiment_id"""
+        )
+
+        moved_rows = {'moved': 0, 'deleted': 0}
+        with cls._engine.begin() as connection:
+            for row in connection.execute(select_query).mappings().all():
+                experiment_key = ExperimentKey.from_str(row['experiment_id'])
+                if experiment_key.data_perfectness == str(DataPerfectness.PERFECT):
+                    continue
+                perfect_experiment_key = replace(
+                    experiment_key, data_perfectness=str(DataPerfectness.PERFECT), data_error=None, error_rate_pct=None)
+                query_params = {
+                    'evaluation_id': row['evaluation_id'],
+                    'experiment_id': row['experiment_id'],
+                    'perfect_experiment_id': str(perfect_experiment_key),
+                    'perfect_experiment_key': perfect_experiment_key.hash64,
+                }
+                # e.g., the baseline was written under the first error rate of several data errors
+                if connection.execute(exists_query, query_params).first() is not None:
+                    connection.execute(delete_query, query_params)
+                    moved_rows['deleted'] += 1
+                else:
+                    connection.execute(update_query, query_params)
+                    moved_rows['moved'] += 1
+        LOG.info(f"Moved {moved_rows['moved']} perfect baselines of '{evaluations_table_name}' and deleted {moved_rows['deleted']} duplicates.")
+        return moved_rows
+
+    @classmethod
+    def insert_rows(
+        cls,
+        table_name: str,
+        rows: list[dict[str, Any]],
+        ignore_conflicts: bool = False,
+        connection=None,
+    ) -> None:
+        """Inserts the rows in one transaction (or in the given connection's). Rows are grouped by their fields,
+        so that rows that rely on different column defaults can be written together."""
+        from sqlalchemy import text
+
+        rows_per_field_names = dict()
+        for row in rows:
+            row = cls._prepare_row(row)
+            rows_per_field_names.setdefault(tuple(row.keys()), []).append(row)
+
+        def insert(connection):
+            for field_names, field_rows in rows_per_field_names.items():
+                query = text(
+                    f"""INSERT INTO {table_name} ({', '.join(field_names)}) """ +
+                    f"""VALUES ({', '.join(':' + field_name for field_name in field_names)})""" +
+                    (""" ON CONFLICT DO NOTHING""" if ignore_conflicts else "")
+                )
+                connection.execute(query, field_rows)
+
+        if connection is not None:
+            insert(connection)
+            return
+        with cls._engine.begin() as connection:
+            insert(connection)
+
+    @classmethod
+    def execute_insert_query(
+        cls,
+        table_name: str,
+        query_params: dict[str, Any],
+    ):
+        cls.insert_rows(table_name, [query_params])
+
+    @classmethod
+    def iter_table_rows(cls, table_name: str, batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
+        """Yields the rows of a table in batches, e.g., to sync them to another store."""
+        from sqlalchemy import text
+
+        with cls._engine.connect() as connection:
+            result = connection.execute(text(f"""SELECT * FROM {table_name}""")).mappings()
+            while rows := result.fetchmany(batch_size):
+                yield [dict(row) for row in rows]
+
+    @classmethod
+    def read_first_rows(cls, table_name: str, batch_size: int = 1000, connection=None) -> list[dict[str, Any]]:
+        """Reads the rows with the lowest serial ids of a table, e.g., to move them to another store batch by batch."""
+        from sqlalchemy import text
+
+        query = text(f"""SELECT * FROM {table_name} ORDER BY id LIMIT :batch_size""")
+        if connection is not None:
+            return [dict(row) for row in connection.execute(query, {'batch_size': batch_size}).mappings()]
+        with cls._engine.connect() as connection:
+            return [dict(row) for row in connection.execute(query, {'batch_size': batch_size}).mappings()]
+
+    @classmethod
+    def delete_rows_by_id(cls, table_name: str, ids: list[int], connection=None) -> None:
+        from sqlalchemy import bindparam, text
+
+        if not ids:
+            return
+        query = text(f"""DELETE FROM {table_name} WHERE id IN :ids""").bindparams(bindparam('ids', expanding=True))
+        if connection is not None:
+            connection.execute(query, {'ids': ids})
+            return
+        with cls._engine.begin() as connection:
+            connection.execute(query, {'ids': ids})
+
+    @classmethod
+    def write_runtime_errors(cls, runtime_errors: list[dict[str, Any]], errors_table_name: str = 'errors') -> None:
+        """Writes many runtime errors in one transaction. Each runtime error has the keys `experiment_id`,
+        `file_path`, `error_message` and, optionally, `created_at`. Used by the asynchronous error log handler,
+        so failures are raised to the caller and not logged as errors again."""
+        if not runtime_errors:
+            return
+        cls.insert_rows(errors_table_name, runtime_errors)
+
+    @classmethod
+    def write_skipped_computation(
+        cls,
+        computation_id: str,
+        reason: str,
+        skipped_computations_table_name: str='skipped_computations',
+    ) -> None:
+        try:
+            query_params = {
+                "computation_id": computation_id,
+                "reason": reason,
+            }
+            cls.execute_insert_query(table_name=skipped_computations_table_name, query_params=query_params)
+            LOG.info(f"Wrote skipped computation {computation_id} in '{skipped_computations_table_name}'")
+        except Exception as e:
+            LOG.error(f"Failed to write skipped computation {computation_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def write_runtime_error(
+        cls,
+        experiment_id: str,
+        file_path: str,
+        error_message: str,
+        errors_table_name: str = 'errors'
+    ):
+        try:
+            query_params = {
+                "experiment_id": experiment_id,
+                "file_path": file_path,
+                "error_message": error_message
+            }
+            cls.execute_insert_query(table_name=errors_table_name, query_params=query_params)
+            LOG.info(f"Wrote runtime error for experiment {experiment_id} in '{errors_table_name}'")
+        except Exception as e:
+            LOG.error(f"Failed to write runtime error for experiment {experiment_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def write_experiment(
+        cls,
+        experiment_id: str,
+        experiment_type: str,
+        dataset_name: str,
+        random_seed: str,
+        data_perfectness: str,
+        data_error: Optional[str],
+        error_rate: Optional[str],
+        generator: str,
+        training_size: int,
+        synthetic_size: int,
+        execution_time: float,
+        corrupted_rows: list = [],
+        corrupted_cols: list = [],
+        experiment_results_table_name: str = 'experiments',
+    ):
+        try:
+            query_params = {
+                'experiment_id': experiment_id,
+                'experiment_type': experiment_type,
+                'dataset_name': dataset_name,
+                'random_seed': random_seed,
+                'data_perfectness': data_perfectness,
+                'data_error': data_error,
+                'error_rate': error_rate,
+                'generator': generator,
+                'training_size': training_size,
+                'synthetic_size': synthetic_size,
+                'execution_time': execution_time,
+                'corrupted_rows': corrupted_rows,
+                'corrupted_cols': corrupted_cols,
+            }
+            cls.execute_insert_query(table_name=experiment_results_table_name, query_params=query_params)
+            LOG.info(f"Wrote experiment {experiment_id} in '{experiment_results_table_name}'")
+        except Exception as e:
+            LOG.error(f"Failed to write experiment {experiment_id}. Error: {e}")
+            raise
+
+
+    @classmethod
+    def write_evaluation_result(
+        cls,
+        evaluation_id: str,
+        experiment_id: str,
+        first_target: str,
+        second_target: str,
+        result: int | float,
+        execution_time: float,
+        notes: Optional[dict[str, Any]] = None,
+        fidelity: float = 1.0,
+        evaluation_results_table_name: str = 'evaluations'
+    ):
+        try:
+            query_params = {
+                "evaluation_id": evaluation_id,
+                "experiment_id": experiment_id,
+                "first_target": first_target,
+                "second_target": second_target,
+                "result": result,
+                "execution_time": execution_time,
+                "notes": notes if notes else None,
+            }
+            # full evaluations rely on the column default, so they keep working on databases without the column
+            if fidelity < 1:
+                query_params["fidelity"] = fidelity
+            cls.execute_insert_query(table_name=evaluation_results_table_name, query_params=query_params)
+            LOG.info(f"Wrote evaluation result {evaluation_id} in '{evaluation_results_table_name}'")
+        except Exception as e:
+            LOG.exception(f"Failed to write evaluation result for experiment {evaluation_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def write_evaluation_results(
+        cls,
+        evaluation_results: list[dict[str, Any]],
+        evaluation_results_table_name: str = 'evaluations'
+    ):
+        """Writes many evaluation results in one transaction; either all of them are written or none.
+
+        Args:
+            evaluation_results (list[dict[str, Any]]): the keyword arguments of `write_evaluation_result()` of
+            each evaluation result.
+        """
+        if not evaluation_results:
+            return
+
+        rows = []
+        for evaluation_result in evaluation_results:
+            row = {
+                "evaluation_id": evaluation_result['evaluation_id'],
+                "experiment_id": evaluation_result['experiment_id'],
+                "first_target": evaluation_result['first_target'],
+                "second_target": evaluation_result.get('second_target'),
+                "result": evaluation_result['result'],
+                "execution_time": evaluation_result['execution_time'],
+                "notes": evaluation_result.get('notes') if evaluation_result.get('notes') else None,
+            }
+            # full-fidelity results do not write the fidelity column
+            if evaluation_result.get('fidelity', 1.0) < 1:
+                row["fidelity"] = evaluation_result['fidelity']
+            rows.append(row)
+
+        try:
+            cls.insert_rows(evaluation_results_table_name, rows)
+            LOG.info(f"Wrote {len(evaluation_results)} evaluation results in '{evaluation_results_table_name}'")
+        except Exception as e:
+            LOG.exception(f"Failed to write {len(evaluation_results)} evaluation results. Error: {e}")
+            raise
+
+    @classmethod
+    def write_script_run(
+        cls,
+        script_path: str,
+        profile_name: Optional[str],
+        kernel_slug: Optional[str],
+        status: str,
+        runtime_seconds: float,
+        script_runs_table_name: str = 'script_runs',
+    ) -> None:
+        """Records a finished run of a Kaggle script; see `read_script_runtime_estimates()`."""
+        query_params = {
+            "script_path": script_path,
+            "profile_name": profile_name,
+            "kernel_slug": kernel_slug,
+            "status": status,
+            "runtime_seconds": runtime_seconds,
+        }
+        cls.execute_insert_query(table_name=script_runs_table_name, query_params=query_params)
+        LOG.info(f"Wrote run of script {script_path} ({status}, {runtime_seconds:.0f}s) in '{script_runs_table_name}'")
+
+    @classmethod
+    def claim_computation(
+        cls,
+        computation_id: str,
+        worker_index: int,
+        computation_claims_table_name: str = 'computation_claims',
+    ) -> bool:
+        """Claims a computation for a worker of a sharded sweep, so that the other workers do not start it too.
+
+        Args:
+            computation_id (str): e.g., the experiment ID.
+            worker_index (int): the index of the claiming worker.
+
+        Returns:
+            bool: whether the computation is the worker's, i.e., it was not claimed yet, or the same worker claimed
+            it before (e.g., before it was restarted).
+        """
+        from sqlalchemy import text
+
+        query = text(f"""SELECT worker_index FROM {computation_claims_table_name} WHERE computation_id = :computation_id""")
+        with cls._engine.begin() as connection:
+            cls.insert_rows(
+                computation_claims_table_name,
+                [{'computation_id': computation_id, 'worker_index': worker_index}],
+                ignore_conflicts=True,
+                connection=connection,
+            )
+            claimed_by = connection.execute(query, {'computation_id': computation_id}).scalar()
+        return claimed_by == worker_index
+
+    @classmethod
+    def read_script_runtime_estimates(
+        cls,
+        script_paths: list[str],
+        script_runs_table_name: str = 'script_runs',
+    ) -> dict[str, float]:
+        """Reads the mean runtime in seconds of the complete runs of each script; scripts that never completed
+        are left out."""
+        from sqlalchemy import bindparam, text
+
+        if not script_paths:
+            return dict()
+        query = text(f"""
+            SELECT script_path, AVG(runtime_seconds) FROM {script_runs_table_name} \
+            WHERE status = 'complete' AND script_path IN :script_paths \
+            GROUP BY script_path
+        """).bindparams(bindparam('script_paths', expanding=True))
+        with cls._engine.connect() as connection:
+            rows = connection.execute(query, {"script_paths": list(script_paths)}).all()
+        return {script_path: float(runtime_seconds) for script_path, runtime_seconds in rows}
+
+    @classmethod
+    def read_experiment_execution_times(cls, experiments_table_name: str = 'experiments') -> list[dict[str, Any]]:
+        """Reads the `dataset_name`, `generator`, `training_size` and `execution_time` of every experiment,
+        e.g., to fit a runtime model of the generators."""
+        from sqlalchemy import text
+
+        query = text(f"""
+            SELECT dataset_name, generator, training_size, execution_time FROM {experiments_table_name}
+        """)
+        with cls._engine.connect() as connection:
+            return [dict(row) for row in connection.execute(query).mappings()]
+
+    @classmethod
+    def read_experiments(
+        cls,
+        dataset_name: Optional[str] = None,
+        random_seed: Optional[int] = None,
+        generator: Optional[str] = None,
+        data_error: Optional[str] = None,
+        error_rate: Optional[int] = None,
+        experiments_table_name: str = 'experiments',
+    ) -> list[dict[str, Any]]:
+        """Reads the experiments of a configuration, e.g., all the experiments of a dataset and seed. The filters
+        are the columns of the composite index of the experiments, in its order, so filtering by a prefix of them
+        (dataset, then seed, then generator, ...) is an index lookup.
+
+        Args:
+            dataset_name (str, optional): e.g., 'anneal'. Defaults to all datasets.
+            random_seed (int, optional): Defaults to all seeds.
+            generator (str, optional): e.g., 'tabpfn'. Defaults to all generators.
+            data_error (str, optional): e.g., 'OUT'. Defaults to all data errors, including none.
+            error_rate (int, optional): the data error rate multiplied by 100, e.g., 20. Defaults to all rates.
+
+        Returns:
+            list[dict[str, Any]]: the rows of the experiments.
+        """
+        from sqlalchemy import text
+
+        filters = {
+            'dataset_name': dataset_name,
+            'seed': random_seed,
+            'generator': generator,
+            'data_error': data_error,
+            'error_rate_pct': error_rate,
+        }
+        filters = {column_name: value for column_name, value in filters.items() if value is not None}
+        query = text(
+            f"""SELECT * FROM {experiments_table_name}""" +
+            (f""" WHERE {' AND '.join(f'{column_name} = :{column_name}' for column_name in filters)}""" if filters else "")
+        )
+        with cls._engine.connect() as connection:
+            return [dict(row) for row in connection.execute(query, filters).mappings()]
+
+    @classmethod
+    def read_evaluation_execution_times(
+        cls,
+        evaluations_table_name: str = 'evaluations',
+        experiments_table_name: str = 'experiments',
+    ) -> list[dict[str, Any]]:
+        """Reads the `evaluation_id`, `experiment_id`, `execution_time` and `fidelity` of every evaluation, with the
+        `dataset_name` and `training_size` of its experiment, e.g., to fit a runtime model of the evaluators."""
+        from sqlalchemy import text
+
+        query = text(f"""
+            SELECT ev.evaluation_id, ev.experiment_id, ev.execution_time, ev.fidelity, ex.dataset_name, ex.training_size \
+            FROM {evaluations_table_name} ev JOIN {experiments_table_name} ex \
+            ON ev.experiment_key = ex.experiment_key AND ev.experiment_id = ex.experiment_id
+        """)
+        with cls._engine.connect() as connection:
+            return [dict(row) for row in connection.execute(query).mappings()]
+
+    @classmethod
+    def evaluation_result_exists(
+        cls,
+        evaluation_id: str,
+        evaluation_results_table_name: str = 'evaluation_results'
+    ) -> bool:
+        """Checks if an evaluation result with the specific evaluation id exists.
+
+        Args:
+            experiment_id (str): The evaluation id to check for existence.
+
+        Returns:
+            bool: True if it exists, else False.
+        """
+        from sqlalchemy import text
+        try:
+            query = text(f"""
+                SELECT 1 FROM {evaluation_results_table_name} \
+                WHERE experiment_id = :experiment_id \
+                LIMIT 1
+            """)
+            with cls._engine.connect() as connection:
+                result = connection.execute(query, {"experiment_id": evaluation_id})
+                exists = result.scalar() is not None
+                LOG.info(f"Checked existence of evaluation {evaluation_id}: {exists}")
+                return exists
+        except Exception as e:
+            LOG.exception(
+                f"Failed to check existence of evaluation {evaluation_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def experiment_exists(
+        cls,
+        experiment_id: str,
+        experiments_table_name: str = 'experiments',
+        experiment_id_column_name: str = 'experiment_id',
+        experiment_key: Optional[int] = None,
+    ) -> bool:
+        """Checks if an experiment with the specific experiment id exists.
+
+        Args:
+            experiment_id (str): The experiment id to check for existence.
+            experiment_key (int, optional): the stable hash of the experiment id, i.e., `ExperimentKey.hash64`.
+            Defaults to the hash of `experiment_id`.
+
+        Returns:
+            bool: True if it exists, else False.
+        """
+        from sqlalchemy import text
+        from synqtab.utils.general_utils import stable_hash64
+        try:
+            # the rows are looked up by the indexed hash alone, and the IDs of the candidates rule out hash
+            # collisions; the rows written before the hash columns are only found once their hashes are backfilled
+            # (see `backfill_key_columns`)
+            key_column_name = experiment_id_column_name.removesuffix('_id') + '_key'
+            query = text(f"""
+                SELECT {experiment_id_column_name} FROM {experiments_table_name} \
+                WHERE {key_column_name} = :experiment_key
+            """)
+            if experiment_key is None:
+                experiment_key = stable_hash64(experiment_id)
+            with cls._engine.connect() as connection:
+                result = connection.execute(query, {"experiment_key": experiment_key})
+                exists = any(candidate_id == experiment_id for candidate_id in result.scalars())
+                LOG.info(f"Checked existence of experiment {experiment_id}: {exists}")
+                return exists
+        except Exception as e:
+            LOG.error(f"Failed to check existence of experiment {experiment_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def evaluation_exists(
+        cls,
+        evaluation_id: str,
+        experiment_id: str,
+        evaluations_table_name: str = 'evaluations',
+        evaluation_key: Optional[int] = None,
+        experiment_key: Optional[int] = None,
+    ) -> bool:
+        """Checks if an evaluation of an experiment exists.
+
+        Args:
+            evaluation_id (str): The evaluation id, e.g., 'IFO#R#NULL'.
+            experiment_id (str): The experiment id.
+            evaluation_key (int, optional): the stable hash of the evaluation id, i.e., `EvaluationKey.hash64`.
+            Defaults to the hash of `evaluation_id`.
+            experiment_key (int, optional): the stable hash of the experiment id, i.e., `ExperimentKey.hash64`.
+            Defaults to the hash of `experiment_id`.
+
+        Returns:
+            bool: True if it exists, else False.
+        """
+        from sqlalchemy import text
+        from synqtab.utils.general_utils import stable_hash64
+        try:
+            # the rows are looked up by the indexed hashes alone, and the IDs of the candidates rule out hash
+            # collisions; the rows written before the hash columns are only found once their hashes are backfilled
+            # (see `backfill_key_columns`)
+            query = text(f"""
+                SELECT evaluation_id, experiment_id FROM {evaluations_table_name} \
+                WHERE experiment_key = :experiment_key AND evaluation_key = :evaluation_key
+            """)
+            query_params = {
+                "evaluation_key": stable_hash64(evaluation_id) if evaluation_key is None else evaluation_key,
+                "experiment_key": stable_hash64(experiment_id) if experiment_key is None else experiment_key,
+            }
+            with cls._engine.connect() as connection:
+                result = connection.execute(query, query_params)
+                exists = any(tuple(row) == (evaluation_id, experiment_id) for row in result)
+                LOG.info(f"Checked existence of evaluation {evaluation_id} for experiment {experiment_id}: {exists}")
+                return exists
+        except Exception as e:
+            LOG.error(f"Failed to check existence of evaluation {evaluation_id} for experiment {experiment_id}. Error: {e}")
+            raise
+
+    @classmethod
+    def read_evaluation_result(
+        cls,
+        evaluation_id: str,
+        experiment_id: str,
+        evaluations_table_name: str = 'evaluations',
+    ) -> Optional[float]:
+        """Reads the result of an evaluation of an experiment.
+
+        Args:
+            evaluation_id (str): The evaluation id, e.g., 'IFO#R#NULL'.
+            experiment_id (str): The experiment id.
+
+        Returns:
+            Optional[float]: The result of the evaluation, or None if it does not exist.
+        """
+        from sqlalchemy import text
+        from synqtab.utils.general_utils import stable_hash64
+        try:
+            # looked up by the indexed hashes alone, like `evaluation_exists()`
+            query = text(f"""
+                SELECT evaluation_id, experiment_id, result FROM {evaluations_table_name} \
+                WHERE experiment_key = :experiment_key AND evaluation_key = :evaluation_key
+            """)
+            query_params = {
+                "evaluation_key": stable_hash64(evaluation_id),
+                "experiment_key": stable_hash64(experiment_id),
+            }
+            with cls._engine.connect() as connection:
+                for row in connection.execute(query, query_params).mappings():
+                    if (row['evaluation_id'], row['experiment_id']) == (evaluation_id, experiment_id):
+                        return float(row['result']) if row['result'] is not None else None
+                return None
+        except Exception as e:
+            LOG.error(f"Failed to read evaluation {evaluation_id} for experiment {experiment_id}. Error: {e}")
+            raise
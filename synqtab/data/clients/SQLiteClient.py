@@ -0,0 +1,43 @@
+import re
+from abc import ABCMeta
+
+from synqtab.data.clients.EmbeddedResultsStore import EmbeddedResultsStore
+
+
+class SingletonSQLiteClient(ABCMeta): # the metaclass of ResultsStore
+    _instances = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(SingletonSQLiteClient, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+
+class SQLiteClient(EmbeddedResultsStore, metaclass=SingletonSQLiteClient):
+    """Results store in a SQLite file. The file is opened in WAL mode, so that the worker processes of a sweep
+    can write to it concurrently (one writer at a time; the others wait up to `_busy_timeout_seconds`)."""
+    _default_file_name = 'results.sqlite'
+    _busy_timeout_seconds = 60
+
+    @classmethod
+    def _create_database_engine(cls, database_path: str):
+        from sqlalchemy import create_engine, event
+
+        engine = create_engine(
+            f"sqlite:///{database_path}", echo=False, connect_args={'timeout': cls._busy_timeout_seconds},
+        )
+
+        @event.listens_for(engine, 'connect')
+        def _configure_connection(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.close()
+
+        return engine
+
+    @classmethod
+    def _translate_create_table(cls, table_name: str, statement: str) -> list[str]:
+        statement = re.sub(r'\b(?:BIG)?SERIAL PRIMARY KEY\b', 'INTEGER PRIMARY KEY AUTOINCREMENT', statement, flags=re.IGNORECASE)
+        statement = re.sub(r'\bJSONB?\b', 'TEXT', statement, flags=re.IGNORECASE)
+        return [statement]
@@ -0,0 +1,256 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from synqtab.enums import MinioBucket
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class StorageBackend(ABC):
+    """The interface of the object storage backends, e.g., `MinioClient` and `LocalStorageClient`. Objects are
+    addressed by a bucket name and an object key, e.g., ('synthetic', '<experiment_id>.parquet'), on every backend.
+    Use `StorageClient` to reach the configured backend.
+
+    Backends implement the abstract primitive operations; the bulk operations below are built on them. A backend
+    that misses one cannot be selected: `StorageClient` instantiates the backend it resolves.
+    """
+
+    @classmethod
+    @abstractmethod
+    def ensure_bucket_exists(cls, bucket_name: str | MinioBucket) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def object_exists(cls, bucket_name: str | MinioBucket, object_name: str) -> bool:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def iter_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> Iterator[dict[str, Any]]:
+        """Yields a dictionary with (at least) the 'Key' and the 'Size' of every object under the prefix."""
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def list_bucket_objects(cls, bucket_name: str | MinioBucket, prefix: str = "") -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def read_bytes_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str) -> bytes:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def upload_bytes_to_bucket(
+        cls, data: bytes, bucket_name: str | MinioBucket, object_name: str, content_type: str = 'application/octet-stream',
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def read_parquet_shape(cls, bucket_name: str | MinioBucket, object_name: str) -> tuple[int, int]:
+        """Returns the (rows, columns) of a Parquet object from its footer. Backends that can read a byte range
+        override this, so that only the footer is transferred."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        metadata = pq.read_metadata(pa.BufferReader(cls.read_bytes_from_bucket(bucket_name, object_name)))
+        return metadata.num_rows, metadata.num_columns
+
+    @classmethod
+    @abstractmethod
+    def read_parquet_from_bucket(
+        cls,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        columns: Optional[list[str]] = None,
+        categorical_columns: Optional[list[str]] = None,
+        **pandas_kwargs,
+    ) -> pd.DataFrame:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def upload_dataframe_as_parquet_to_bucket(
+        cls,
+        df: pd.DataFrame,
+        bucket_name: str | MinioBucket,
+        object_name: str,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def read_json_from_bucket(cls, bucket_name: str | MinioBucket, prefix: str) -> dict[Any]:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def upload_json_to_bucket(
+        cls, data: dict[str, Any], bucket_name: str | MinioBucket, folder: Optional[str], file_name: str,
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def read_yaml_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str, **yaml_kwargs) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def upload_yaml_to_bucket(cls, data: dict[str, Any], bucket_name: str | MinioBucket, object_name: str) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def upload_file_to_bucket(cls, local_file_path: str, bucket_name: str | MinioBucket, object_name: Optional[str]) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def download_file_from_bucket(cls, bucket_name: str | MinioBucket, object_name: str, local_file_path: str) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def delete_file_from_bucket(cls, bucket_name: str | MinioBucket, object_key: str) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def delete_files_from_bucket(cls, bucket_name: str | MinioBucket, object_keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def copy_file(
+        cls,
+        source_bucket_name: str | MinioBucket, source_prefix: str,
+        destination_bucket_name: str | MinioBucket, destination_prefix: str
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    @abstractmethod
+    def move_file(
+        cls,
+        source_bucket_name: str | MinioBucket, source_prefix: str,
+        destination_bucket_name: str | MinioBucket, destination_prefix: str
+    ) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def list_files_in_bucket_by_file_extension(
+        cls,
+        file_extension: str,
+        bucket_name: str | MinioBucket,
+        prefix: str="",
+        include_extension: bool=False,
+        txt_output_file: Optional[str]=None,
+    ):
+        bucket_name = str(bucket_name)
+        objects = cls.list_bucket_objects(bucket_name=bucket_name, prefix=prefix)
+        relevant_files = [
+            os.path.splitext(os.path.basename(obj['Key']))[0]
+            for obj in objects
+            if obj['Key'].endswith(file_extension)
+        ]
+        LOG.info(f"Found {len(relevant_files)} files with {file_extension} \
+            extension in bucket '{bucket_name}' and prefix {prefix}.")
+        
+        if not include_extension:
+            relevant_files = [file_name.split('.')[0] for file_name in relevant_files]
+            
+        if not txt_output_file:
+            return relevant_files
+        
+        with open(txt_output_file, 'w') as f:
+            for file_name in relevant_files:
+                f.write(f"{file_name}\n")
+
+        LOG.info(f"Written {len(relevant_files)} file names to '{txt_output_file}'.")
+        return relevant_files
+    
+    @classmethod
+    def copy_files(
+        cls,
+        source_bucket_name: str | MinioBucket,
+        destination_bucket_name: str | MinioBucket,
+        object_keys: Iterable[str | tuple[str, str]],
+        max_workers: int = 16,
+    ) -> list[str]:
+        """Copies many objects concurrently on a thread pool; the backends' clients are thread-safe.
+
+        Args:
+            source_bucket_name (str | MinioBucket): the bucket to copy from.
+            destination_bucket_name (str | MinioBucket): the bucket to copy to.
+            object_keys (Iterable[str | tuple[str, str]]): the keys to copy, either as the same key in both
+            buckets or as (source key, destination key) pairs.
+            max_workers (int, optional): the number of threads. Defaults to 16.
+
+        Returns:
+            list[str]: the source keys that were copied.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        source_bucket_name = str(source_bucket_name)
+        destination_bucket_name = str(destination_bucket_name)
+        cls.ensure_bucket_exists(bucket_name=destination_bucket_name)
+
+        key_pairs = [
+            (object_key, object_key) if isinstance(object_key, str) else tuple(object_key)
+            for object_key in object_keys
+        ]
+        copied_keys = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    cls.copy_file, source_bucket_name, source_key, destination_bucket_name, destination_key
+                ): source_key
+                for source_key, destination_key in key_pairs
+            }
+            for future in as_completed(futures):
+                future.result()
+                copied_keys.append(futures[future])
+        return copied_keys
+
+    @classmethod
+    def move_files(
+        cls,
+        source_bucket_name: str | MinioBucket,
+        destination_bucket_name: str | MinioBucket,
+        object_keys: Iterable[str | tuple[str, str]],
+        max_workers: int = 16,
+    ) -> None:
+        """Moves many objects: copies them concurrently, then deletes the sources in batches.
+        See `copy_files()` for the arguments."""
+        copied_keys = cls.copy_files(
+            source_bucket_name=source_bucket_name,
+            destination_bucket_name=destination_bucket_name,
+            object_keys=object_keys,
+            max_workers=max_workers,
+        )
+        cls.delete_files_from_bucket(bucket_name=source_bucket_name, object_keys=copied_keys)
+        LOG.info(f"Successfully moved {len(copied_keys)} files from '{source_bucket_name}' to '{destination_bucket_name}'.")
+
+    @classmethod
+    def move_whole_bucket(
+        cls, source_bucket: str | MinioBucket, destination_bucket: str | MinioBucket, max_workers: int = 16,
+    ) -> None:
+        source_bucket = str(source_bucket)
+        destination_bucket = str(destination_bucket)
+        object_keys = [file["Key"] for file in cls.iter_bucket_objects(bucket_name=source_bucket)]
+        cls.move_files(
+            source_bucket_name=source_bucket,
+            destination_bucket_name=destination_bucket,
+            object_keys=object_keys,
+            max_workers=max_workers,
+        )
@@ -0,0 +1,70 @@
+import threading
+from typing import Optional
+
+from synqtab.data.clients.StorageBackend import StorageBackend
+
+
+_STORAGE_BACKEND_NAMES = ('minio', 'local')
+
+
+class _StorageClientMeta(type):
+    """Forwards every attribute lookup that `StorageClient` itself does not define to the selected backend."""
+
+    def __getattr__(cls, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(cls.get_backend(), name)
+
+
+class StorageClient(metaclass=_StorageClientMeta):
+    """The object storage of the pipeline. Resolves to the backend that the STORAGE_BACKEND environment variable
+    selects ('minio', the default, or 'local' for `LocalStorageClient`) and forwards every `StorageBackend`
+    operation to it, e.g., `StorageClient.read_parquet_from_bucket(...)`.
+    """
+    _backend: Optional[type[StorageBackend]] = None
+    _backend_lock = threading.Lock()
+
+    @staticmethod
+    def _check_backend(backend: Optional[type]) -> Optional[type]:
+        """Instantiates a `StorageBackend` subclass once, so that a backend that misses an abstract operation
+        raises a TypeError when it is selected instead of when the operation is first called."""
+        if isinstance(backend, type) and issubclass(backend, StorageBackend):
+            backend()
+        return backend
+
+    @classmethod
+    def resolve_backend(cls, backend_name: str) -> type[StorageBackend]:
+        if backend_name == 'minio':
+            from synqtab.data.clients.MinioClient import MinioClient
+            return cls._check_backend(MinioClient)
+        if backend_name == 'local':
+            from synqtab.data.clients.LocalStorageClient import LocalStorageClient
+            return cls._check_backend(LocalStorageClient)
+        raise ValueError(f"Unknown storage backend '{backend_name}'. Expected one of {_STORAGE_BACKEND_NAMES}.")
+
+    @classmethod
+    def get_backend(cls) -> type[StorageBackend]:
+        if cls._backend is None:
+            from synqtab.environment.storage import STORAGE_BACKEND
+
+            with cls._backend_lock:
+                if cls._backend is None:
+                    cls._backend = cls.resolve_backend(STORAGE_BACKEND)
+        return cls._backend
+
+    @classmethod
+    def use_backend(cls, backend: Optional[str | type]) -> Optional[type]:
+        """Selects the backend for the rest of the process, overriding STORAGE_BACKEND.
+
+        Args:
+            backend (Optional[str | type]): 'minio', 'local', or a class with the `StorageBackend` classmethods.
+            None goes back to the backend of STORAGE_BACKEND.
+
+        Returns:
+            Optional[type]: the previously selected backend (None if none was resolved yet), so that
+            callers can restore it.
+        """
+        backend = cls.resolve_backend(backend.lower()) if isinstance(backend, str) else cls._check_backend(backend)
+        with cls._backend_lock:
+            previous_backend, cls._backend = cls._backend, backend
+        return previous_backend
@@ -1,8 +1,6 @@
 import json
 from pathlib import Path
-import tensorflow as tf
 import pandas as pd
-import torch
 from numpy import ndarray
 from synqtab.utils.db_utils import read_table_from_db
 from synqtab.utils.minio_utils import read_parquet_from_bucket, MinioBucket, MinioFolder, read_yaml_from_bucket
@@ -205,7 +203,7 @@ class Dataset:
         df = pd.concat([X.reset_index(drop=True), y_series.reset_index(drop=True)], axis=1)
         return df
 
-    def convert_to_df(self, table:torch.Tensor) -> pd.DataFrame:
+    def convert_to_df(self, table: "torch.Tensor") -> pd.DataFrame:
         """
         Converts a TensorFlow tensor to a pandas DataFrame using the stored schema.
         This is useful when the synthetic data is generated as a tensor and needs to be converted back to DataFrame format.
@@ -214,6 +212,10 @@ class Dataset:
         Returns:
             pd.DataFrame: The converted DataFrame.
         """
+        # the frameworks are only imported when a tensor has to be converted; they are slow to import
+        import tensorflow as tf
+        import torch
+
         if isinstance(table, torch.Tensor):
             array = table.cpu().detach().numpy()
         elif isinstance(table, tf.Tensor):
@@ -17,9 +17,12 @@ from .evaluators import (
     QUALITY_EVALUATORS,
     ML_FOCUSED_EVALUATORS,
     PRIVACY_EVALUATORS,
+    ENCODED_INPUT_EVALUATORS,
+    REFERENCE_FIT_EVALUATORS,
+    GLOBAL_RANDOM_STATE_EVALUATORS,
 )
 
-from .experiments import ExperimentType
+from .experiments import ExperimentType, PipelineStage
 
 from .generators import (
     GeneratorModel,
@@ -45,7 +48,11 @@ __all__ = [
     'QUALITY_EVALUATORS',
     'ML_FOCUSED_EVALUATORS',
     'PRIVACY_EVALUATORS',
+    'ENCODED_INPUT_EVALUATORS',
+    'REFERENCE_FIT_EVALUATORS',
+    'GLOBAL_RANDOM_STATE_EVALUATORS',
     'ExperimentType',
+    'PipelineStage',
     'GeneratorModel',
     'GENERIC_MODELS',
     'PRIVACY_MODELS',
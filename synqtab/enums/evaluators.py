@@ -30,12 +30,18 @@ class EvaluationInput(EasilyStringifyableEnum):
     PREDICTION_COLUMN_NAME  = 'prediction_column_name'
     PROBLEM_TYPE            = 'problem_type'
     NOTES                   = 'notes'
+    REFERENCE_FIT           = 'reference_fit'
+    REFERENCE_DATA          = 'reference_data'
+    REFERENCE_ID            = 'reference_id'
+    ENCODED_DATA            = 'encoded_data'
+    BASELINE_ID             = 'baseline_id'
     
 
 # =========== ALL OUTPUT KEYS FOR EVALUATORS ===========
 class EvaluationOutput(EasilyStringifyableEnum):
-    RESULT = 'result'
-    NOTES  = 'notes'
+    RESULT    = 'result'
+    NOTES     = 'notes'
+    ARTIFACTS = 'artifacts'
 
 
 # =========== CLASSIFICATION BASED ON THE NUMBER OF INPUT TABLES ===========
@@ -84,4 +90,26 @@ ML_FOCUSED_EVALUATORS: list[EvaluationMethod] = [
     EvaluationMethod.ARC,
     EvaluationMethod.AR2,
     EvaluationMethod.EFF,
-]
\ No newline at end of file
+]
+
+# =========== CLASSIFICATION BASED ON THE INPUT REPRESENTATION ===========
+# ================ Encoded-input evaluators can reuse the numeric encoding of their (real, synthetic) pair
+ENCODED_INPUT_EVALUATORS: list[EvaluationMethod] = [
+    EvaluationMethod.LGD,
+    EvaluationMethod.SVD,
+]
+
+# =========== CLASSIFICATION BASED ON THE FITTED MODEL ===========
+# ================ Reference-fit evaluators can score every target with one model fitted on R for the (dataset, seed)
+REFERENCE_FIT_EVALUATORS: list[EvaluationMethod] = [
+    EvaluationMethod.IFO,
+    EvaluationMethod.LOF,
+]
+
+# =========== CLASSIFICATION BASED ON THE RANDOMNESS ===========
+# ================ Global-random-state evaluators draw from numpy's global random state, so they must not run concurrently
+GLOBAL_RANDOM_STATE_EVALUATORS: list[EvaluationMethod] = [
+    EvaluationMethod.EFF,
+    EvaluationMethod.LGD,
+    EvaluationMethod.SVD,
+]
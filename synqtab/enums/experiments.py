@@ -6,3 +6,10 @@ class ExperimentType(EasilyStringifyableEnum):
     PRIVACY = 'PRI'
     AUGMENTATION = 'AUG'
     REBALANCING = 'REB'
+
+
+class PipelineStage(EasilyStringifyableEnum):
+    SPLIT = 'split' # train/validation split of the real perfect data
+    CORRUPT = 'corrupt' # corruption of the real training data
+    GENERATE = 'generate' # synthetic data of an experiment
+    EVALUATE = 'evaluate' # evaluations of an experiment
@@ -9,6 +9,8 @@ class MinioBucket(EasilyStringifyableEnum):
     FINISHED_TASKS = 'finished-tasks'
     FAILED_TASKS = 'failed-tasks'
     SKIPPED_TASKS = 'skipped-tasks'
+    MODELS = 'models'
+    ARTIFACTS = 'artifacts'
 
 class MinioFolder(EasilyStringifyableEnum):
     PERFECT = 'perfect'
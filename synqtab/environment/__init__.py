@@ -1,7 +1,9 @@
 from .experiment import (
     RANDOM_SEEDS, ERROR_RATES,
     EXECUTION_PROFILE, MAX_TRAINING_ROWS,
-    MAX_COLUMNS_FOR_FD_DISCOVERY,
+    MAX_COLUMNS_FOR_FD_DISCOVERY, FIDELITY_LEVELS, REFERENCE_FIT,
+    JOB_ORDERING, WORKER_INDEX, WORKER_COUNT,
+    GENERATOR_CHECKPOINT_INTERVAL, PIPELINE_MAX_WORKERS, PIPELINE_MAX_GENERATORS,
 )
 
 from .minio import (
@@ -11,8 +13,21 @@ from .minio import (
     MINIO_UI_MAPPED_PORT,
     MINIO_ENDPOINT,
     MINIO_HOST,
+    PARQUET_COMPRESSION,
+    PARQUET_ROW_GROUP_SIZE,
+    MINIO_MAX_POOL_CONNECTIONS,
+    MINIO_MAX_RETRY_ATTEMPTS,
+    MINIO_CONNECT_TIMEOUT,
+    MINIO_READ_TIMEOUT,
+    MINIO_MULTIPART_THRESHOLD_MB,
+    MINIO_MULTIPART_CHUNKSIZE_MB,
+    MINIO_TRANSFER_MAX_CONCURRENCY,
 )
 
+from .storage import STORAGE_BACKEND, LOCAL_STORAGE_ROOT
+
+from .results import RESULTS_BACKEND, RESULTS_DATABASE_PATH, RESULTS_SCHEMA_FILE
+
 from .discord import DISCORD_WEBHOOK_URL
 
 __all__ = [
@@ -21,11 +36,33 @@ __all__ = [
     'EXECUTION_PROFILE',
     'MAX_TRAINING_ROWS',
     'MAX_COLUMNS_FOR_FD_DISCOVERY',
+    'FIDELITY_LEVELS',
+    'REFERENCE_FIT',
+    'JOB_ORDERING',
+    'WORKER_INDEX',
+    'WORKER_COUNT',
+    'GENERATOR_CHECKPOINT_INTERVAL',
+    'PIPELINE_MAX_WORKERS',
+    'PIPELINE_MAX_GENERATORS',
     'MINIO_ROOT_USER',
     'MINIO_ROOT_PASSWORD',
     'MINIO_API_MAPPED_PORT',
     'MINIO_UI_MAPPED_PORT',
     'MINIO_ENDPOINT',
     'MINIO_HOST',
+    'PARQUET_COMPRESSION',
+    'PARQUET_ROW_GROUP_SIZE',
+    'MINIO_MAX_POOL_CONNECTIONS',
+    'MINIO_MAX_RETRY_ATTEMPTS',
+    'MINIO_CONNECT_TIMEOUT',
+    'MINIO_READ_TIMEOUT',
+    'MINIO_MULTIPART_THRESHOLD_MB',
+    'MINIO_MULTIPART_CHUNKSIZE_MB',
+    'MINIO_TRANSFER_MAX_CONCURRENCY',
+    'STORAGE_BACKEND',
+    'LOCAL_STORAGE_ROOT',
+    'RESULTS_BACKEND',
+    'RESULTS_DATABASE_PATH',
+    'RESULTS_SCHEMA_FILE',
     'DISCORD_WEBHOOK_URL'
 ]
@@ -23,6 +23,10 @@ def _get_seeds_from_env_or_else_default() -> list[int]:
     seeds_str = os.getenv('RANDOM_SEEDS', '100,200,300')
     return _parse_comma_separated_integers(seeds_str)
 
+def _get_fidelity_levels_from_env_or_else_default() -> list[float]:
+    fidelity_levels_str = os.getenv('FIDELITY_LEVELS', '0.1, 0.3, 1.0')
+    return _parse_comma_separated_floats(fidelity_levels_str)
+
 def _get_pollution_rates_from_env_or_else_default() -> list[float]:
     pollution_rates_str = os.getenv('POLLUTION_RATES', '0.1, 0.2, 0.4')
     return _parse_comma_separated_floats(pollution_rates_str)
@@ -31,7 +35,15 @@ def _get_pollution_rates_from_env_or_else_default() -> list[float]:
 load_dotenv()
 RANDOM_SEEDS = _get_seeds_from_env_or_else_default()
 ERROR_RATES = _get_pollution_rates_from_env_or_else_default()
+FIDELITY_LEVELS = _get_fidelity_levels_from_env_or_else_default()
 MAX_TRAINING_ROWS = float(os.getenv('MAX_TRAINING_ROWS', 'inf'))
 EXECUTION_PROFILE = os.getenv('EXECUTION_PROFILE', 'NOT FOUND IN ENV')
 MAX_COLUMNS_FOR_FD_DISCOVERY = int(os.getenv('MAX_COLUMNS_FOR_FD_DISCOVERY', '65'))
+REFERENCE_FIT = os.getenv('REFERENCE_FIT', 'false').lower() == 'true' # score the outlier evaluations with one model fitted on R
 
+JOB_ORDERING = os.getenv('JOB_ORDERING', 'cost').lower() # 'cost' (longest predicted first) or 'random'
+WORKER_INDEX = int(os.getenv('WORKER_INDEX', '0'))
+WORKER_COUNT = int(os.getenv('WORKER_COUNT', '1'))
+GENERATOR_CHECKPOINT_INTERVAL = float(os.getenv('GENERATOR_CHECKPOINT_INTERVAL', '0')) # seconds; 0 (the default) disables checkpointing
+PIPELINE_MAX_WORKERS = int(os.getenv('PIPELINE_MAX_WORKERS', '4')) # pipeline tasks that run at the same time
+PIPELINE_MAX_GENERATORS = int(os.getenv('PIPELINE_MAX_GENERATORS', '1')) # generations that run at the same time, e.g., 1 per GPU
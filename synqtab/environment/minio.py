@@ -9,3 +9,12 @@ MINIO_API_MAPPED_PORT = os.getenv('MINIO_API_MAPPED_PORT')
 MINIO_UI_MAPPED_PORT = os.getenv('MINIO_UI_MAPPED_PORT')
 MINIO_ENDPOINT = os.getenv('MINIO_ENDPOINT')
 MINIO_HOST = os.getenv('MINIO_HOST')
+PARQUET_COMPRESSION = os.getenv('PARQUET_COMPRESSION', 'zstd')
+PARQUET_ROW_GROUP_SIZE = int(os.getenv('PARQUET_ROW_GROUP_SIZE', '131072'))
+MINIO_MAX_POOL_CONNECTIONS = int(os.getenv('MINIO_MAX_POOL_CONNECTIONS', '50'))
+MINIO_MAX_RETRY_ATTEMPTS = int(os.getenv('MINIO_MAX_RETRY_ATTEMPTS', '10'))
+MINIO_CONNECT_TIMEOUT = float(os.getenv('MINIO_CONNECT_TIMEOUT', '10'))
+MINIO_READ_TIMEOUT = float(os.getenv('MINIO_READ_TIMEOUT', '120'))
+MINIO_MULTIPART_THRESHOLD_MB = int(os.getenv('MINIO_MULTIPART_THRESHOLD_MB', '64'))
+MINIO_MULTIPART_CHUNKSIZE_MB = int(os.getenv('MINIO_MULTIPART_CHUNKSIZE_MB', '16'))
+MINIO_TRANSFER_MAX_CONCURRENCY = int(os.getenv('MINIO_TRANSFER_MAX_CONCURRENCY', '10'))
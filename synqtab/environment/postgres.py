@@ -8,3 +8,7 @@ POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD')
 POSTGRES_MAPPED_PORT = os.getenv('POSTGRES_MAPPED_PORT')
 POSTGRES_HOST = os.getenv('POSTGRES_HOST')
 POSTGRES_DB = os.getenv('POSTGRES_DB')
+ERROR_LOG_QUEUE_SIZE = int(os.getenv('ERROR_LOG_QUEUE_SIZE', '10000'))
+ERROR_LOG_BATCH_SIZE = int(os.getenv('ERROR_LOG_BATCH_SIZE', '200'))
+ERROR_LOG_RETRY_INTERVAL = float(os.getenv('ERROR_LOG_RETRY_INTERVAL', '30'))
+ERROR_LOG_FALLBACK_DIRECTORY = os.getenv('ERROR_LOG_FALLBACK_DIRECTORY', os.path.join(os.path.expanduser('~'), '.synqtab', 'error_logs'))
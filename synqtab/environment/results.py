@@ -0,0 +1,11 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+RESULTS_BACKEND = os.getenv('RESULTS_BACKEND', 'postgres').lower()
+RESULTS_DATABASE_PATH = os.getenv('RESULTS_DATABASE_PATH')
+RESULTS_SCHEMA_FILE = os.getenv(
+    'RESULTS_SCHEMA_FILE',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'postgres', 'init.sql'),
+)
@@ -0,0 +1,7 @@
+import os
+from dotenv import load_dotenv
+
+
+load_dotenv()
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'minio').lower()
+LOCAL_STORAGE_ROOT = os.getenv('LOCAL_STORAGE_ROOT', os.path.join('~', '.synqtab', 'storage'))
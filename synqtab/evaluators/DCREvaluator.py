@@ -2,25 +2,40 @@ from synqtab.evaluators.Evaluator import Evaluator
 
 
 class DCREvaluator(Evaluator):
-    """ Distance from Closest Record Evaluator (Baseline). Leverages
-    https://docs.sdv.dev/sdmetrics/data-metrics/privacy/dcrbaselineprotection. Parameters:
+    """ Distance from Closest Record Evaluator (Baseline). Computes the same score as
+    https://docs.sdv.dev/sdmetrics/data-metrics/privacy/dcrbaselineprotection with a native, chunked
+    implementation whose memory does not grow quadratically with the number of rows. Parameters:
         - [*required*] `'real_training_data'`: the real data used to train the generator
         - [*required*] `'synthetic_data'`: the synthetic data generated by the generator
         - [*required*] `'metadata'`: sdmetrics metadata; See 
         https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
+        - [*optional*] `'num_rows_subsample'`: the number of rows to sample per iteration. If absent, defaults to
+        None, i.e., the exact DCR over all rows is computed.
+        - [*optional*] `'num_iterations'`: the number of subsampling iterations; the score is their average and a
+        confidence interval of it is added to the notes. If absent, defaults to 1.
+        - [*optional*] `'chunk_size'`: the number of rows per block of the distance computation.
+        If absent, defaults to 2000.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
     def compute_result(self):
-        from sdmetrics.single_table import DCRBaselineProtection
+        from synqtab.reproducibility import ReproducibleOperations
+        from synqtab.utils.privacy_utils import compute_dcr_baseline_protection
         
-        score = DCRBaselineProtection.compute_breakdown(
-            real_training_data=self.params.get('real_training_data'),
+        score = compute_dcr_baseline_protection(
+            real_data=self.params.get('real_training_data'),
             synthetic_data=self.params.get('synthetic_data'),
             metadata=self.params.get('metadata'),
+            num_rows_subsample=self.params.get('num_rows_subsample', None),
+            num_iterations=self.params.get('num_iterations', 1),
+            chunk_size=self.params.get('chunk_size', 2000),
+            random_seed=ReproducibleOperations.get_current_random_seed(),
         )
         if self.params.get('notes', False):
-            return score.get('score'), score.get('median_DCR_to_real_data')
+            notes = score.get('median_DCR_to_real_data')
+            if 'confidence_interval' in score:
+                notes['confidence_interval'] = score.get('confidence_interval')
+            return score.get('score'), notes
         return score.get('score')
     
     def short_name(self):
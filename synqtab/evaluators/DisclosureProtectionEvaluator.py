@@ -3,12 +3,18 @@ from synqtab.evaluators.Evaluator import Evaluator
 
 # Internally computes Categorical CAP as well, so no need for a CAP-specific evaluator
 class DisclosureProtectionEvaluator(Evaluator):
-    """ Disclosure Protection Evaluator. Leverages
-    https://docs.sdv.dev/sdmetrics/data-metrics/privacy/disclosureprotection. Parameters:
+    """ Disclosure Protection Evaluator. Computes the same breakdown as
+    https://docs.sdv.dev/sdmetrics/data-metrics/privacy/disclosureprotection with grouped counts over hashed
+    column tuples instead of row-by-row lookups. Parameters:
         - [*required*] `'real_training_data'`: the real data used to train the generator
         - [*required*] `'synthetic_data'`: the synthetic data generated by the generator
         - [*required*] `'known_column_names'`: the names of the columns that are considered known
         - [*required*] `'sensitive_column_names'`: the names of the columns that are considered sensitive
+        - [*optional*] `'continuous_column_names'`: the names of the columns to discretize. If absent, defaults
+        to the known and sensitive columns whose sdtype is numerical or datetime in `'metadata'`.
+        - [*optional*] `'metadata'`: sdmetrics metadata; used to find the continuous columns if they are absent.
+        - [*optional*] `'num_discrete_bins'`: the number of bins of the discretized columns. If absent, defaults to 10.
+        - [*optional*] `'computation_method'`: 'cap', 'zero_cap' or 'generalized_cap'. If absent, defaults to 'cap'.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
@@ -20,15 +26,30 @@ class DisclosureProtectionEvaluator(Evaluator):
     def full_name(self):
         return "Disclosure Protection Evaluator"
 
+    def _get_continuous_column_names(self):
+        if self.params.get('continuous_column_names') is not None:
+            return self.params.get('continuous_column_names')
+        
+        metadata = self.params.get('metadata')
+        if not metadata:
+            return None
+        return [
+            column_name
+            for column_name in self.params.get('known_column_names') + self.params.get('sensitive_column_names')
+            if metadata['columns'].get(column_name, dict()).get('sdtype') in {'numerical', 'datetime'}
+        ]
+
     def compute_result(self):
-        from sdmetrics.single_table import DisclosureProtection
+        from synqtab.utils.privacy_utils import compute_disclosure_protection
         
-        score = DisclosureProtection.compute_breakdown(
-            real_training_data=self.params.get('real_training_data'),
+        score = compute_disclosure_protection(
+            real_data=self.params.get('real_training_data'),
             synthetic_data=self.params.get('synthetic_data'),
             known_column_names=self.params.get('known_column_names'),
             sensitive_column_names=self.params.get('sensitive_column_names'),
-            continuous_column_names=self.params.get('continuous_column_names'),
+            computation_method=self.params.get('computation_method', 'cap'),
+            continuous_column_names=self._get_continuous_column_names(),
+            num_discrete_bins=self.params.get('num_discrete_bins', 10),
         )
         if self.params.get('notes', False):
             return score.get('score'), {
@@ -6,6 +6,7 @@ from synqtab.enums import (
     EvaluationMethod, GeneratorModel, EvaluationTarget
 )
 from synqtab.experiments.Experiment import Experiment
+from synqtab.evaluators.EvaluationKey import EvaluationKey
 from synqtab.evaluators.Evaluator import Evaluator
 from synqtab.utils import get_logger
 
@@ -14,9 +15,6 @@ LOG = get_logger(__file__)
 
 
 class Evaluation():
-    
-    _delimiter: str = '#'
-    _NULL: str = 'NULL'
 
     def __init__(
         self,
@@ -24,105 +22,76 @@ class Evaluation():
         experiment: Experiment,
         evaluation_method: EvaluationMethod,
         params: Optional[Dict[str, Any]] = None,
+        fidelity: float = 1.0,
+        reference_fit: bool = False,
     ):
+        from synqtab.enums import REFERENCE_FIT_EVALUATORS
         from synqtab.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
         
+        if not 0 < fidelity <= 1:
+            raise ValueError(f"The fidelity must be in (0, 1]. Got {fidelity}.")
+        if abs(fidelity * 100 - round(fidelity * 100)) > 1e-9:
+            # the evaluation ID stores the fidelity as a percentage, so e.g. 0.333 and 0.334 would share an ID
+            raise ValueError(f"The fidelity must be a whole percentage, e.g., 0.1 or 0.33. Got {fidelity}.")
+        if reference_fit and evaluation_method not in REFERENCE_FIT_EVALUATORS:
+            raise ValueError(f"Evaluation method {str(evaluation_method)} cannot score its target with a model fitted on R.")
+        
         self.evaluation_targets = evaluation_targets
         self.experiment = experiment
         self.evaluation_method = evaluation_method
         self.evaluator = EVALUATION_METHOD_TO_EVALUATION_CLASS.get(self.evaluation_method)(params=params)
         self.params = params if params is not None else dict()
+        self.fidelity = fidelity # fraction of the rows of each evaluation target to evaluate on; 1 is the full evaluation
+        self.reference_fit = reference_fit # whether the target is scored by one model fitted on R, see `EvaluationSession.build_params()`
+        self.result = None
         
-        self._should_compute = (not self._exists_in_postgres())
+        self._exists = None # looked up in Postgres on first use, so that expanding the task graph costs no queries
+        self._key = None # see the `key` property
+        self._key_fields = None
+    
+    @property
+    def _should_compute(self) -> bool:
+        if self._exists is None:
+            self._exists = self._exists_in_postgres()
+        return not self._exists
+    
+    def is_perfect_baseline(self) -> bool:
+        """Whether the evaluation only involves the perfect targets (R and S). These are the same for every data
+        error and error rate of a (dataset, seed, generator), so they belong to the perfect experiment."""
+        return all(
+            evaluation_target in {EvaluationTarget.R, EvaluationTarget.S} for evaluation_target in self.evaluation_targets
+        )
+    
+    def node_id(self) -> str:
+        """The identifier of the evaluation across all experiments, i.e., '<evaluation_id>/<experiment_id>'."""
+        return str(self) + '/' + str(self.experiment)
     
-    def _run(self):
-        from synqtab.data import PostgresClient, MinioClient
-        from synqtab.enums import ProblemType, DataPerfectness, EvaluationInput, EvaluationTarget, MinioBucket, EvaluationOutput
+    def _run(self, session=None):
+        from synqtab.data import ResultsClient
+        
+        ResultsClient.write_evaluation_result(**self._compute(session=session))
+    
+    def _compute(self, session=None) -> Dict[str, Any]:
+        """Computes the evaluation and uploads its artifacts. Returns the keyword arguments of
+        `ResultsClient.write_evaluation_result()`, so that the caller decides when to write them."""
+        import json
+        from synqtab.enums import EvaluationInput, EvaluationOutput, ENCODED_INPUT_EVALUATORS
+        from synqtab.evaluators.EvaluationSession import EvaluationSession
         from synqtab.mappings.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
-        from synqtab.reproducibility import ReproducibleOperations
         from synqtab.utils import timed_computation
         
         evaluation_full_name = str(self) + '/' + str(self.experiment)
         LOG.info(f"Entering the _run() function of Evaluation {evaluation_full_name}")
         
-        real_perfect_df = self.experiment.dataset._fetch_real_perfect_dataframe()
-        target_column_name = self.experiment.dataset.target_feature
-        target = real_perfect_df[target_column_name]
-        problem_type = ProblemType(self.experiment.dataset.problem_type)
-        sdmetrics_metadata = self.experiment.dataset.get_sdmetrics_single_table_metadata()
-        training_df, validation_df = ReproducibleOperations.train_test_split(
-            real_perfect_df, test_size=0.5, stratify=target, problem_type=problem_type)
-        
-        # use the class with the least frequency as minority class. If it is a regression problem, this
-        # EvaluationInput key is not used downstream. So, this implementation targets only classification datasets.
-        minority_class = validation_df[target_column_name].value_counts(sort=True, ascending=True).index[0]
-        
-        evaluation_target_dfs = []
-        for evaluation_target in self.evaluation_targets:
-            data = None
-            match evaluation_target:
-                case EvaluationTarget.R:
-                    LOG.info("Getting perfect R data from dataset + train test split")
-                    data = training_df
-
-                case EvaluationTarget.RH:
-                    if self.experiment.data_perfectness == DataPerfectness.PERFECT:
-                        raise ValueError(f"Cannot create real corrupted data from a perfect experiment object.")
-                    
-                    LOG.info("Getting imperfect data as perfect + corruption")
-                    data_error_instance = self.experiment.data_error.get_class()(row_fraction=self.experiment.data_error_rate)
-                    data, corrupted_rows, corrupted_cols = data_error_instance.corrupt(
-                        data=training_df,
-                        categorical_columns=self.experiment.dataset.categorcal_features,
-                        target_column=self.experiment.dataset.target_feature,
-                    )
-                    if self.experiment.data_perfectness == DataPerfectness.SEMIPERFECT:
-                        data.drop(corrupted_rows)
-
-                case EvaluationTarget.S:
-                    perfect_counterpart_experiment = self.experiment.perfect_counterpart()
-                    LOG.info("Getting S data from Synthetic bucket " + perfect_counterpart_experiment.minio_path())
-                    data = MinioClient.read_parquet_from_bucket(
-                        bucket_name=MinioBucket.SYNTHETIC,
-                        object_name=perfect_counterpart_experiment.minio_path(),
-                    )
-
-                case EvaluationTarget.SH:
-                    data = MinioClient.read_parquet_from_bucket(
-                        bucket_name=MinioBucket.SYNTHETIC,
-                        object_name=self.experiment.minio_path(),
-                    )
-                    
-                case _ as not_implemented_evaluation_target:
-                    raise NotImplementedError(
-                        f"Unknown evaluation target type. Got {not_implemented_evaluation_target}. " +
-                        f"Valid options: {[str(option) for option in EvaluationTarget]}."
-                    )
-            
-            for column in data.columns:
-                if column in self.experiment.dataset.categorcal_features:
-                    data[column] = data[column].astype('category')
-                    
-            for column in validation_df:
-                if column in self.experiment.dataset.categorcal_features:
-                    validation_df[column] = validation_df[column].astype('category')
-            
-            evaluation_target_dfs.append(data)
-        
-                  
-        params = {
-            str(EvaluationInput.PROBLEM_TYPE): str(problem_type),
-            str(EvaluationInput.METADATA): sdmetrics_metadata,
-            str(EvaluationInput.REAL_VALIDATION_DATA): validation_df,
-            str(EvaluationInput.NOTES): True,
-            str(EvaluationInput.PREDICTION_COLUMN_NAME): target_column_name,
-            str(EvaluationInput.KNOWN_COLUMN_NAMES): self.params.get(str(EvaluationInput.KNOWN_COLUMN_NAMES), list(training_df.columns)),
-            str(EvaluationInput.SENSITIVE_COLUMN_NAMES): self.params.get(str(EvaluationInput.SENSITIVE_COLUMN_NAMES), []),
-            str(EvaluationInput.REAL_TRAINING_DATA): evaluation_target_dfs[0], # used by dual evaluators
-            str(EvaluationInput.DATA): evaluation_target_dfs[0],               # used by singular evaluators
-            str(EvaluationInput.SYNTHETIC_DATA): evaluation_target_dfs[1] if len(evaluation_target_dfs) > 1 else None,
-            str(EvaluationInput.MINORITY_CLASS_LABEL): minority_class,
-        }
+        # the session loads, splits and encodes the experiment's data once for all of its evaluations
+        session = session if session is not None else EvaluationSession(self.experiment, fidelity=self.fidelity)
+        if session.fidelity != self.fidelity:
+            raise ValueError(f"Evaluation {evaluation_full_name} has fidelity {self.fidelity} but the session has {session.fidelity}.")
+        params = session.build_params(
+            *self.evaluation_targets,
+            params={**self.params, str(EvaluationInput.REFERENCE_FIT): self.reference_fit},
+            encode=(self.evaluation_method in ENCODED_INPUT_EVALUATORS),
+        )
         
         evaluator_instance = EVALUATION_METHOD_TO_EVALUATION_CLASS.get(self.evaluation_method)(params)
         
@@ -131,16 +100,49 @@ class Evaluation():
             params=dict(),
         )
         
-        import json
-        PostgresClient.write_evaluation_result(
-            evaluation_id=str(self),
-            experiment_id=str(self.experiment),
-            first_target=str(self.evaluation_targets[0]),
-            second_target=str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else None,
-            result=evaluation_output.get(EvaluationOutput.RESULT),
-            execution_time=elapsed_time,
-            notes=json.dumps(evaluation_output.get(EvaluationOutput.NOTES))
-        )
+        self.result = evaluation_output.get(EvaluationOutput.RESULT)
+        notes = evaluation_output.get(EvaluationOutput.NOTES)
+        artifacts = evaluation_output.get(EvaluationOutput.ARTIFACTS, dict())
+        if artifacts:
+            notes = self._upload_artifacts(artifacts, notes)
+        
+        return {
+            'evaluation_id': str(self),
+            'experiment_id': str(self.experiment),
+            'first_target': str(self.evaluation_targets[0]),
+            'second_target': str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else None,
+            'result': self.result,
+            'execution_time': elapsed_time,
+            'notes': json.dumps(notes),
+            'fidelity': self.fidelity,
+        }
+    
+    def _upload_artifacts(self, artifacts: Dict[str, Any], notes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Uploads the array artifacts of an evaluation as NPY objects to MinIO and records their
+        object keys in the notes. Returns the updated notes."""
+        import io
+        import numpy as np
+        from synqtab.data import StorageClient
+        from synqtab.enums import MinioBucket, MinioFolder
+        
+        notes = notes if notes else dict()
+        for artifact_name, values in artifacts.items():
+            object_name = MinioFolder.create_prefix(str(self.experiment), str(self), f"{artifact_name}.npy")
+            buffer = io.BytesIO()
+            np.save(buffer, values, allow_pickle=False)
+            StorageClient.upload_bytes_to_bucket(
+                data=buffer.getvalue(),
+                bucket_name=MinioBucket.ARTIFACTS,
+                object_name=object_name,
+            )
+            
+            artifact_notes = notes.get(artifact_name)
+            if not isinstance(artifact_notes, dict):
+                artifact_notes = dict()
+                notes[artifact_name] = artifact_notes
+            artifact_notes['object_name'] = object_name
+        
+        return notes
 
         
     def _is_valid(self) -> bool: 
@@ -150,7 +152,12 @@ class Evaluation():
         if not self._is_valid():
             return False
         
-        from synqtab.data import MinioClient
+        self.publish_task()
+        return True
+    
+    def publish_task(self) -> None:
+        """Publishes the evaluation as a task in MinIO, under '<experiment_id>/<evaluation_id>'."""
+        from synqtab.data import StorageClient
         from synqtab.enums import MinioBucket, MinioFolder
         
         task_dict = {
@@ -162,80 +169,85 @@ class Evaluation():
         file_name = MinioFolder.create_prefix(
             str(self.experiment), str(self)
         )
-        MinioClient.upload_json_to_bucket(
+        StorageClient.upload_json_to_bucket(
             data=task_dict,
             bucket_name=bucket_name,
             file_name=file_name,
             folder=None # we handle folders in the file name for consistency
         )
-        return True
     
-    # IMPORTANT: Keep this method aligned with the from_str_and_experiment() method!
+    @property
+    def key(self) -> EvaluationKey:
+        """The identity of the evaluation within its experiment. It is cached until one of its fields changes."""
+        key_fields = (self.evaluation_method, self.evaluation_targets, self.fidelity, self.reference_fit)
+        if self._key is None or self._key_fields != key_fields:
+            self._key = EvaluationKey(
+                evaluation_method=str(self.evaluation_method), # Evaluator short name, e.g., 'IFO' for Isolation Forest Evaluator
+                first_target=str(self.evaluation_targets[0]), # Type of the first evaluation target, e.g, 'R' for real data, or 'SH' for imperfect synthetic
+                second_target=str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else None, # Type of the second evaluation target if it exists
+                # Reduced-fidelity evaluations get their percentage of rows as a suffix, e.g., 'F10'; full evaluations get none
+                fidelity_pct=round(self.fidelity * 100) if self.fidelity < 1 else None,
+                # Reference-fit evaluations get the 'RF' suffix, so that they never share an ID with per-target fits
+                reference_fit=self.reference_fit,
+            )
+            self._key_fields = key_fields
+        return self._key
+    
     def _get_evaluation_id_parts(self):
-        from synqtab.reproducibility.ReproducibleOperations import ReproducibleOperations
-        return [
-            str(self.evaluation_method), # Evaluator short name, e.g., 'IFO' for Isolation Forest Evaluator
-            str(self.evaluation_targets[0]), # Type of the first evaluation target, e.g, 'R' for real data, or 'SH' for imperfect synthetic
-            str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else self._NULL, # Type of the second evaluation target if it exists, else standardized NULL placeholder
-        ]
+        return list(self.key.parts())
     
-    # IMPORTANT: Keep this method aligned with the _get_evaluation_id_parts() method!
     @classmethod
     def from_str_and_experiment(cls, evaluation_id: str, experiment: Experiment) -> Self:
                 
-        evaluation_id_parts = evaluation_id.split(cls._delimiter)
-        evaluator_shortname = evaluation_id_parts[0]
+        key = EvaluationKey.from_str(evaluation_id)
         
-        evaluation_targets = [EvaluationTarget(str(evaluation_id_parts[1]))]
-        if evaluation_id_parts[2] != cls._NULL:
-            evaluation_targets.append(EvaluationTarget(str(evaluation_id_parts[2])))
+        evaluation_targets = [EvaluationTarget(key.first_target)]
+        if key.second_target is not None:
+            evaluation_targets.append(EvaluationTarget(key.second_target))
+        
+        fidelity = 1.0 if key.fidelity_pct is None else key.fidelity_pct / 100
             
         return Evaluation(
             *evaluation_targets,
-            evaluation_method=EvaluationMethod(evaluator_shortname),
+            evaluation_method=EvaluationMethod(key.evaluation_method),
             experiment=experiment,
+            fidelity=fidelity,
+            reference_fit=key.reference_fit,
         )
     
     def __str__(self):
-        experiment_id_parts = self._get_evaluation_id_parts()
-        return self._delimiter.join(experiment_id_parts)
+        return str(self.key)
     
-    def run(self, force: bool=False) -> Self:
+    def run(self, force: bool=False, session=None) -> Self:
+        if self._skip(force=force):
+            return self
+        
+        self._run(session=session)
+        return self
+    
+    def _skip(self, force: bool=False) -> bool:
+        """Returns True (and records the reason in Postgres) if the evaluation should not be computed."""
+        # Skip evaluation if it is the perfect baseline of a non-perfect experiment
+        # The task graph attaches the R-S evaluations to the perfect experiment, so they are never expanded for the
+        # non-perfect ones; this only guards against tasks that were published before
+        if self.experiment.data_error is not None and self.is_perfect_baseline():
+            LOG.info(f"Evaluating {self.node_id()} will be skipped; the perfect experiment computes the baseline.")
+            return True
+        
         # Skip evaluation if it already exists in the database
         if not self._should_compute and not force:
-            from synqtab.data import PostgresClient
+            from synqtab.data import ResultsClient
             LOG.info(f"Evaluating {str(self)}/{str(self.experiment)} will be skipped because it already exists in Postgres.")
-            PostgresClient.write_skipped_computation(
+            ResultsClient.write_skipped_computation(
                 computation_id=str(self) + '/' + str(self.experiment),
                 reason=f"Already exists in Postgres.")
-            return self
+            return True
         
-        # Skip evaluation if it is the perfect baseline of a non-perfect experiment
-        # The perfect baseline is only computed once, for the first data error rate
-        # For example, the R-S evaluations of OUT10, OUT20, and OUT40 on the same dataset are the same; we compute them only once
-        from synqtab.environment.experiment import ERROR_RATES
-        first_data_error_rate = ERROR_RATES[0]
-        if self.experiment.data_error is not None: # if it is not a "perfect" experiment
-            is_baseline_evaluation: bool = True
-            for evaluation_target in self.evaluation_targets:
-                if evaluation_target not in {EvaluationTarget.R, EvaluationTarget.S}:
-                    is_baseline_evaluation = False
-                    break
-            
-            # if it is a baseline "perfect" evaluation of a non-perfect experiment, compute only for one error rate
-            if is_baseline_evaluation and self.experiment.data_error_rate != first_data_error_rate: 
-                from synqtab.data import PostgresClient
-                LOG.info(f"Evaluating {str(self)}/{str(self.experiment)} will be skipped to avoid re-computing the baseline.")
-                PostgresClient.write_skipped_computation(
-                    computation_id=str(self) + '/' + str(self.experiment),
-                    reason=f"The perfect baseline is only computed for error rate: {first_data_error_rate}.")
-                return self
-        
-        self._run()
-        return self
+        return False
 
     def _exists_in_postgres(self) -> bool:
-        # TODO FIND A WAY TO HANDLE GRACEFULLY THE PERFECT DATA SCENARIO - NO NEED TO RECOMPUTE IN ALL CASES, ONLY ONCE
-        from synqtab.data import PostgresClient
+        from synqtab.data import ResultsClient
         
-        return PostgresClient.evaluation_exists(str(self), str(self.experiment))
+        return ResultsClient.evaluation_exists(
+            str(self), str(self.experiment), evaluation_key=self.key.hash64, experiment_key=self.experiment.key.hash64,
+        )
@@ -0,0 +1,63 @@
+from dataclasses import dataclass, field
+from typing import Optional, Self
+
+
+@dataclass(frozen=True, slots=True)
+class EvaluationKey:
+    """The identity of an evaluation within its experiment, e.g., 'IFO#R#S' or 'IFO#R#S#F10' for 10% of the rows.
+    Evaluations that score their target with a model fitted on R get the 'RF' suffix, e.g., 'IFO#SH#NULL#RF'. The string and its stable 64-bit hash (the `evaluation_key` column of the results) are computed once, when
+    the key is created."""
+    _delimiter = '#'
+    _NULL = 'NULL'
+    _FIDELITY_PREFIX = 'F'
+    _REFERENCE_FIT_SUFFIX = 'RF'
+
+    evaluation_method: str # e.g., 'IFO' for Isolation Forest Evaluator
+    first_target: str # e.g., 'R' for real data, or 'SH' for imperfect synthetic
+    second_target: Optional[str]
+    fidelity_pct: Optional[int] # the percentage of rows of reduced-fidelity evaluations; None for full ones
+    reference_fit: bool = False # whether the target is scored by a model fitted on R instead of a model fitted on itself
+    _string: str = field(init=False, repr=False, compare=False)
+    hash64: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        from synqtab.utils.general_utils import stable_hash64
+
+        string = self._delimiter.join(self.parts())
+        object.__setattr__(self, '_string', string)
+        object.__setattr__(self, 'hash64', stable_hash64(string))
+
+    # IMPORTANT: Keep this method aligned with the from_str() method!
+    def parts(self) -> tuple[str, ...]:
+        parts = (self.evaluation_method, self.first_target, self.second_target or self._NULL)
+        if self.fidelity_pct is not None:
+            parts += (self._FIDELITY_PREFIX + str(self.fidelity_pct),)
+        if self.reference_fit:
+            parts += (self._REFERENCE_FIT_SUFFIX,)
+        return parts
+
+    # IMPORTANT: Keep this method aligned with the parts() method!
+    @classmethod
+    def from_str(cls, evaluation_id: str) -> Self:
+        evaluation_id_parts = evaluation_id.split(cls._delimiter)
+        if len(evaluation_id_parts) not in (3, 4, 5):
+            raise ValueError(f"An evaluation ID has 3 to 5 parts. Got '{evaluation_id}'.")
+        optional_parts = evaluation_id_parts[3:]
+        reference_fit = bool(optional_parts) and optional_parts[-1] == cls._REFERENCE_FIT_SUFFIX
+        if reference_fit:
+            optional_parts = optional_parts[:-1]
+        if len(optional_parts) > 1 or (optional_parts and not optional_parts[0].startswith(cls._FIDELITY_PREFIX)):
+            raise ValueError(f"An evaluation ID ends with an optional 'F<pct>' and an optional 'RF'. Got '{evaluation_id}'.")
+        return cls(
+            evaluation_method=evaluation_id_parts[0],
+            first_target=evaluation_id_parts[1],
+            second_target=None if evaluation_id_parts[2] == cls._NULL else evaluation_id_parts[2],
+            fidelity_pct=int(optional_parts[0].removeprefix(cls._FIDELITY_PREFIX)) if optional_parts else None,
+            reference_fit=reference_fit,
+        )
+
+    def __str__(self) -> str:
+        return self._string
+
+    def __hash__(self) -> int:
+        return self.hash64
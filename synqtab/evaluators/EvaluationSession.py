@@ -0,0 +1,461 @@
+import threading
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from synqtab.enums import EvaluationTarget
+from synqtab.experiments.Experiment import Experiment
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+# numpy's global random state is shared by all threads of the process; the pipeline also holds it while corrupting
+# (see synqtab.pipeline.NormalPipeline, which generates in separate processes). Reentrant, because an evaluator that holds it may load a
+# target that corrupts the real data (RH), which holds it too.
+GLOBAL_RANDOM_STATE_LOCK = threading.RLock()
+
+# the session of a worker process of EvaluationSession.run(executor='process'); set by the pool initializer
+_WORKER_SESSION = None
+
+
+def _init_worker_session(experiment: Experiment, fidelity: float, random_seed: int, shared_state: Dict[str, Any]) -> None:
+    global _WORKER_SESSION
+    from synqtab.reproducibility import ReproducibleOperations
+
+    ReproducibleOperations.set_random_seed(random_seed)
+    _WORKER_SESSION = EvaluationSession.from_shared_state(experiment, shared_state, fidelity=fidelity)
+
+
+def _compute_in_worker(evaluation) -> dict[str, Any]:
+    return evaluation._compute(session=_WORKER_SESSION)
+
+
+class EvaluationSession():
+    """Prepares the inputs of the evaluations of one experiment exactly once. The real data is fetched and
+    split once, the corruption is applied once, the synthetic data is downloaded once and every
+    (real, synthetic) target pair is encoded once. All evaluations that run within the same session reuse
+    these cached inputs instead of loading, splitting and encoding them again.
+
+    The cached dataframes are shared between evaluators, so evaluators must treat them as read-only.
+    For process pools, `share()` places the cached inputs in shared memory once and `from_shared_state()`
+    maps them read-only in every worker process, instead of pickling a copy of the data per task.
+
+    With a `fidelity` below 1, every evaluation target is replaced by a stratified subsample of that fraction
+    of its rows, e.g., for quick exploratory sweeps. The real validation data is kept whole.
+    """
+
+    def __init__(
+        self,
+        experiment: Experiment,
+        fidelity: float = 1.0,
+        real_split: Optional[tuple[pd.DataFrame, pd.DataFrame]] = None,
+        real_corruption: Optional[tuple[pd.DataFrame, list, list]] = None,
+    ):
+        """
+        Args:
+            experiment (Experiment): the experiment whose evaluations run in this session.
+            fidelity (float, optional): the fraction of rows of each evaluation target. Defaults to 1.0.
+            real_split (tuple[pd.DataFrame, pd.DataFrame], optional): the (training, validation) split of the real
+            perfect data, if it is already computed, e.g., by the split stage of the pipeline. Defaults to None.
+            real_corruption (tuple[pd.DataFrame, list, list], optional): the (corrupted training data, corrupted rows,
+            corrupted columns) of the experiment, if they are already computed, e.g., by the corrupt stage of the
+            pipeline. They are used as the RH target. Defaults to None.
+        """
+        if not 0 < fidelity <= 1:
+            raise ValueError(f"The fidelity must be in (0, 1]. Got {fidelity}.")
+
+        self.experiment = experiment
+        self.fidelity = fidelity
+        self._real_split = real_split
+        self._real_corruption = real_corruption
+        self._is_prepared = False
+        self._target_dfs: Dict[EvaluationTarget, pd.DataFrame] = dict()
+        self._encoded_pairs: Dict[tuple[EvaluationTarget, ...], tuple] = dict()
+        self._real_subsample_positions = None # the rows of R (and RH) that reduced-fidelity evaluations keep
+
+    def _prepare(self) -> None:
+        if self._is_prepared:
+            return
+
+        from synqtab.enums import ProblemType
+        from synqtab.reproducibility import ReproducibleOperations
+
+        dataset = self.experiment.dataset
+        self.target_column_name = dataset.target_feature
+        self.problem_type = ProblemType(dataset.problem_type)
+        if self._real_split is not None:
+            self.training_df, self.validation_df = self._real_split
+        else:
+            real_perfect_df = dataset._fetch_real_perfect_dataframe()
+            self.training_df, self.validation_df = ReproducibleOperations.train_test_split(
+                real_perfect_df, test_size=0.5, stratify=real_perfect_df[self.target_column_name], problem_type=self.problem_type)
+        self.sdmetrics_metadata = dataset.get_sdmetrics_single_table_metadata(columns=list(self.training_df.columns))
+
+        # use the class with the least frequency as minority class. If it is a regression problem, this
+        # EvaluationInput key is not used downstream. So, this implementation targets only classification datasets.
+        self.minority_class = self.validation_df[self.target_column_name].value_counts(sort=True, ascending=True).index[0]
+
+        self._is_prepared = True
+
+    def get_target_data(self, evaluation_target: EvaluationTarget) -> pd.DataFrame:
+        """Returns the data of the evaluation target. The data is computed (or downloaded) only on first access.
+
+        Args:
+            evaluation_target (EvaluationTarget): the evaluation target, e.g., `EvaluationTarget.SH`.
+
+        Returns:
+            pd.DataFrame: the data of the evaluation target.
+        """
+        from synqtab.data import StorageClient
+        from synqtab.enums import DataPerfectness, MinioBucket
+
+        self._prepare()
+        if evaluation_target in self._target_dfs:
+            return self._target_dfs[evaluation_target]
+
+        data = None
+        match evaluation_target:
+            case EvaluationTarget.R:
+                LOG.info("Getting perfect R data from dataset + train test split")
+                data = self.training_df
+
+            case EvaluationTarget.RH:
+                if self.experiment.data_perfectness == DataPerfectness.PERFECT:
+                    raise ValueError(f"Cannot create real corrupted data from a perfect experiment object.")
+
+                if self._real_corruption is not None:
+                    LOG.info("Getting imperfect data from the corruption of the pipeline")
+                    # shared with the generation; the casts below replace the columns of the copy only
+                    data = self._real_corruption[0].copy(deep=False)
+                else:
+                    LOG.info("Getting imperfect data as perfect + corruption")
+                    data_error_instance = self.experiment.data_error.get_class()(row_fraction=self.experiment.data_error_rate)
+                    # the corruption reseeds numpy's global random state, which concurrent generations also use
+                    with GLOBAL_RANDOM_STATE_LOCK:
+                        data, corrupted_rows, corrupted_cols = data_error_instance.corrupt(
+                            data=self.training_df,
+                            categorical_columns=self.experiment.dataset.categorcal_features,
+                            target_column=self.experiment.dataset.target_feature,
+                        )
+                    if self.experiment.data_perfectness == DataPerfectness.SEMIPERFECT:
+                        data.drop(corrupted_rows)
+
+                # the corruption may replace the values of a categorical column, e.g., with placeholders
+                for column in self.experiment.dataset.categorcal_features:
+                    if column in data.columns and not isinstance(data[column].dtype, pd.CategoricalDtype):
+                        data[column] = data[column].astype('category')
+
+            case EvaluationTarget.S:
+                perfect_counterpart_experiment = self.experiment.perfect_counterpart()
+                LOG.info("Getting S data from Synthetic bucket " + perfect_counterpart_experiment.minio_path())
+                data = StorageClient.read_parquet_from_bucket(
+                    bucket_name=MinioBucket.SYNTHETIC,
+                    object_name=perfect_counterpart_experiment.minio_path(),
+                    categorical_columns=self.experiment.dataset.categorcal_features,
+                )
+
+            case EvaluationTarget.SH:
+                data = StorageClient.read_parquet_from_bucket(
+                    bucket_name=MinioBucket.SYNTHETIC,
+                    object_name=self.experiment.minio_path(),
+                    categorical_columns=self.experiment.dataset.categorcal_features,
+                )
+
+            case _ as not_implemented_evaluation_target:
+                raise NotImplementedError(
+                    f"Unknown evaluation target type. Got {not_implemented_evaluation_target}. " +
+                    f"Valid options: {[str(option) for option in EvaluationTarget]}."
+                )
+
+        if self.fidelity < 1:
+            data = self._subsample(data, is_real=evaluation_target in {EvaluationTarget.R, EvaluationTarget.RH})
+
+        self._target_dfs[evaluation_target] = data
+        return data
+
+    def _subsample(self, data: pd.DataFrame, is_real: bool = False) -> pd.DataFrame:
+        """Keeps a `fidelity` fraction of the rows, stratified on the target column when possible. The real targets
+        (`R` and `RH`) keep the same row positions, which are stratified on the target column of `R`, so that a
+        corruption of the target column does not change which rows are kept."""
+        import numpy as np
+        from synqtab.reproducibility import ReproducibleOperations
+
+        def get_positions(stratify_data: pd.DataFrame) -> np.ndarray:
+            positions = pd.DataFrame({'position': np.arange(len(stratify_data))})
+            stratify = stratify_data[self.target_column_name] if self.target_column_name in stratify_data else None
+            try:
+                subsample, _ = ReproducibleOperations.train_test_split(
+                    positions, train_size=self.fidelity, stratify=stratify, problem_type=self.problem_type)
+            except ValueError:
+                # e.g., a class with a single row cannot be stratified
+                subsample, _ = ReproducibleOperations.train_test_split(
+                    positions, train_size=self.fidelity, problem_type=self.problem_type)
+            return subsample['position'].to_numpy()
+
+        if is_real and len(data) == len(self.training_df):
+            if self._real_subsample_positions is None:
+                self._real_subsample_positions = get_positions(self.training_df)
+            return data.iloc[self._real_subsample_positions]
+        return data.iloc[get_positions(data)]
+
+    def get_data_id(self, evaluation_target: EvaluationTarget) -> str:
+        """Returns an identifier of the data of the evaluation target that stays the same across all experiments
+        that share this data, e.g., '<dataset_name>/<random_seed>' for the perfect real data `R`, and
+        '<dataset_name>/<random_seed>/<perfectness>/<error>/<rate>' for the corrupted real data `RH`, which does not
+        depend on the generator.
+        """
+        from synqtab.enums import MinioFolder
+        from synqtab.reproducibility import ReproducibleOperations
+
+        real_data_id = MinioFolder.create_prefix(
+            self.experiment.dataset.dataset_name, ReproducibleOperations.get_current_random_seed()
+        )
+        match evaluation_target:
+            case EvaluationTarget.R:
+                return real_data_id
+            case EvaluationTarget.RH:
+                return MinioFolder.create_prefix(
+                    real_data_id,
+                    str(self.experiment.data_perfectness),
+                    str(self.experiment.data_error),
+                    int(self.experiment.data_error_rate * 100),
+                )
+            case EvaluationTarget.S:
+                return MinioFolder.create_prefix(str(self.experiment.perfect_counterpart()), str(evaluation_target))
+            case _:
+                return MinioFolder.create_prefix(str(self.experiment), str(evaluation_target))
+
+    def get_baseline_id(self, evaluation_target: EvaluationTarget) -> Optional[str]:
+        """Returns the identifier under which ML evaluators store the baseline they train on the evaluation target,
+        or None for the synthetic data `SH`, which belongs to a single experiment, so its baseline is never reused."""
+        from synqtab.enums import MinioFolder
+
+        if evaluation_target == EvaluationTarget.SH:
+            return None
+        data_id = self.get_data_id(evaluation_target)
+        return data_id if self.fidelity == 1 else MinioFolder.create_prefix(data_id, f"fidelity_{self.fidelity}")
+
+    def get_encoded_pair(self, first_target: EvaluationTarget, second_target: EvaluationTarget) -> tuple:
+        """Returns the numeric encoding of a (real, synthetic) target pair, as used by SDMetrics' detection
+        metrics. The encoding is fitted on the first target and computed only once per pair.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: the encoded first and second target.
+        """
+        from synqtab.utils.detection_utils import encode_for_detection
+
+        evaluation_targets = (first_target, second_target)
+        if evaluation_targets not in self._encoded_pairs:
+            LOG.info(f"Encoding the {first_target}-{second_target} pair of experiment {str(self.experiment)}")
+            self._encoded_pairs[evaluation_targets] = encode_for_detection(
+                real_data=self.get_target_data(first_target),
+                synthetic_data=self.get_target_data(second_target),
+                metadata=self.sdmetrics_metadata,
+            )
+        return self._encoded_pairs[evaluation_targets]
+
+    def build_params(
+        self, *evaluation_targets: EvaluationTarget, params: Optional[Dict[str, Any]] = None, encode: bool = False
+    ) -> Dict[str, Any]:
+        """Builds the evaluator parameters for the given evaluation targets from the cached inputs.
+
+        Args:
+            evaluation_targets (EvaluationTarget): one target for singular evaluators, two for dual ones.
+            params (Dict[str, Any], optional): the parameters of the evaluation task. Defaults to None.
+            encode (bool, optional): whether to include the encoding of the (real, synthetic) target pair.
+            Defaults to False.
+
+        Returns:
+            Dict[str, Any]: the parameters to initialize an evaluator with.
+        """
+        from synqtab.enums import EvaluationInput
+
+        params = params if params is not None else dict()
+        self._prepare()
+        evaluation_target_dfs = [self.get_target_data(evaluation_target) for evaluation_target in evaluation_targets]
+
+        return {
+            str(EvaluationInput.PROBLEM_TYPE): str(self.problem_type),
+            str(EvaluationInput.METADATA): self.sdmetrics_metadata,
+            str(EvaluationInput.REAL_VALIDATION_DATA): self.validation_df,
+            str(EvaluationInput.NOTES): True,
+            str(EvaluationInput.PREDICTION_COLUMN_NAME): self.target_column_name,
+            str(EvaluationInput.KNOWN_COLUMN_NAMES): params.get(str(EvaluationInput.KNOWN_COLUMN_NAMES), list(self.training_df.columns)),
+            str(EvaluationInput.SENSITIVE_COLUMN_NAMES): params.get(str(EvaluationInput.SENSITIVE_COLUMN_NAMES), []),
+            str(EvaluationInput.REAL_TRAINING_DATA): evaluation_target_dfs[0], # used by dual evaluators
+            str(EvaluationInput.DATA): evaluation_target_dfs[0],               # used by singular evaluators
+            str(EvaluationInput.SYNTHETIC_DATA): evaluation_target_dfs[1] if len(evaluation_target_dfs) > 1 else None,
+            str(EvaluationInput.MINORITY_CLASS_LABEL): self.minority_class,
+            # singular outlier evaluators may score every target against one model fitted on R for this (dataset, seed)
+            str(EvaluationInput.REFERENCE_FIT): params.get(str(EvaluationInput.REFERENCE_FIT), False),
+            str(EvaluationInput.REFERENCE_DATA): self.training_df,
+            str(EvaluationInput.REFERENCE_ID): self.get_data_id(EvaluationTarget.R),
+            # ML evaluators may reuse the baseline they trained on the same first target, e.g., on R for this (dataset, seed)
+            str(EvaluationInput.BASELINE_ID): self.get_baseline_id(evaluation_targets[0]),
+            # dual evaluators may reuse the encoding of the pair instead of re-encoding it themselves
+            str(EvaluationInput.ENCODED_DATA): (
+                self.get_encoded_pair(*evaluation_targets) if encode and len(evaluation_targets) > 1 else None
+            ),
+        }
+
+    def share(self) -> Dict[str, Any]:
+        """Places the cached inputs of the session in shared memory. The returned state holds only small,
+        picklable handles; pass it to `from_shared_state()` in other processes. The caller owns the shared
+        memory and must release it with `unshare()`.
+
+        Returns:
+            Dict[str, Any]: the shared state of the session.
+        """
+        from synqtab.data.SharedDataFrame import SharedArray, SharedDataFrame
+
+        self._prepare()
+        return {
+            'training_df': SharedDataFrame.from_dataframe(self.training_df, name='training'),
+            'validation_df': SharedDataFrame.from_dataframe(self.validation_df, name='validation'),
+            'target_dfs': {
+                evaluation_target: SharedDataFrame.from_dataframe(data, name=str(evaluation_target))
+                for evaluation_target, data in self._target_dfs.items()
+            },
+            'encoded_pairs': {
+                evaluation_targets: tuple(
+                    SharedArray.from_array(encoded_data, name='-'.join(map(str, evaluation_targets)))
+                    for encoded_data in encoded_pair
+                )
+                for evaluation_targets, encoded_pair in self._encoded_pairs.items()
+            },
+            'target_column_name': self.target_column_name,
+            'problem_type': self.problem_type,
+            'sdmetrics_metadata': self.sdmetrics_metadata,
+            'minority_class': self.minority_class,
+        }
+
+    @staticmethod
+    def unshare(shared_state: Dict[str, Any]) -> None:
+        """Releases the shared memory of a state returned by `share()`."""
+        shared_state['training_df'].unlink()
+        shared_state['validation_df'].unlink()
+        for shared_df in shared_state['target_dfs'].values():
+            shared_df.unlink()
+        for shared_pair in shared_state['encoded_pairs'].values():
+            for shared_array in shared_pair:
+                shared_array.unlink()
+
+    @classmethod
+    def from_shared_state(cls, experiment: Experiment, shared_state: Dict[str, Any], fidelity: float = 1.0):
+        """Rebuilds a prepared session from a state returned by `share()`, e.g., in a worker process. The data
+        is memory-mapped, not copied, so it is read-only. Targets that were not shared are loaded on first access.
+        """
+        session = cls(experiment, fidelity=fidelity)
+        session.training_df = shared_state['training_df'].to_pandas()
+        session.validation_df = shared_state['validation_df'].to_pandas()
+        session.target_column_name = shared_state['target_column_name']
+        session.problem_type = shared_state['problem_type']
+        session.sdmetrics_metadata = shared_state['sdmetrics_metadata']
+        session.minority_class = shared_state['minority_class']
+        session._target_dfs = {
+            evaluation_target: shared_df.to_pandas() for evaluation_target, shared_df in shared_state['target_dfs'].items()
+        }
+        session._encoded_pairs = {
+            evaluation_targets: tuple(shared_array.to_numpy() for shared_array in shared_pair)
+            for evaluation_targets, shared_pair in shared_state['encoded_pairs'].items()
+        }
+        session._is_prepared = True
+        return session
+
+    def _compute(self, evaluation) -> dict[str, Any]:
+        from synqtab.enums import GLOBAL_RANDOM_STATE_EVALUATORS
+
+        if evaluation.evaluation_method in GLOBAL_RANDOM_STATE_EVALUATORS:
+            with GLOBAL_RANDOM_STATE_LOCK:
+                return evaluation._compute(session=self)
+        return evaluation._compute(session=self)
+
+    def run(
+        self, *evaluations, force: bool = False, max_workers: Optional[int] = 1, executor: str = 'thread'
+    ) -> list:
+        """Runs the evaluations of this session's experiment on a pool that shares the cached inputs,
+        and writes all their results to Postgres in one transaction. The inputs are loaded before the fan-out,
+        so every target is loaded, split, corrupted or downloaded exactly once. A failing evaluation is logged
+        and does not stop the rest.
+
+        With `executor='process'`, the inputs are placed in shared memory once and every worker process maps
+        them read-only, which sidesteps the GIL for CPU-bound evaluators without copying the data per task.
+
+        Args:
+            evaluations (Evaluation): the evaluations to run. They must belong to the session's experiment.
+            force (bool, optional): whether to re-compute evaluations that already exist. Defaults to False.
+            max_workers (int, optional): the number of workers. None lets the executor decide. Defaults to 1.
+            executor (str, optional): 'thread' or 'process'. Defaults to 'thread'.
+
+        Returns:
+            list: the evaluations that failed.
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+        from synqtab.data import ResultsClient
+        from synqtab.enums import ENCODED_INPUT_EVALUATORS
+        from synqtab.reproducibility import ReproducibleOperations
+
+        if executor not in {'thread', 'process'}:
+            raise ValueError(f"Unknown executor. Got {executor}. Valid options: ['thread', 'process'].")
+
+        for evaluation in evaluations:
+            if str(evaluation.experiment) != str(self.experiment):
+                raise ValueError(
+                    f"Evaluation {str(evaluation)} belongs to experiment {str(evaluation.experiment)}, " +
+                    f"not to the session's experiment {str(self.experiment)}."
+                )
+
+        failed_evaluations = []
+        evaluations_to_compute = []
+        for evaluation in evaluations:
+            if evaluation._skip(force=force):
+                continue
+            try:
+                # warm up the caches in this thread, so that the workers only read them
+                for evaluation_target in evaluation.evaluation_targets:
+                    self.get_target_data(evaluation_target)
+                if evaluation.evaluation_method in ENCODED_INPUT_EVALUATORS and len(evaluation.evaluation_targets) > 1:
+                    self.get_encoded_pair(*evaluation.evaluation_targets)
+                evaluations_to_compute.append(evaluation)
+            except Exception as e:
+                LOG.error(
+                    f"Preparing evaluation {str(evaluation)}/{str(self.experiment)} failed but I will continue to the next one. Error: {e}",
+                    extra={'experiment_id': str(self.experiment)}
+                )
+                failed_evaluations.append(evaluation)
+
+        shared_state = None
+        if executor == 'process':
+            shared_state = self.share()
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_session,
+                initargs=(self.experiment, self.fidelity, ReproducibleOperations.get_current_random_seed(), shared_state),
+            )
+            compute = _compute_in_worker
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+            compute = self._compute
+
+        evaluation_results = []
+        try:
+            with pool:
+                futures = {pool.submit(compute, evaluation): evaluation for evaluation in evaluations_to_compute}
+                for future in as_completed(futures):
+                    evaluation = futures[future]
+                    try:
+                        evaluation_results.append(future.result())
+                    except Exception as e:
+                        LOG.error(
+                            f"Evaluation {str(evaluation)}/{str(self.experiment)} failed but I will continue to the next one. Error: {e}",
+                            extra={'experiment_id': str(self.experiment)}
+                        )
+                        failed_evaluations.append(evaluation)
+        finally:
+            if shared_state is not None:
+                self.unshare(shared_state)
+
+        ResultsClient.write_evaluation_results(evaluation_results)
+        return failed_evaluations
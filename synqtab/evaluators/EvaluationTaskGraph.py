@@ -0,0 +1,54 @@
+from typing import Any, Dict, Optional
+
+from synqtab.experiments.Experiment import Experiment
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class EvaluationTaskGraph():
+    """The deduplicated evaluation tasks of a set of experiments.
+
+    Every valid evaluation is one node, identified by '<evaluation_id>/<experiment_id>'. The perfect baselines,
+    i.e., the R-S evaluations, are the same for every data error and error rate of a (dataset, seed, generator),
+    so they are attached to the perfect experiment: they become one node, shared by all the non-perfect
+    experiments of the (dataset, seed, generator). Baselines that older runs wrote under a non-perfect experiment are
+    moved to the perfect one by `python -m synqtab.utils.move_perfect_baselines`. Adding an experiment creates only the nodes that are not in the
+    graph yet, so the redundant baselines are never constructed, published or skipped.
+
+    Example:
+        task_graph = EvaluationTaskGraph()
+        for experiment in experiments:
+            experiment.run().publish_tasks(task_graph=task_graph)
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Any] = dict() # node ID -> Evaluation
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_experiment(
+        self, experiment: Experiment, params: Optional[Dict[str, Any]] = None, fidelity: float = 1.0
+    ) -> list:
+        """Expands the evaluations of the experiment and of its perfect baselines into the graph.
+
+        Returns:
+            list[Evaluation]: the evaluations that were not in the graph yet.
+        """
+        evaluations = experiment._get_evaluations(params=params, fidelity=fidelity)
+        if experiment.data_error is not None:
+            evaluations += experiment._get_perfect_baseline_evaluations(params=params, fidelity=fidelity)
+
+        new_evaluations = []
+        for evaluation in evaluations:
+            node_id = evaluation.node_id()
+            if node_id in self.nodes or not evaluation._is_valid(): # e.g., an R2 evaluation on a classification dataset
+                continue
+            self.nodes[node_id] = evaluation
+            new_evaluations.append(evaluation)
+        return new_evaluations
@@ -16,6 +16,7 @@ class Evaluator(ABC):
     
     def __init__(self, params: dict):
         self.params = params
+        self.artifacts = dict()
     
     @abstractmethod
     def short_name(self) -> str:
@@ -37,6 +38,41 @@ class Evaluator(ABC):
     def prepare_evaluation(self) -> None:
         pass
     
+    def register_artifact(self, name: str, values, dtype: str = 'float32') -> dict:
+        """Registers a large array output (e.g., one value per row) as an artifact. Artifacts are stored
+        as NPY objects in MinIO instead of the notes, which only keep the object key and the summary statistics.
+        Use the returned dictionary as the value of `name` in your notes.
+
+        Args:
+            name (str): the name of the artifact, e.g., 'outlier_scores'. Must be unique per evaluator.
+            values (array-like): the values of the artifact.
+            dtype (str, optional): the dtype to store the values with. Defaults to 'float32'.
+
+        Returns:
+            dict: summary statistics of the values.
+        """
+        import numpy as np
+        
+        values = np.asarray(values).astype(dtype).ravel()
+        self.artifacts[name] = values
+        
+        if values.size == 0:
+            return {'count': 0}
+        
+        q05, q25, q50, q75, q95 = np.quantile(values, [0.05, 0.25, 0.5, 0.75, 0.95]).tolist()
+        return {
+            'count': int(values.size),
+            'mean': float(values.mean()),
+            'std': float(values.std()),
+            'min': float(values.min()),
+            'q05': q05,
+            'q25': q25,
+            'median': q50,
+            'q75': q75,
+            'q95': q95,
+            'max': float(values.max()),
+        }
+    
     def compute_result(self) -> tuple[int | float, dict | None]:
         """Performs the actual evaluation and returns a tuple.
         The first element of the tuple is required and corresponds to the numeric result.
@@ -55,9 +91,9 @@ class Evaluator(ABC):
     def _standardize_evaluation_result(self, evaluation_result: EvaluationResult) -> dict:
         from synqtab.enums import EvaluationOutput
         
+        standardized_result = {EvaluationOutput.RESULT: evaluation_result.result}
         if evaluation_result.notes:
-            return {
-                EvaluationOutput.RESULT: evaluation_result.result,
-                EvaluationOutput.NOTES: evaluation_result.notes,
-            }
-        return {EvaluationOutput.RESULT: evaluation_result.result}
+            standardized_result[EvaluationOutput.NOTES] = evaluation_result.notes
+        if self.artifacts:
+            standardized_result[EvaluationOutput.ARTIFACTS] = self.artifacts
+        return standardized_result
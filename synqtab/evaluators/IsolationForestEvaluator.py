@@ -9,37 +9,63 @@ class IsolationForestEvaluator(Evaluator):
         model. If absent, defaults to 100. See the original implementation for details.
         - [*optional*] `'contamination'`: the amount of contamination of the dat set. 
         If absent, defaults to 'auto'. See the original implementation for details.
+        - [*optional*] `'reference_fit'`: True/False on whether to score `'data'` with a model fitted once
+        on `'reference_data'` instead of fitting a new model on `'data'`. If absent, defaults to False.
+        - [*optional*] `'reference_data'`: the data to fit the reference model on, e.g., the real perfect data.
+        Required if `'reference_fit'` is True.
+        - [*optional*] `'reference_id'`: the identifier under which the reference model is persisted, e.g.,
+        `'<dataset_name>/<random_seed>'`. Required if `'reference_fit'` is True.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
-    
+
     def short_name(self):
         from synqtab.enums import EvaluationMethod
         return str(EvaluationMethod.IFO)
-    
+
     def full_name(self):
         return "Isolation Forest Outlier Detection"
 
-    def compute_result(self):
+    def _fit_model(self, data):
         from synqtab.reproducibility import ReproducibleOperations
-        
-        data = self.params.get('data')
-        data = handle_categorical(data, method = 'onehot')
+
         iso_forest = ReproducibleOperations.get_isolation_forest_model(
             n_estimators=self.params.get('n_estimators', 100),
             contamination=self.params.get('contamination', 'auto'),
         )
-
-        # Fit and predict (-1 for outliers, 1 for inliers)
-        predictions = iso_forest.fit_predict(data)
+        iso_forest.fit(data)
 
         # Get anomaly scores (more negative = more outlier-like)
-        scores = iso_forest.score_samples(data)
+        return iso_forest, iso_forest.score_samples(data)
+
+    def compute_result(self):
+        from synqtab.utils.outlier_utils import (
+            get_or_fit_reference_model, score_with_reference_model, threshold_outlier_scores
+        )
+
+        data = self.params.get('data')
+        if self.params.get('reference_fit', False):
+            reference_data = self.params.get('reference_data')
+            reference_model = get_or_fit_reference_model(
+                evaluation_method=self.short_name(),
+                reference_id=self.params.get('reference_id'),
+                reference_data=reference_data,
+                fit_model=self._fit_model,
+            )
+            predictions, scores = score_with_reference_model(
+                reference_model, data, is_reference_data=(data is reference_data or data.equals(reference_data))
+            )
+        else:
+            iso_forest, scores = self._fit_model(handle_categorical(data, method = 'onehot'))
+            # Predict from the scores (-1 for outliers, 1 for inliers); same as predict() without scoring twice
+            predictions = threshold_outlier_scores(scores, iso_forest.offset_)
+
         nof_outliers = int((predictions == -1).sum())
-        
+
         if self.params.get('notes', False):
+            # per-row arrays are stored as artifacts; the notes only keep their summary and object key
             return nof_outliers, {
-                'predictions': predictions.tolist(),
-                'outlier_scores': scores.tolist(),
+                'predictions': self.register_artifact('predictions', predictions, dtype='int8'),
+                'outlier_scores': self.register_artifact('outlier_scores', scores),
             }
         return nof_outliers
@@ -9,42 +9,71 @@ class LofEvaluator(Evaluator):
         model. If absent, defaults to 5. See the original implementation for details.
         - [*optional*] `'contamination'`: the amount of contamination of the dat set. 
         If absent, defaults to 'auto'. See the original implementation for details.
+        - [*optional*] `'reference_fit'`: True/False on whether to score `'data'` with a model fitted once
+        on `'reference_data'` (in novelty mode) instead of fitting a new model on `'data'`. If absent, defaults to False.
+        - [*optional*] `'reference_data'`: the data to fit the reference model on, e.g., the real perfect data.
+        Required if `'reference_fit'` is True.
+        - [*optional*] `'reference_id'`: the identifier under which the reference model is persisted, e.g.,
+        `'<dataset_name>/<random_seed>'`. Required if `'reference_fit'` is True.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
     def __init__(self, params):
         self.n_neighbors = 5
         self.contamination = 'auto'
-        self.params = params
-        
+        super().__init__(params)
+
     def short_name(self):
         from synqtab.enums import EvaluationMethod
         return str(EvaluationMethod.LOF)
-    
+
     def full_name(self):
         return "Local Outlier Factor Outlier Detection"
-        
-    def compute_result(self):
+
+    def _fit_model(self, data, novelty: bool = False):
         from sklearn.neighbors import LocalOutlierFactor
-        
-        data = self.params.get('data')
-        data = handle_categorical(data, method= 'onehot')
+
         lof = LocalOutlierFactor(
             n_neighbors=self.params.get('n_neighbors', 20),
             contamination=self.params.get('contamination', 'auto'),
             metric='euclidean',
+            novelty=novelty,
             n_jobs=-1,
         )
-        # Fit and predict (-1 for outliers, 1 for inliers)
-        predictions = lof.fit_predict(data)
+        lof.fit(data)
+
+        # Get the negative outlier factor scores of the training data
+        return lof, lof.negative_outlier_factor_
+
+    def compute_result(self):
+        from synqtab.utils.outlier_utils import (
+            get_or_fit_reference_model, score_with_reference_model, threshold_outlier_scores
+        )
+
+        data = self.params.get('data')
+        if self.params.get('reference_fit', False):
+            reference_data = self.params.get('reference_data')
+            reference_model = get_or_fit_reference_model(
+                evaluation_method=self.short_name(),
+                reference_id=self.params.get('reference_id'),
+                reference_data=reference_data,
+                # novelty mode is required to score data other than the training data
+                fit_model=lambda encoded_data: self._fit_model(encoded_data, novelty=True),
+            )
+            predictions, scores = score_with_reference_model(
+                reference_model, data, is_reference_data=(data is reference_data or data.equals(reference_data))
+            )
+        else:
+            lof, scores = self._fit_model(handle_categorical(data, method= 'onehot'))
+            # Predict from the scores (-1 for outliers, 1 for inliers); same as fit_predict()
+            predictions = threshold_outlier_scores(scores, lof.offset_)
 
-        # Get the negative outlier factor scores
-        scores = lof.negative_outlier_factor_
         nof_outliers = int((predictions == -1).sum())
-        
+
         if self.params.get('notes', False):
+            # per-row arrays are stored as artifacts; the notes only keep their summary and object key
             return nof_outliers, {
-                'predictions': predictions.tolist(),
-                'outlier_scores': scores.tolist(),
+                'predictions': self.register_artifact('predictions', predictions, dtype='int8'),
+                'outlier_scores': self.register_artifact('outlier_scores', scores),
             }
         return nof_outliers
@@ -11,6 +11,8 @@ class MLAugmentationRecall(Evaluator):
         - [*required*] `'metadata'`: sdmetrics metadata; See 
         https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
         - [*required*] `'prediction_column_name'`: the name of the target column
+        - [*optional*] `'baseline_id'`: the identifier of the real training data, e.g., `'<dataset_name>/<random_seed>'`.
+        If present, the real data baseline is trained once per identifier and then reused.
         - [*optional*] `'notes'`: True/False on whether to include notes in the result or not.
         If absent, defaults to False.
     """
@@ -29,14 +31,19 @@ class MLAugmentationRecall(Evaluator):
     
     def compute_result(self):
         from sdmetrics.single_table.data_augmentation import BinaryClassifierRecallEfficacy
+        from synqtab.utils.baseline_utils import compute_augmentation_breakdown
         
-        score = BinaryClassifierRecallEfficacy.compute_breakdown(
+        # same as BinaryClassifierRecallEfficacy.compute_breakdown(), but the real data baseline is trained once per 'baseline_id'
+        score = compute_augmentation_breakdown(
+            metric=BinaryClassifierRecallEfficacy,
             real_training_data=self.params.get('real_training_data'),
             synthetic_data=self.params.get('synthetic_data'),
             real_validation_data=self.params.get('real_validation_data'),
             minority_class_label=self.params.get('minority_class_label'),
             metadata=self.params.get('metadata'),
             prediction_column_name=self.params.get('prediction_column_name'),
+            evaluation_method=self.short_name(),
+            baseline_id=self.params.get('baseline_id'),
         )
         if self.params.get('notes', False):
             return score['score'], {
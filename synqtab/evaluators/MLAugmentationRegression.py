@@ -7,6 +7,10 @@ class MLAugmentationRegression(Evaluator):
         - [*required*] `'synthetic_data'`: the synthetic data generated by the generator
         - [*required*] `'prediction_column_name'`: the name of the target column
         - [*required*] `'real_validation_data'`: the data to use for validation (unseen by the generator)
+        - [*optional*] `'learner'`: 'random_forest' or 'hist_gradient_boosting' (much faster on large tables).
+        If absent, defaults to 'random_forest'.
+        - [*optional*] `'baseline_id'`: the identifier of the real training data, e.g., `'<dataset_name>/<random_seed>'`.
+        If present, the validation metrics of the baseline model are computed once per identifier and learner and then reused.
         - [*optional*] `'notes'`: True/False on whether  to include notes in the result or not.
         If absent, defaults to False.
     """
@@ -23,45 +27,62 @@ class MLAugmentationRegression(Evaluator):
         
         return dataset.problem_type == str(ProblemType.REGRESSION)
         
+    def _get_model(self):
+        from synqtab.reproducibility import ReproducibleOperations
+        
+        learner = self.params.get('learner', 'random_forest')
+        match learner:
+            case 'random_forest':
+                return ReproducibleOperations.get_random_forest_regressor()
+            case 'hist_gradient_boosting':
+                return ReproducibleOperations.get_hist_gradient_boosting_regressor()
+            case _:
+                raise ValueError(f"Unknown learner '{learner}'. Valid options: 'random_forest', 'hist_gradient_boosting'.")
+    
+    def _fit_and_validate(self, training_data, validation_data) -> dict:
+        from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
+        
+        prediction_column_name = self.params.get('prediction_column_name')
+        model = self._get_model()
+        model.fit(training_data.drop(columns=[prediction_column_name]), training_data[prediction_column_name])
+        
+        y_val = validation_data[prediction_column_name]
+        y_pred = model.predict(validation_data.drop(columns=[prediction_column_name]))
+        return {
+            'metrics': {
+                'r2': r2_score(y_val, y_pred),
+                'mse': mean_squared_error(y_val, y_pred),
+                'mae': mean_absolute_error(y_val, y_pred),
+            }
+        }
+    
     def compute_result(self):
         import pandas as pd
-        from sklearn.metrics import r2_score, mean_squared_error, mean_absolute_error
-        from synqtab.reproducibility import ReproducibleOperations
+        from synqtab.enums import MinioFolder
+        from synqtab.utils.baseline_utils import get_or_fit_baseline
         
         real_training_data = self.params.get('real_training_data')
         synthetic_data = self.params.get('synthetic_data')
-        prediction_column_name = self.params.get('prediction_column_name')
         real_validation_data = self.params.get('real_validation_data')
         
         # Custom implementation for regression data augmentation
-        # Train on real data only (baseline)
-        X_real = real_training_data.drop(columns=[prediction_column_name])
-        y_real = real_training_data[prediction_column_name]
-
-        # Train on augmented data (real + synthetic)
-        augmented_data = pd.concat([real_training_data, synthetic_data], ignore_index=True)
-        X_augmented = augmented_data.drop(columns=[prediction_column_name])
-        y_augmented = augmented_data[prediction_column_name]
-
-        # Validation data
-        X_val = real_validation_data.drop(columns=[prediction_column_name])
-        y_val = real_validation_data[prediction_column_name]
-
-        # Train baseline model (real data only)
-        baseline_model = ReproducibleOperations.get_random_forest_regressor()
-        baseline_model.fit(X_real, y_real)
-        baseline_pred = baseline_model.predict(X_val)
-        baseline_r2 = r2_score(y_val, baseline_pred)
-        baseline_mse = mean_squared_error(y_val, baseline_pred)
-        baseline_mae = mean_absolute_error(y_val, baseline_pred)
+        # Train on real data only (baseline); it only depends on the real data, so it is reused when possible
+        fit_baseline = lambda: self._fit_and_validate(real_training_data, real_validation_data)
+        baseline_id = self.params.get('baseline_id')
+        if baseline_id:
+            baseline = get_or_fit_baseline(
+                evaluation_method=self.short_name(),
+                baseline_id=MinioFolder.create_prefix(baseline_id, self.params.get('learner', 'random_forest')),
+                fit_baseline=fit_baseline,
+            )
+        else:
+            baseline = fit_baseline()
+        baseline_r2, baseline_mse, baseline_mae = (baseline['metrics'][metric] for metric in ('r2', 'mse', 'mae'))
 
         # Train augmented model (real + synthetic data)
-        augmented_model = ReproducibleOperations.get_random_forest_regressor()
-        augmented_model.fit(X_augmented, y_augmented)
-        augmented_pred = augmented_model.predict(X_val)
-        augmented_r2 = r2_score(y_val, augmented_pred)
-        augmented_mse = mean_squared_error(y_val, augmented_pred)
-        augmented_mae = mean_absolute_error(y_val, augmented_pred)
+        augmented_data = pd.concat([real_training_data, synthetic_data], ignore_index=True)
+        augmented = self._fit_and_validate(augmented_data, real_validation_data)
+        augmented_r2, augmented_mse, augmented_mae = (augmented['metrics'][metric] for metric in ('r2', 'mse', 'mae'))
 
         # Compute improvement score (normalized between 0 and 1)
         # Higher R2 is better, so positive improvement is good
@@ -1,7 +1,6 @@
 from enum import Enum
 import pandas as pd
 
-from synqtab.datasets import Dataset  #TODO MIGRATE TO DATA.DATASET
 from synqtab.evaluators.Evaluator import Evaluator
 
 
@@ -90,6 +89,8 @@ class MLEfficacy(Evaluator):
         return score, None
 
 if __name__ == "__main__":
+    from synqtab.datasets import Dataset  #TODO MIGRATE TO DATA.DATASET
+
     # Example usage
     prior_config = Dataset(dataset_name="blood-transfusion-service-center",
                     mode="minio")
@@ -8,7 +8,7 @@ LOG = get_logger(__file__)
 class NormalEvaluation(Evaluation):
     
     def _run(self):
-        from synqtab.data import PostgresClient
+        from synqtab.data import ResultsClient
         from synqtab.enums import ProblemType, DataPerfectness, EvaluationInput
         from synqtab.mappings.mappings import EVALUATION_METHOD_TO_EVALUATION_CLASS
         from synqtab.reproducibility import ReproducibleOperations
@@ -62,7 +62,7 @@ class NormalEvaluation(Evaluation):
         )
         
         import json
-        PostgresClient.write_evaluation_result(
+        ResultsClient.write_evaluation_result(
             evaluation_id=str(self),
             first_target=str(self.evaluation_targets[0]),
             second_target=str(self.evaluation_targets[1]) if len(self.evaluation_targets) > 1 else None,
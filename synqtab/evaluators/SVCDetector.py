@@ -8,6 +8,8 @@ class SVCDetector(Evaluator):
         - [*required*] `'synthetic_data'`: the synthetic data generated by the generator
         - [*required*] `'metadata'`: sdmetrics metadata; See 
         https://docs.sdv.dev/sdmetrics/getting-started/metadata/single-table-metadata
+        - [*optional*] `'encoded_data'`: the (real, synthetic) pair already encoded as SDMetrics would encode it, e.g.,
+        by `EvaluationSession`. If present, the detection is computed on it directly instead of re-encoding the data.
     """
     
     def short_name(self):
@@ -24,6 +26,15 @@ class SVCDetector(Evaluator):
         # Important, otherwise SDMetric's operation returns different results every time
         ReproducibleOperations.seed_everything()
         
+        encoded_data = self.params.get('encoded_data')
+        if encoded_data is not None:
+            from sklearn.svm import SVC
+            from synqtab.utils.detection_utils import compute_detection_score
+            
+            # same classifier and cross-validation as SDMetrics' SVCDetection, without encoding the data again
+            score = compute_detection_score(*encoded_data, get_classifier=lambda: SVC(probability=True, gamma='scale'))
+            return score, dict()
+        
         result = SVCDetection.compute_breakdown(
             real_data=self.params.get('real_training_data'),
             synthetic_data=self.params.get('synthetic_data'),
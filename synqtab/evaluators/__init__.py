@@ -6,6 +6,9 @@ from .DCREvaluator import DCREvaluator
 from .DesbordanteFDs import DesbordanteFDs
 from .DisclosureProtectionEvaluator import DisclosureProtectionEvaluator
 from .Evaluation import Evaluation
+from .EvaluationKey import EvaluationKey
+from .EvaluationSession import EvaluationSession
+from .EvaluationTaskGraph import EvaluationTaskGraph
 from .Evaluator import Evaluator
 from .HyFD import HyFD
 from .IsolationForestEvaluator import IsolationForestEvaluator
@@ -24,6 +27,9 @@ __all__ = [
     'DesbordanteFDs',
     'DisclosureProtectionEvaluator',
     'Evaluation',
+    'EvaluationKey',
+    'EvaluationSession',
+    'EvaluationTaskGraph',
     'Evaluator',
     'HyFD',
     'IsolationForestEvaluator',
@@ -6,6 +6,7 @@ from synqtab.enums import (
     DataPerfectness, DataErrorType,
     EvaluationMethod, GeneratorModel
 )
+from synqtab.experiments.ExperimentKey import ExperimentKey
 from synqtab.utils import get_logger
 
 
@@ -17,7 +18,6 @@ import logging
 
 class Experiment(ABC):
     
-    _delimiter: str = '#'
     _NULL: str = 'NULL'
 
     def __init__(
@@ -38,6 +38,8 @@ class Experiment(ABC):
         self.evaluators = evaluation_methods
         self.options = options
         
+        self._key = None # see the `key` property
+        self._key_fields = None
         self._should_compute = (not self._exists_in_postgres())
         
         self.training_X = None
@@ -59,28 +61,45 @@ class Experiment(ABC):
         pass
     
     @abstractmethod
-    def _publish_tasks(self) -> Self:
+    def _publish_tasks(self, task_graph=None) -> Self:
         """
         Perform the actual publishing of tasks and any writing operations to Postgres and/or MinIO.
         All validations have been verified before reaching this function,
         so you can freely assume that the publishing must be performed.
+        Tasks that are already in the `task_graph` (an `EvaluationTaskGraph`), if given, are not published again.
         """
         pass
     
-    # IMPORTANT: Keep this method aligned with the from_str() method!
-    def _get_experiment_id_parts(self):
+    @property
+    def key(self) -> ExperimentKey:
+        """The identity of the experiment. It is cached until one of its fields changes, e.g., the process-wide
+        random seed, or the data error of a `perfect_counterpart()`."""
         from synqtab.reproducibility.ReproducibleOperations import ReproducibleOperations
-        return [
-            str(self.short_name()),  # Experiment shortname, e.g., 'NOR' for Normal Experiment
-            str(self.dataset.dataset_name),  # Dataset name, e.g., 'anneal'
-            str(ReproducibleOperations.get_current_random_seed()),  # Random seed
-            str(self.data_perfectness), # Data perfectness level, e.g., 'PERF' for perfect
-            str(self.data_error) if self.data_error else self._NULL,    # Data error type, e.g., 'OUT' for outliers
-            str(int(self.data_error_rate * 100)) if self.data_error_rate else self._NULL, # Data error rate multiplied by 100, e.g., 0.2 -> 20 -> '20'
-            str(self.generator),   # Generator type, e.g., 'tabpfn' 
-        ]
+        
+        key_fields = (
+            self.dataset.dataset_name,
+            ReproducibleOperations.get_current_random_seed(),
+            self.data_perfectness,
+            self.data_error,
+            self.data_error_rate,
+            self.generator,
+        )
+        if self._key is None or self._key_fields != key_fields:
+            self._key = ExperimentKey(
+                experiment_type=str(self.short_name()),  # Experiment shortname, e.g., 'NOR' for Normal Experiment
+                dataset_name=str(self.dataset.dataset_name),  # Dataset name, e.g., 'anneal'
+                random_seed=key_fields[1],  # Random seed
+                data_perfectness=str(self.data_perfectness), # Data perfectness level, e.g., 'PERF' for perfect
+                data_error=str(self.data_error) if self.data_error else None,    # Data error type, e.g., 'OUT' for outliers
+                error_rate_pct=int(self.data_error_rate * 100) if self.data_error_rate else None, # Data error rate multiplied by 100, e.g., 0.2 -> 20
+                generator=str(self.generator),   # Generator type, e.g., 'tabpfn' 
+            )
+            self._key_fields = key_fields
+        return self._key
+    
+    def _get_experiment_id_parts(self):
+        return list(self.key.parts())
     
-    # IMPORTANT: Keep this method aligned with the _get_experiment_parts() method!
     @classmethod
     def from_str(cls, experiment_id: str) -> tuple[Self, int]:
         from synqtab.mappings.mappings import EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS
@@ -88,14 +107,14 @@ class Experiment(ABC):
         from synqtab.enums.data import DataPerfectness
         from synqtab.enums.generators import GeneratorModel
         
-        experiment_id_parts = experiment_id.split(cls._delimiter)
-        experiment_short_name = experiment_id_parts[0]
-        dataset = Dataset(experiment_id_parts[1])
-        random_seed = int(experiment_id_parts[2])
-        data_perfectness = DataPerfectness(experiment_id_parts[3])
-        data_error = None if experiment_id_parts[4] == cls._NULL else DataErrorType(experiment_id_parts[4])
-        data_error_rate = None if experiment_id_parts[5] == cls._NULL else float(int(experiment_id_parts[5]) / 100)
-        generator = GeneratorModel(experiment_id_parts[6])
+        key = ExperimentKey.from_str(experiment_id)
+        experiment_short_name = key.experiment_type
+        dataset = Dataset(key.dataset_name)
+        random_seed = key.random_seed
+        data_perfectness = DataPerfectness(key.data_perfectness)
+        data_error = None if key.data_error is None else DataErrorType(key.data_error)
+        data_error_rate = None if key.error_rate_pct is None else float(key.error_rate_pct / 100)
+        generator = GeneratorModel(key.generator)
         
         for experiment_type, experiment_class in EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS.items():
             if experiment_short_name == experiment_class.short_name():
@@ -109,8 +128,7 @@ class Experiment(ABC):
                 ), random_seed # RETURNS TUPLE: Experiment class + random seed!
     
     def __str__(self):
-        experiment_id_parts = self._get_experiment_id_parts()
-        return self._delimiter.join(experiment_id_parts)
+        return str(self.key)
     
     def perfect_counterpart(self) -> Self:
         from copy import deepcopy
@@ -131,40 +149,42 @@ class Experiment(ABC):
         
     def run(self, force: bool=False) -> Self:
         if not self._should_compute and not force:
-            from synqtab.data import PostgresClient
+            from synqtab.data import ResultsClient
             LOG.info(f"Running experiment {str(self)} will be skipped because it already exists in Postgres.")
-            PostgresClient.write_skipped_computation(computation_id=str(self), reason="Already exists in Postgres.")
+            ResultsClient.write_skipped_computation(computation_id=str(self), reason="Already exists in Postgres.")
             return self
         
         self._run()
         return self
     
-    def publish_tasks(self) -> Self:
+    def publish_tasks(self, task_graph=None) -> Self:
         if not self._should_compute:
             LOG.info(f"Populating tasks for experiment {str(self)} will be skipped because the experiment already exists in Postgres.")
             return self
         
-        return self._publish_tasks()
+        return self._publish_tasks(task_graph=task_graph)
 
     def _exists_in_postgres(self) -> bool:
-        from synqtab.data import PostgresClient
+        from synqtab.data import ResultsClient
         
         # skip experiments that have already been executed before
-        if PostgresClient.experiment_exists(str(self)):
+        if ResultsClient.experiment_exists(str(self), experiment_key=self.key.hash64):
             return True
 
         # skip experiments that are known to fail
-        if PostgresClient.experiment_exists(
+        if ResultsClient.experiment_exists(
             str(self),
             experiments_table_name='errors',
+            experiment_key=self.key.hash64,
         ):
             return True
 
         # skip experiments that have already been skipped at least once in the past
-        if PostgresClient.experiment_exists(
+        if ResultsClient.experiment_exists(
             str(self),
             experiments_table_name='skipped_computations',
             experiment_id_column_name='computation_id',
+            experiment_key=self.key.hash64,
         ):
             return True
 
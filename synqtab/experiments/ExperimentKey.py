@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Optional, Self
+
+
+@dataclass(frozen=True, slots=True)
+class ExperimentKey:
+    """The identity of an experiment, e.g., 'NOR#anneal#42#PERF#NULL#NULL#tabpfn'. The string and its stable
+    64-bit hash (the `experiment_key` column of the results) are computed once, when the key is created.
+
+    Example:
+        key = ExperimentKey.from_str('NOR#anneal#42#IMP#OUT#20#tabpfn')
+        key.random_seed, key.error_rate_pct, key.hash64 # 42, 20, ...
+    """
+    _delimiter = '#'
+    _NULL = 'NULL'
+
+    experiment_type: str # e.g., 'NOR' for Normal Experiment
+    dataset_name: str
+    random_seed: Optional[int] # None until the process-wide random seed is set
+    data_perfectness: str # e.g., 'PERF' for perfect
+    data_error: Optional[str] # e.g., 'OUT' for outliers
+    error_rate_pct: Optional[int] # the data error rate multiplied by 100, e.g., 0.2 -> 20
+    generator: str # e.g., 'tabpfn'
+    _string: str = field(init=False, repr=False, compare=False)
+    hash64: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        from synqtab.utils.general_utils import stable_hash64
+
+        string = self._delimiter.join(self.parts())
+        object.__setattr__(self, '_string', string)
+        object.__setattr__(self, 'hash64', stable_hash64(string))
+
+    # IMPORTANT: Keep this method aligned with the from_str() method!
+    def parts(self) -> tuple[str, ...]:
+        return (
+            self.experiment_type,
+            self.dataset_name,
+            str(self.random_seed),
+            self.data_perfectness,
+            self.data_error if self.data_error else self._NULL,
+            str(self.error_rate_pct) if self.error_rate_pct else self._NULL,
+            self.generator,
+        )
+
+    # IMPORTANT: Keep this method aligned with the parts() method!
+    @classmethod
+    def from_str(cls, experiment_id: str) -> Self:
+        experiment_id_parts = experiment_id.split(cls._delimiter)
+        if len(experiment_id_parts) != 7:
+            raise ValueError(f"An experiment ID has 7 parts. Got '{experiment_id}'.")
+        return cls(
+            experiment_type=experiment_id_parts[0],
+            dataset_name=experiment_id_parts[1],
+            random_seed=None if experiment_id_parts[2] == 'None' else int(experiment_id_parts[2]),
+            data_perfectness=experiment_id_parts[3],
+            data_error=None if experiment_id_parts[4] == cls._NULL else experiment_id_parts[4],
+            error_rate_pct=None if experiment_id_parts[5] == cls._NULL else int(experiment_id_parts[5]),
+            generator=experiment_id_parts[6],
+        )
+
+    def __str__(self) -> str:
+        return self._string
+
+    def __hash__(self) -> int:
+        return self.hash64
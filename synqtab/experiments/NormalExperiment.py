@@ -1,4 +1,6 @@
-from typing import Self
+from typing import Optional, Self
+
+import pandas as pd
 
 from synqtab.experiments.Experiment import Experiment
 from synqtab.utils import get_logger
@@ -15,28 +17,47 @@ class NormalExperiment(Experiment):
         return str(ExperimentType.NORMAL)
     
     def _run(self) -> None:
-        from synqtab.data import PostgresClient, MinioClient
-        from synqtab.enums import MinioBucket, ProblemType, DataPerfectness
-        from synqtab.environment import MAX_TRAINING_ROWS
-        from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
-        from synqtab.reproducibility import ReproducibleOperations
-        from synqtab.utils import timed_computation
-
         LOG.info(f"Entering the _run() function of Normal Experiment {str(self)}")
         
+        training_df, _ = self._split()
+        if self._skip_if_too_large(training_df):
+            return
+        
+        training_df, corrupted_rows, corrupted_cols = self._corrupt(training_df)
+        if self._skip_if_not_corrupted(training_df, corrupted_cols):
+            return
+        
+        self._generate(training_df, corrupted_rows, corrupted_cols)
+    
+    # The stages of _run() are also the nodes of the pipeline (see synqtab.pipeline.NormalPipeline), where the
+    # split and the corruption are computed once and shared by all the experiments that need them
+    def _split(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Returns the (training, validation) split of the real perfect data."""
+        from synqtab.enums import ProblemType
+        from synqtab.reproducibility import ReproducibleOperations
+        
         real_perfect_df = self.dataset._fetch_real_perfect_dataframe()
-        target_column_name = self.dataset.target_feature
-        target = real_perfect_df[target_column_name]
+        target = real_perfect_df[self.dataset.target_feature]
         problem_type = ProblemType(self.dataset.problem_type)
-        training_df, validation_df = ReproducibleOperations.train_test_split(
+        return ReproducibleOperations.train_test_split(
             real_perfect_df, test_size=0.5, stratify=target, problem_type=problem_type)
+    
+    def _skip_if_too_large(self, training_df: pd.DataFrame) -> bool:
+        from synqtab.environment import MAX_TRAINING_ROWS
         
-        if len(training_df) > MAX_TRAINING_ROWS:
-            from synqtab.data import PostgresClient
-            LOG.info(f"Experiment {str(self)} will be skipped, because the dataset has {len(training_df)} rows.")
-            PostgresClient.write_skipped_computation(computation_id=str(self), reason=f"More than {MAX_TRAINING_ROWS} rows ({len(training_df)}).")
-            self._should_compute = False
-            return
+        if len(training_df) <= MAX_TRAINING_ROWS:
+            return False
+        
+        from synqtab.data import ResultsClient
+        LOG.info(f"Experiment {str(self)} will be skipped, because the dataset has {len(training_df)} rows.")
+        ResultsClient.write_skipped_computation(computation_id=str(self), reason=f"More than {MAX_TRAINING_ROWS} rows ({len(training_df)}).")
+        self._should_compute = False
+        return True
+    
+    def _corrupt(self, training_df: pd.DataFrame) -> tuple[pd.DataFrame, list, list]:
+        """Returns the corrupted training data with the corrupted rows and columns. The training data is returned
+        as is if the experiment has no data error."""
+        from synqtab.enums import DataPerfectness
         
         corrupted_rows = corrupted_cols = []
         if self.data_error:
@@ -48,19 +69,35 @@ class NormalExperiment(Experiment):
                     target_column=self.dataset.target_feature,
                 )
                 LOG.info(f"Data Corruption was completed successfully for experiment {str(self)}")
-                
-                if len(corrupted_cols) == 0:
-                    from synqtab.data import PostgresClient
-                    LOG.info(f"Experiment {str(self)} will be skipped, because no columns to corrupt were found.")
-                    LOG.info(f"Experiment {str(self)}. Categorical: {self.dataset.categorcal_features}, All: {training_df.columns}, Error Applicability: {data_error_instance.data_error_applicability()}.")
-                    self._should_compute = False
-                    PostgresClient.write_skipped_computation(computation_id=str(self), reason="No columns to corrupt.")
-                    return
 
                 if self.data_perfectness == DataPerfectness.SEMIPERFECT:
                   training_df.drop(corrupted_rows)
+        return training_df, corrupted_rows, corrupted_cols
+    
+    def _skip_if_not_corrupted(self, training_df: pd.DataFrame, corrupted_cols: list) -> bool:
+        if not (self.data_error and self.data_error_rate) or len(corrupted_cols) > 0:
+            return False
+        
+        from synqtab.data import ResultsClient
+        data_error_instance = self.data_error.get_class()(row_fraction=self.data_error_rate)
+        LOG.info(f"Experiment {str(self)} will be skipped, because no columns to corrupt were found.")
+        LOG.info(f"Experiment {str(self)}. Categorical: {self.dataset.categorcal_features}, All: {training_df.columns}, Error Applicability: {data_error_instance.data_error_applicability()}.")
+        self._should_compute = False
+        ResultsClient.write_skipped_computation(computation_id=str(self), reason="No columns to corrupt.")
+        return True
+    
+    def _generate(self, training_df: pd.DataFrame, corrupted_rows: list, corrupted_cols: list) -> None:
+        """Generates the synthetic data from the (corrupted) training data and stores the data and the metadata."""
+        synthetic_df, elapsed_time = self._synthesize(training_df)
+        self._store_synthetic_data(training_df, synthetic_df, elapsed_time, corrupted_rows, corrupted_cols)
+    
+    def _synthesize(self, training_df: pd.DataFrame) -> tuple[pd.DataFrame, float]:
+        """Returns the synthetic data of the (corrupted) training data and the seconds it took to generate it."""
+        from synqtab.mappings.mappings import GENERATOR_MODEL_TO_GENERATOR_INSTANCE
+        from synqtab.utils import timed_computation
         
         LOG.info(f"Initializing {self.generator} generator for experiment {str(self)}")
+        target_column_name = self.dataset.target_feature
         y = training_df[target_column_name]
         X = training_df.drop(columns=[target_column_name])
         generator_instance = GENERATOR_MODEL_TO_GENERATOR_INSTANCE.get(self.generator)
@@ -72,12 +109,23 @@ class NormalExperiment(Experiment):
                 'y_initial': y,
                 'n_samples': len(X),
                 'metadata': self.dataset.metadata,
+                'checkpoint_id': str(self), # generators that support it resume from the last checkpoint
             }
         )
         LOG.info(f"Generation for experiment {str(self)} was completed in {elapsed_time} seconds.")
-
+        return synthetic_df, elapsed_time
+    
+    def _store_synthetic_data(
+        self, training_df: pd.DataFrame, synthetic_df: pd.DataFrame, elapsed_time: float,
+        corrupted_rows: list, corrupted_cols: list,
+    ) -> None:
+        """Stores the synthetic data in MinIO and the metadata of the experiment in Postgres."""
+        from synqtab.data import ResultsClient, StorageClient
+        from synqtab.enums import MinioBucket
+        from synqtab.reproducibility import ReproducibleOperations
+        
         # Action 1: Write the Synthetic data to MinIO for asynchronous evaluation
-        MinioClient.upload_dataframe_as_parquet_to_bucket(
+        StorageClient.upload_dataframe_as_parquet_to_bucket(
             df=synthetic_df,
             bucket_name=MinioBucket.SYNTHETIC,
             object_name=self.minio_path()
@@ -90,7 +138,7 @@ class NormalExperiment(Experiment):
         corrupted_rows = corrupted_rows.tolist() if 'numpy' in str(type(corrupted_rows)) else corrupted_rows
         corrupted_cols = corrupted_cols.tolist() if 'numpy' in str(type(corrupted_cols)) else corrupted_cols
 
-        PostgresClient.write_experiment(
+        ResultsClient.write_experiment(
             experiment_id=str(self),
             experiment_type=self.short_name(),
             dataset_name=self.dataset.dataset_name,
@@ -99,7 +147,7 @@ class NormalExperiment(Experiment):
             data_error=str(self.data_error) if self.data_error else None,
             error_rate=str(int(self.data_error_rate * 100)) if self.data_error_rate else None,
             generator=str(self.generator),
-            training_size=str(len(X)),
+            training_size=str(len(training_df)),
             synthetic_size=str(len(synthetic_df)),
             corrupted_rows=json.dumps(corrupted_rows),
             corrupted_cols=json.dumps(corrupted_cols),
@@ -107,21 +155,25 @@ class NormalExperiment(Experiment):
         )
         LOG.info(f"Successfully wrote the metadata of experiment {str(self)} to Postgres.")
 
+        # Action 3: The experiment is stored, so its training checkpoints are no longer needed
+        from synqtab.environment import GENERATOR_CHECKPOINT_INTERVAL
+        if GENERATOR_CHECKPOINT_INTERVAL > 0:
+            from synqtab.utils.checkpoint_utils import delete_checkpoints
+            delete_checkpoints(checkpoint_id=str(self))
 
-    def _publish_tasks(self) -> Self:
-        # TODO FIND A WAY TO POPULATE THE PARAMS AS THE SDMETRICS ARE EXPECTING TO GET THESE
-        params = dict()
-        
-        from synqtab.enums import SINGULAR_EVALUATORS, DUAL_EVALUATORS
+
+    def _get_evaluations(self, params: Optional[dict] = None, fidelity: float = 1.0) -> list:
+        """Returns every (evaluation method x evaluation targets) evaluation of this experiment, valid or not.
+        The perfect baselines (R-S) belong to the perfect experiment, so a perfect experiment has only those and
+        a non-perfect experiment has all but those; see `_get_perfect_baseline_evaluations()`.
+        With the 'reference_fit' option, the reference-fit evaluators score every target with one model fitted on R."""
+        from synqtab.enums import EvaluationInput, SINGULAR_EVALUATORS, DUAL_EVALUATORS, REFERENCE_FIT_EVALUATORS
         from synqtab.evaluators import Evaluation
-        from synqtab.mappings import (
-            EVALUATION_METHOD_TO_EVALUATION_CLASS,
-            SINGULAR_EVALUATION_TARGETS, DUAL_EVALUATION_TARGETS
-        )
+        from synqtab.mappings import SINGULAR_EVALUATION_TARGETS, DUAL_EVALUATION_TARGETS
         
-        published_tasks = 0
-        skipped_tasks = 0
-        for evaluation_method in self.evaluators:
+        reference_fit = bool((self.options or dict()).get(str(EvaluationInput.REFERENCE_FIT), False))
+        evaluations = []
+        for evaluation_method in self.evaluators or []:
             
             evaluation_pairs = []
             if evaluation_method in SINGULAR_EVALUATORS:
@@ -136,13 +188,70 @@ class NormalExperiment(Experiment):
                     *evaluation_pair,
                     experiment=self,
                     evaluation_method=evaluation_method,
+                    params=params,
+                    fidelity=fidelity,
+                    reference_fit=(reference_fit and evaluation_method in REFERENCE_FIT_EVALUATORS),
                 )
-                was_published = evaluation.publish_task_if_valid()
-                if was_published:
-                    published_tasks += 1
-                else:
-                    # can happen if the evaluation is not valid, e.g., R2 evaluation on classification dataset
-                    skipped_tasks += 1
+                if evaluation.is_perfect_baseline() == (self.data_error is None):
+                    evaluations.append(evaluation)
+        return evaluations
+
+    def _get_perfect_baseline_evaluations(self, params: Optional[dict] = None, fidelity: float = 1.0) -> list:
+        """Returns the perfect baselines (R-S evaluations) that this experiment depends on, with this experiment's
+        evaluation methods. They are evaluations of the perfect counterpart, shared by all the data errors and
+        error rates of the same dataset, seed and generator."""
+        return self.perfect_counterpart()._get_evaluations(params=params, fidelity=fidelity)
+
+    def _publish_tasks(self, task_graph=None) -> Self:
+        from synqtab.evaluators import EvaluationTaskGraph
+        
+        # TODO FIND A WAY TO POPULATE THE PARAMS AS THE SDMETRICS ARE EXPECTING TO GET THESE
+        params = dict()
+        
+        # without a shared graph, the baselines are only deduplicated within this experiment
+        task_graph = task_graph if task_graph is not None else EvaluationTaskGraph()
+        published_tasks = 0
+        for evaluation in task_graph.add_experiment(self, params=params):
+            evaluation.publish_task()
+            published_tasks += 1
                 
-        LOG.info(f"Successfully published {published_tasks} and skipped {skipped_tasks} tasks for experiment {str(self)}")        
-        return self
\ No newline at end of file
+        LOG.info(f"Successfully published {published_tasks} tasks for experiment {str(self)}")        
+        return self
+    
+    def evaluate(
+        self, force: bool = False, max_workers: Optional[int] = 1, fidelity: float = 1.0, executor: str = 'thread',
+        include_baselines: bool = True,
+    ) -> list:
+        """Runs all valid evaluations of this experiment in the current process instead of publishing them as
+        separate tasks. The real, corrupted and synthetic data are loaded once and shared by all evaluators,
+        which run on a pool of `max_workers` threads or processes; all results are written to Postgres in one transaction.
+
+        Args:
+            force (bool, optional): whether to re-compute evaluations that already exist. Defaults to False.
+            max_workers (int, optional): the number of evaluator workers. Defaults to 1.
+            fidelity (float, optional): the fraction of rows to evaluate on. Defaults to 1.0.
+            executor (str, optional): 'thread' or 'process'; processes read the data from shared memory.
+            Defaults to 'thread'.
+            include_baselines (bool, optional): whether to also run the perfect baselines that this experiment
+            depends on, in a session of the perfect counterpart. Defaults to True.
+
+        Returns:
+            list[Evaluation]: the evaluations that failed.
+        """
+        from synqtab.evaluators import EvaluationSession
+        
+        evaluations = [evaluation for evaluation in self._get_evaluations(fidelity=fidelity) if evaluation._is_valid()]
+        LOG.info(f"Evaluating {len(evaluations)} evaluations of experiment {str(self)} in one session.")
+        failed_evaluations = EvaluationSession(self, fidelity=fidelity).run(
+            *evaluations, force=force, max_workers=max_workers, executor=executor)
+        
+        if include_baselines and self.data_error is not None:
+            # the baselines that already exist are skipped before their data is loaded
+            baseline_evaluations = [
+                evaluation for evaluation in self._get_perfect_baseline_evaluations(fidelity=fidelity) if evaluation._is_valid()
+            ]
+            if baseline_evaluations:
+                LOG.info(f"Evaluating {len(baseline_evaluations)} perfect baselines of experiment {str(self)} in one session.")
+                failed_evaluations += EvaluationSession(baseline_evaluations[0].experiment, fidelity=fidelity).run(
+                    *baseline_evaluations, force=force, max_workers=max_workers, executor=executor)
+        return failed_evaluations
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
@@ -8,6 +8,10 @@ class Generator(ABC):
         super().__init__()
 
     @abstractmethod
-    def generate(self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any]) -> pd.DataFrame:
-        """Train the generator model."""
+    def generate(
+        self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Train the generator model. Generators that support checkpoints resume the training of the
+        `checkpoint_id` (e.g., the experiment ID) from its last checkpoint in MinIO, if any."""
         pass
\ No newline at end of file
@@ -1,8 +1,12 @@
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 
 from synqtab.generators import Generator
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
 
 
 # https://colab.research.google.com/github/avsolatorio/RealTabFormer/blob/main/colab/REaLTabFormer_GeoValidator_Example.ipynb
@@ -11,11 +15,40 @@ class RealTabTransformer(Generator):
         super().__init__()
         self.generator = None
 
-    def generate(self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any]):
+    def generate(
+        self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+    ):
+        from synqtab.environment import GENERATOR_CHECKPOINT_INTERVAL
         from synqtab.reproducibility import ReproducibleOperations
-        
-        self.generator = ReproducibleOperations.get_realtabformer_model(model_type="tabular")
 
-        self.generator.fit(pd.concat([X_initial, y_initial], axis=1))
+        if checkpoint_id is None or GENERATOR_CHECKPOINT_INTERVAL <= 0:
+            self.generator = ReproducibleOperations.get_realtabformer_model(model_type="tabular")
+            self.generator.fit(pd.concat([X_initial, y_initial], axis=1))
+            return self.generator.sample(n_samples=n_samples)
+
+        import shutil
+        from synqtab.utils.checkpoint_utils import (
+            CheckpointDirectorySync, get_local_checkpoint_directory, restore_checkpoint_directory
+        )
+
+        # the Hugging Face trainer of REaLTabFormer writes `checkpoint-<step>` directories into the
+        # checkpoints directory during every critic round; they are synced to MinIO while training
+        checkpoints_directory = get_local_checkpoint_directory(checkpoint_id)
+        resume_from_checkpoint = restore_checkpoint_directory(checkpoints_directory, checkpoint_id)
+
+        self.generator = ReproducibleOperations.get_realtabformer_model(
+            model_type="tabular", checkpoints_dir=str(checkpoints_directory))
+        training_df = pd.concat([X_initial, y_initial], axis=1)
+        with CheckpointDirectorySync(checkpoints_directory, checkpoint_id=checkpoint_id):
+            if resume_from_checkpoint:
+                # the critic rounds of REaLTabFormer delete the checkpoints before they could resume from them, so
+                # only a resumed run trains its remaining epochs through the trainer, without the critic
+                LOG.info(f"Resuming REaLTabFormer of '{checkpoint_id}' from its last checkpoint, without the critic.")
+                self.generator.fit(training_df, n_critic=0, resume_from_checkpoint=True)
+            else:
+                self.generator.fit(training_df)
+
         samples = self.generator.sample(n_samples=n_samples)
+        shutil.rmtree(checkpoints_directory, ignore_errors=True)
         return samples
@@ -1,11 +1,13 @@
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
-from synthcity.plugins import Plugins
-from synthcity.plugins.core.dataloader import GenericDataLoader
 
 from synqtab.enums.generators import GeneratorModel
 from synqtab.generators.Generator import Generator
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
 
 
 class SynthcityGenerator(Generator):
@@ -18,12 +20,32 @@ class SynthcityGenerator(Generator):
         self.generator_model = generator_model
         self.generator = None
     
-    def generate(self, X_initial: pd.DataFrame, y_initial: pd.Series, n_samples: int, metadata: dict[str, Any]):
-        loader = GenericDataLoader(
-            pd.concat([X_initial, y_initial], axis=1),
-            target_column=y_initial.name
-        )
-        self.generator = Plugins().get(self.generator_model.value)
-        self.generator.fit(loader)
+    def generate(
+        self, X_initial: pd.DataFrame, y_initial: pd.Series, n_samples: int, metadata: dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+    ):
+        from synthcity.plugins import Plugins
+        from synthcity.plugins.core.dataloader import GenericDataLoader
+        from synthcity.utils.serialization import load, save
+        from synqtab.environment import GENERATOR_CHECKPOINT_INTERVAL
+        from synqtab.utils.checkpoint_utils import read_checkpoint_bytes, upload_checkpoint_bytes
+
+        # Synthcity plugins train in a closed loop without hooks, so the checkpoint is the fitted plugin:
+        # an experiment that is killed while sampling or storing the synthetic data does not train again
+        checkpointing = checkpoint_id is not None and GENERATOR_CHECKPOINT_INTERVAL > 0
+        fitted_plugin = read_checkpoint_bytes(checkpoint_id, 'plugin.pkl') if checkpointing else None
+
+        if fitted_plugin is not None:
+            LOG.info(f"Resuming {self.generator_model} of '{checkpoint_id}' from its fitted checkpoint.")
+            self.generator = load(fitted_plugin)
+        else:
+            loader = GenericDataLoader(
+                pd.concat([X_initial, y_initial], axis=1),
+                target_column=y_initial.name
+            )
+            self.generator = Plugins().get(self.generator_model.value)
+            self.generator.fit(loader)
+            if checkpointing:
+                upload_checkpoint_bytes(save(self.generator), checkpoint_id, 'plugin.pkl')
         
         return self.generator.generate(count=n_samples).dataframe()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 import pandas as pd
 import numpy as np
 
@@ -14,7 +14,10 @@ class TabEBM(Generator):
         super().__init__()
         self.generator = None
 
-    def generate(self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any]):
+    def generate(
+        self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+    ):
         from sklearn.preprocessing import OrdinalEncoder, LabelEncoder
         from synqtab.reproducibility import ReproducibleOperations
         
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 import pandas as pd
 from synqtab.generators import Generator
@@ -11,7 +11,10 @@ class TabPFN(Generator):
         super().__init__()
         self.generator = None
 
-    def generate(self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any]):
+    def generate(
+        self, X_initial: pd.DataFrame, y_initial: pd.DataFrame, n_samples: int, metadata: dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+    ):
         import torch
         import pandas as pd
         import numpy as np
@@ -1,86 +1,116 @@
+import importlib
+import threading
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
 from synqtab.enums import (
     DataErrorType, ExperimentType,
     GeneratorModel, EvaluationMethod,
     EvaluationTarget
 )
-from synqtab.errors import (
-    DataError, CategoricalShift, GaussianNoise, LabelError,
-    Placeholder, NearDuplicateRow, Outlier, Inconsistency
-)
-from synqtab.evaluators import (
-    Evaluator, DCREvaluator, DesbordanteFDs,
-    DisclosureProtectionEvaluator, HyFD,
-    IsolationForestEvaluator, LofEvaluator,
-    MLAugmentationPrecision, MLAugmentationRecall,
-    MLAugmentationRegression, MLEfficacy, QualityEvaluator,
-    LogisticDetector, SVCDetector,
-)
-from synqtab.experiments import (
-    Experiment, NormalExperiment, PrivacyExperiment,
-    AugmentationExperiment, RebalancingExperiment
-)
-from synqtab.generators import (
-    Generator, SynthcityGenerator,
-    RealTabTransformer, TabEBM, TabPFN
-)
+
+if TYPE_CHECKING:
+    from synqtab.errors import DataError
+    from synqtab.evaluators import Evaluator
+    from synqtab.experiments.Experiment import Experiment
+    from synqtab.generators import Generator
+
+
+class _LazyMapping(Mapping):
+    """A read-only mapping whose values are loaded on first access and cached. Importing the mappings
+    therefore does not import every error, evaluator, experiment and generator module (and the heavy
+    frameworks some of them need); only the entries that are actually looked up are loaded."""
+
+    def __init__(self, loaders: dict[Any, Callable[[], Any]]):
+        self._loaders = loaders
+        self._values = dict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            loader = self._loaders[key]
+            with self._lock:
+                if key not in self._values:
+                    self._values[key] = loader()
+        return self._values[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._loaders)})"
+
+
+def _lazy_class(module_name: str, class_name: str) -> Callable[[], type]:
+    return lambda: getattr(importlib.import_module(module_name), class_name)
+
+
+def _lazy_instance(module_name: str, class_name: str, *args) -> Callable[[], Any]:
+    return lambda: _lazy_class(module_name, class_name)()(*args)
+
+
+DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS: Mapping[DataErrorType, "type[DataError]"] = _LazyMapping({
+    DataErrorType.CATEGORICAL_SHIFT: _lazy_class('synqtab.errors.CategoricalShift', 'CategoricalShift'),
+    DataErrorType.GAUSSIAN_NOISE: _lazy_class('synqtab.errors.GaussianNoise', 'GaussianNoise'),
+    DataErrorType.INCONSISTENCY: _lazy_class('synqtab.errors.Inconsistency', 'Inconsistency'),
+    DataErrorType.LABEL_ERROR: _lazy_class('synqtab.errors.LabelError', 'LabelError'),
+    DataErrorType.NEAR_DUPLICATE: _lazy_class('synqtab.errors.NearDuplicateRow', 'NearDuplicateRow'),
+    DataErrorType.OUTLIER: _lazy_class('synqtab.errors.Outlier', 'Outlier'),
+    DataErrorType.PLACEHOLDER: _lazy_class('synqtab.errors.Placeholder', 'Placeholder'),
+})
+
+
+EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS: Mapping[ExperimentType, "type[Experiment]"] = _LazyMapping({
+    ExperimentType.NORMAL: _lazy_class('synqtab.experiments.NormalExperiment', 'NormalExperiment'),
+    ExperimentType.PRIVACY: _lazy_class('synqtab.experiments.PrivacyExperiment', 'PrivacyExperiment'),
+    ExperimentType.AUGMENTATION: _lazy_class('synqtab.experiments.AugmentationExperiment', 'AugmentationExperiment'),
+    ExperimentType.REBALANCING: _lazy_class('synqtab.experiments.RebalancingExperiment', 'RebalancingExperiment'),
+})
+
+
+_SYNTHCITY_GENERATOR = ('synqtab.generators.SynthcityGenerator', 'SynthcityGenerator')
+
+# the generator instances are created on first access, i.e., only for the generators that actually run
+GENERATOR_MODEL_TO_GENERATOR_INSTANCE: Mapping[GeneratorModel, "Generator"] = _LazyMapping({
+    GeneratorModel.CTGAN: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.CTGAN),
+    GeneratorModel.NFLOW: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.NFLOW),
+    GeneratorModel.RTVAE: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.RTVAE),
+    GeneratorModel.TVAE: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.TVAE),
+    GeneratorModel.DDPM: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.DDPM),
+    GeneratorModel.ARF: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.ARF),
+    GeneratorModel.MARGINAL_DISTRIBUTIONS: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.MARGINAL_DISTRIBUTIONS),
+    GeneratorModel.BAYESIAN_NETWORK: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.BAYESIAN_NETWORK),
+    GeneratorModel.GREAT: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.GREAT),
+    GeneratorModel.REALTABFORMER: _lazy_instance('synqtab.generators.RealTabTransformer', 'RealTabTransformer'),
+    GeneratorModel.TABPFN: _lazy_instance('synqtab.generators.TabPFN', 'TabPFN'),
+    GeneratorModel.TABEBM: _lazy_instance('synqtab.generators.TabEBM', 'TabEBM'),
+    GeneratorModel.ADSGAN: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.ADSGAN),
+    GeneratorModel.PATEGAN: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.PATEGAN),
+    GeneratorModel.AIM: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.AIM),
+    GeneratorModel.DPGAN: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.DPGAN),
+    GeneratorModel.DECAF: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.DECAF),
+    GeneratorModel.PRIVBAYES: _lazy_instance(*_SYNTHCITY_GENERATOR, GeneratorModel.PRIVBAYES),
+})
 
 
-DATA_ERROR_TYPE_TO_DATA_ERROR_CLASS: dict[DataErrorType, DataError.__class__] = {
-    DataErrorType.CATEGORICAL_SHIFT: CategoricalShift,
-    DataErrorType.GAUSSIAN_NOISE: GaussianNoise,
-    DataErrorType.INCONSISTENCY: Inconsistency,
-    DataErrorType.LABEL_ERROR: LabelError,
-    DataErrorType.NEAR_DUPLICATE: NearDuplicateRow,
-    DataErrorType.OUTLIER: Outlier,
-    DataErrorType.PLACEHOLDER: Placeholder,
-}
-
-
-EXPERIMENT_TYPE_TO_EXPERIMENT_CLASS: dict[ExperimentType, Experiment.__class__] = {
-    ExperimentType.NORMAL: NormalExperiment,
-    ExperimentType.PRIVACY: PrivacyExperiment,
-    ExperimentType.AUGMENTATION: AugmentationExperiment,
-    ExperimentType.REBALANCING: RebalancingExperiment,
-}
-
-
-GENERATOR_MODEL_TO_GENERATOR_INSTANCE: dict[GeneratorModel, Generator] = {
-    GeneratorModel.CTGAN: SynthcityGenerator(GeneratorModel.CTGAN),
-    GeneratorModel.NFLOW: SynthcityGenerator(GeneratorModel.NFLOW),
-    GeneratorModel.RTVAE: SynthcityGenerator(GeneratorModel.RTVAE),
-    GeneratorModel.TVAE: SynthcityGenerator(GeneratorModel.TVAE),
-    GeneratorModel.DDPM: SynthcityGenerator(GeneratorModel.DDPM),
-    GeneratorModel.ARF: SynthcityGenerator(GeneratorModel.ARF),
-    GeneratorModel.MARGINAL_DISTRIBUTIONS: SynthcityGenerator(GeneratorModel.MARGINAL_DISTRIBUTIONS),
-    GeneratorModel.BAYESIAN_NETWORK: SynthcityGenerator(GeneratorModel.BAYESIAN_NETWORK),
-    GeneratorModel.GREAT: SynthcityGenerator(GeneratorModel.GREAT),
-    GeneratorModel.REALTABFORMER: RealTabTransformer(),
-    GeneratorModel.TABPFN: TabPFN(),
-    GeneratorModel.TABEBM: TabEBM(),
-    GeneratorModel.ADSGAN: SynthcityGenerator(GeneratorModel.ADSGAN),
-    GeneratorModel.PATEGAN: SynthcityGenerator(GeneratorModel.PATEGAN),
-    GeneratorModel.AIM: SynthcityGenerator(GeneratorModel.AIM),
-    GeneratorModel.DPGAN: SynthcityGenerator(GeneratorModel.DPGAN),
-    GeneratorModel.DECAF: SynthcityGenerator(GeneratorModel.DECAF),
-    GeneratorModel.PRIVBAYES: SynthcityGenerator(GeneratorModel.PRIVBAYES),
-}
-
-
-EVALUATION_METHOD_TO_EVALUATION_CLASS: dict[EvaluationMethod, Evaluator.__class__] = {
-    EvaluationMethod.DCR: DCREvaluator,
-    EvaluationMethod.DFD: DesbordanteFDs,
-    EvaluationMethod.DPR: DisclosureProtectionEvaluator,
-    EvaluationMethod.HFD: HyFD,
-    EvaluationMethod.IFO: IsolationForestEvaluator,
-    EvaluationMethod.LOF: LofEvaluator,
-    EvaluationMethod.LGD: LogisticDetector,
-    EvaluationMethod.APR: MLAugmentationPrecision,
-    EvaluationMethod.ARC: MLAugmentationRecall,
-    EvaluationMethod.AR2: MLAugmentationRegression,
-    EvaluationMethod.EFF: MLEfficacy,
-    EvaluationMethod.QLT: QualityEvaluator,
-    EvaluationMethod.SVD: SVCDetector,
-}
+EVALUATION_METHOD_TO_EVALUATION_CLASS: Mapping[EvaluationMethod, "type[Evaluator]"] = _LazyMapping({
+    EvaluationMethod.DCR: _lazy_class('synqtab.evaluators.DCREvaluator', 'DCREvaluator'),
+    EvaluationMethod.DFD: _lazy_class('synqtab.evaluators.DesbordanteFDs', 'DesbordanteFDs'),
+    EvaluationMethod.DPR: _lazy_class('synqtab.evaluators.DisclosureProtectionEvaluator', 'DisclosureProtectionEvaluator'),
+    EvaluationMethod.HFD: _lazy_class('synqtab.evaluators.HyFD', 'HyFD'),
+    EvaluationMethod.IFO: _lazy_class('synqtab.evaluators.IsolationForestEvaluator', 'IsolationForestEvaluator'),
+    EvaluationMethod.LOF: _lazy_class('synqtab.evaluators.LofEvaluator', 'LofEvaluator'),
+    EvaluationMethod.LGD: _lazy_class('synqtab.evaluators.LogisticDetector', 'LogisticDetector'),
+    EvaluationMethod.APR: _lazy_class('synqtab.evaluators.MLAugmentationPrecision', 'MLAugmentationPrecision'),
+    EvaluationMethod.ARC: _lazy_class('synqtab.evaluators.MLAugmentationRecall', 'MLAugmentationRecall'),
+    EvaluationMethod.AR2: _lazy_class('synqtab.evaluators.MLAugmentationRegression', 'MLAugmentationRegression'),
+    EvaluationMethod.EFF: _lazy_class('synqtab.evaluators.MLEfficacy', 'MLEfficacy'),
+    EvaluationMethod.QLT: _lazy_class('synqtab.evaluators.QualityEvaluator', 'QualityEvaluator'),
+    EvaluationMethod.SVD: _lazy_class('synqtab.evaluators.SVCDetector', 'SVCDetector'),
+})
 
 SINGULAR_EVALUATION_TARGETS: list[tuple[EvaluationTarget]] = [
     (EvaluationTarget.R,), # each one is a tuple for consistent handling with dual evaluation targets
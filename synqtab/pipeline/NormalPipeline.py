@@ -0,0 +1,245 @@
+from typing import Any, Dict, Optional
+
+from synqtab.enums import EvaluationMethod, PipelineStage
+from synqtab.pipeline.TaskGraph import SkippedTask, TaskGraph
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def _synthesize_in_process(experiment, random_seed: int, storage_backend: type, training_df) -> tuple:
+    """Generates the synthetic data in a process of its own, whose global random states (numpy's, torch's) are not
+    shared with the corruptions and evaluations of the pipeline's threads or with the other generations. The
+    storage backend is only used for the training checkpoints; the pipeline stores the results itself."""
+    from synqtab.data import StorageClient
+    from synqtab.reproducibility import ReproducibleOperations
+
+    ReproducibleOperations.set_random_seed(random_seed)
+    StorageClient.use_backend(storage_backend)
+    return experiment._synthesize(training_df)
+
+
+class NormalPipeline():
+    """The task graph of the normal experiments of one random seed, from the real data to the evaluations.
+
+    - split/<dataset>/<seed>: the train/validation split of the real perfect data, once per dataset.
+    - corrupt/<dataset>/<seed>/<perfectness>/<error>/<rate>: the corrupted training data, once for all generators.
+    - generate/<experiment_id>: the synthetic data and the metadata of the experiment. Depends on the split and,
+      for non-perfect experiments, on the corruption. Experiments that exist in Postgres are not run. Every
+      generation runs in a fresh process, so it neither waits for nor disturbs the global random state of the rest.
+    - evaluate/<experiment_id>: the evaluations of the experiment, in one `EvaluationSession`. Depends on the
+      split, on the generation of the experiment and, for non-perfect experiments, on the corruption (the RH
+      targets) and on the generation of its perfect counterpart (the S targets). The perfect baselines (R-S) are
+      evaluated once, by the perfect experiment.
+
+    So an experiment is evaluated right after its synthetic data (and that of its perfect counterpart) is stored,
+    while the rest of the sweep is still generating. The random seed is process-wide (see `ReproducibleOperations`),
+    so all the tasks of a pipeline share the seed that is set when it is built and run. With several workers, use
+    `schedule_normal_pipeline_jobs`, which keeps the jobs that share a perfect experiment on one worker.
+
+    Example:
+        ReproducibleOperations.set_random_seed(random_seed)
+        pipeline = NormalPipeline(evaluation_methods=experimental_params.get('evaluation_methods'))
+        for job in jobs_of_this_seed:
+            pipeline.add_job(job)
+        pipeline.run()
+    """
+
+    def __init__(
+        self, evaluation_methods: Optional[list[EvaluationMethod]] = None, fidelity: float = 1.0, reference_fit: bool = False,
+    ):
+        from synqtab.evaluators import EvaluationTaskGraph
+        from synqtab.reproducibility import ReproducibleOperations
+
+        self.evaluation_methods = evaluation_methods
+        self.fidelity = fidelity
+        self.reference_fit = reference_fit # see the 'reference_fit' option of `NormalExperiment._get_evaluations()`
+        self.random_seed = ReproducibleOperations.get_current_random_seed()
+        self.task_graph = TaskGraph()
+        self.evaluation_task_graph = EvaluationTaskGraph()
+        self._datasets = dict()
+        self._generation_pool = None # the process pool of the generations while the pipeline runs
+
+    def _get_dataset(self, dataset_name: str):
+        from synqtab.data import Dataset
+
+        if dataset_name not in self._datasets:
+            self._datasets[dataset_name] = Dataset(dataset_name)
+        return self._datasets[dataset_name]
+
+    def _add_split(self, experiment) -> str:
+        node_id = f"{PipelineStage.SPLIT}/{experiment.dataset.dataset_name}/{self.random_seed}"
+        return self.task_graph.add_task(node_id, PipelineStage.SPLIT, run=lambda inputs: experiment._split())
+
+    def _add_corruption(self, experiment, split_id: str) -> str:
+        from synqtab.environment import MAX_TRAINING_ROWS
+        from synqtab.evaluators.EvaluationSession import GLOBAL_RANDOM_STATE_LOCK
+
+        def corrupt(inputs: Dict[str, Any]):
+            training_df, _ = inputs[split_id]
+            if len(training_df) > MAX_TRAINING_ROWS:
+                return None # every generation of this corruption skips the experiment
+            with GLOBAL_RANDOM_STATE_LOCK:
+                return experiment._corrupt(training_df)
+
+        return self.task_graph.add_task(
+            self._get_corruption_id(experiment), PipelineStage.CORRUPT, run=corrupt, dependencies=[split_id])
+
+    def _get_corruption_id(self, experiment) -> str:
+        return '/'.join(str(part) for part in (
+            PipelineStage.CORRUPT, experiment.dataset.dataset_name, self.random_seed,
+            experiment.data_perfectness, experiment.data_error, int(experiment.data_error_rate * 100),
+        ))
+
+    def _add_generation(self, experiment, priority: float = 0.0) -> str:
+        from synqtab.data import StorageClient
+
+        split_id = self._add_split(experiment)
+        corruption_id = self._add_corruption(experiment, split_id) if experiment.data_error else None
+
+        def generate(inputs: Dict[str, Any]) -> None:
+            training_df, _ = inputs[split_id]
+            if experiment._skip_if_too_large(training_df):
+                raise SkippedTask(f"More than the maximum training rows ({len(training_df)}).")
+
+            corrupted_rows = corrupted_cols = []
+            if corruption_id is not None:
+                training_df, corrupted_rows, corrupted_cols = inputs[corruption_id]
+            if experiment._skip_if_not_corrupted(training_df, corrupted_cols):
+                raise SkippedTask("No columns to corrupt.")
+
+            synthetic_df, elapsed_time = self._generation_pool.submit(
+                _synthesize_in_process, experiment, self.random_seed, StorageClient.get_backend(), training_df,
+            ).result()
+            experiment._store_synthetic_data(training_df, synthetic_df, elapsed_time, corrupted_rows, corrupted_cols)
+
+        return self.task_graph.add_task(
+            f"{PipelineStage.GENERATE}/{str(experiment)}",
+            PipelineStage.GENERATE,
+            run=generate,
+            dependencies=[split_id] + ([corruption_id] if corruption_id else []),
+            is_done=lambda: not experiment._should_compute,
+            priority=priority,
+            log_extra={'experiment_id': str(experiment)},
+        )
+
+    def add_job(self, job, priority: float = 0.0) -> str:
+        """Adds the generation (and the evaluations, if any evaluation methods are given) of a job.
+
+        Args:
+            job (NormalExperimentJob): the job; its random seed must be the seed of the pipeline.
+            priority (float, optional): among the ready generations, the highest priority runs first,
+            e.g., the predicted runtime. Defaults to 0.
+
+        Returns:
+            str: the ID of the generation task.
+        """
+        from synqtab.enums import DataPerfectness, EvaluationInput
+        from synqtab.experiments import NormalExperiment
+
+        if job.random_seed != self.random_seed:
+            raise ValueError(f"The job has random seed {job.random_seed}, but the pipeline has {self.random_seed}.")
+
+        experiment = NormalExperiment(
+            dataset=self._get_dataset(job.dataset_name),
+            generator=job.generator,
+            data_error_type=job.data_error_type,
+            data_error_rate=job.data_error_rate,
+            data_perfectness=job.data_perfectness,
+            evaluation_methods=self.evaluation_methods,
+            options={str(EvaluationInput.REFERENCE_FIT): self.reference_fit},
+        )
+        generation_id = self._add_generation(experiment, priority=priority)
+
+        if experiment.data_error is not None:
+            # the S targets of the evaluations are the synthetic data of the perfect counterpart
+            perfect_experiment = NormalExperiment(
+                dataset=experiment.dataset,
+                generator=experiment.generator,
+                data_perfectness=DataPerfectness.PERFECT,
+                evaluation_methods=self.evaluation_methods,
+            )
+            if f"{PipelineStage.GENERATE}/{str(perfect_experiment)}" not in self.task_graph:
+                self._add_generation(perfect_experiment, priority=priority)
+
+        if self.evaluation_methods:
+            self.evaluation_task_graph.add_experiment(experiment, fidelity=self.fidelity)
+        return generation_id
+
+    def _add_evaluations(self) -> None:
+        """Adds one evaluation task per experiment that owns evaluations in the evaluation task graph."""
+        from synqtab.evaluators import EvaluationSession
+
+        evaluations_per_experiment = dict()
+        for evaluation in self.evaluation_task_graph.nodes.values():
+            evaluations_per_experiment.setdefault(str(evaluation.experiment), []).append(evaluation)
+
+        for experiment_id, evaluations in evaluations_per_experiment.items():
+            experiment = evaluations[0].experiment
+            split_id = self._add_split(experiment)
+            corruption_id = self._get_corruption_id(experiment) if experiment.data_error is not None else None
+            dependencies = [split_id, f"{PipelineStage.GENERATE}/{experiment_id}"]
+            if corruption_id is not None:
+                # the RH targets are the output of the corruption, instead of a second corruption that would
+                # reseed numpy's global random state while other tasks generate
+                dependencies.append(corruption_id)
+                dependencies.append(f"{PipelineStage.GENERATE}/{str(experiment.perfect_counterpart())}")
+
+            def evaluate(
+                inputs: Dict[str, Any], experiment=experiment, evaluations=evaluations, split_id=split_id,
+                corruption_id=corruption_id,
+            ):
+                session = EvaluationSession(
+                    experiment, fidelity=self.fidelity, real_split=inputs[split_id],
+                    real_corruption=inputs.get(corruption_id),
+                )
+                session.run(*evaluations)
+
+            self.task_graph.add_task(
+                f"{PipelineStage.EVALUATE}/{experiment_id}",
+                PipelineStage.EVALUATE,
+                run=evaluate,
+                dependencies=dependencies,
+                # the existence of every evaluation is looked up once and reused when the session runs
+                is_done=lambda evaluations=evaluations: not any(evaluation._should_compute for evaluation in evaluations),
+                log_extra={'experiment_id': experiment_id},
+            )
+
+    def run(
+        self, max_workers: Optional[int] = None, stage_max_workers: Optional[Dict[PipelineStage, int]] = None
+    ) -> Dict[str, list[str]]:
+        """Runs the pipeline.
+
+        Args:
+            max_workers (int, optional): the number of tasks that run at the same time. Defaults to PIPELINE_MAX_WORKERS.
+            stage_max_workers (dict[PipelineStage, int], optional): the number of tasks of a stage that run at the
+            same time. Defaults to PIPELINE_MAX_GENERATORS generations.
+
+        Returns:
+            dict[str, list[str]]: the IDs of the 'completed', 'cached', 'skipped' and 'failed' tasks.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from synqtab.environment import PIPELINE_MAX_WORKERS, PIPELINE_MAX_GENERATORS
+        from synqtab.reproducibility import ReproducibleOperations
+
+        if ReproducibleOperations.get_current_random_seed() != self.random_seed:
+            raise ValueError(f"The pipeline was built for random seed {self.random_seed}, but the current seed is "
+                             f"{ReproducibleOperations.get_current_random_seed()}.")
+
+        self._add_evaluations()
+        stage_max_workers = stage_max_workers or {PipelineStage.GENERATE: PIPELINE_MAX_GENERATORS}
+        max_workers = max_workers or PIPELINE_MAX_WORKERS
+        # spawned rather than forked, because the pipeline's threads may hold locks or CUDA state; one generation
+        # per process, so that every generation starts from a fresh random state and releases its GPU memory
+        self._generation_pool = ProcessPoolExecutor(
+            max_workers=stage_max_workers.get(PipelineStage.GENERATE, max_workers),
+            mp_context=multiprocessing.get_context('spawn'),
+            max_tasks_per_child=1,
+        )
+        try:
+            return self.task_graph.run(max_workers=max_workers, stage_max_workers=stage_max_workers)
+        finally:
+            self._generation_pool.shutdown()
+            self._generation_pool = None
@@ -0,0 +1,236 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from synqtab.enums import PipelineStage
+from synqtab.utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class SkippedTask(Exception):
+    """Raised by a task that decides not to compute, e.g., an experiment on a dataset that is too large.
+    The task and everything that depends on it are skipped, without logging an error."""
+
+
+@dataclass
+class TaskNode:
+    node_id: str
+    stage: PipelineStage
+    run: Callable[[Dict[str, Any]], Any] # gets the outputs of the dependencies by node ID
+    dependencies: tuple[str, ...] = ()
+    is_done: Optional[Callable[[], bool]] = None # whether the output is already stored, e.g., in Postgres
+    priority: float = 0.0 # among the ready tasks of the same stage, the highest priority runs first
+    log_extra: Optional[Dict[str, Any]] = None # e.g., {'experiment_id': ...} to record the failure
+    dependents: list[str] = field(default_factory=list)
+
+
+class TaskGraph():
+    """A graph of pipeline tasks with declared dependencies, run on a pool of threads.
+
+    A task runs as soon as all of its dependencies have finished, so, e.g., the evaluations of an experiment
+    start right after its synthetic data is generated, while the other experiments are still generating.
+    Tasks whose output is already stored (`is_done`) are not run, and neither are the tasks that are only
+    needed by them. The in-memory outputs, e.g., the train/validation splits, are released as soon as all the
+    tasks that depend on them have finished. If a task fails, the tasks that depend on it are skipped.
+
+    Among the ready tasks, the later stages go first (evaluate before generate before corrupt before split), so
+    that results are delivered early and the in-memory outputs are released early. `stage_max_workers` caps the
+    tasks of a stage that run at the same time, e.g., {PipelineStage.GENERATE: 1} for a single GPU.
+
+    Example:
+        graph = TaskGraph()
+        graph.add_task('split/adult', PipelineStage.SPLIT, run=lambda inputs: split('adult'))
+        graph.add_task('generate/adult', PipelineStage.GENERATE, run=lambda inputs: generate(inputs['split/adult']),
+                       dependencies=['split/adult'])
+        graph.run(max_workers=4)
+    """
+
+    _STAGE_ORDER = [PipelineStage.SPLIT, PipelineStage.CORRUPT, PipelineStage.GENERATE, PipelineStage.EVALUATE]
+
+    def __init__(self):
+        self.nodes: Dict[str, TaskNode] = dict()
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add_task(
+        self,
+        node_id: str,
+        stage: PipelineStage,
+        run: Callable[[Dict[str, Any]], Any],
+        dependencies: Optional[list[str]] = None,
+        is_done: Optional[Callable[[], bool]] = None,
+        priority: float = 0.0,
+        log_extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Adds a task to the graph, unless a task with the same ID already exists. The dependencies may be
+        added later, but before the graph runs. Returns the ID of the task."""
+        if node_id not in self.nodes:
+            self.nodes[node_id] = TaskNode(
+                node_id=node_id,
+                stage=stage,
+                run=run,
+                dependencies=tuple(dependencies or ()),
+                is_done=is_done,
+                priority=priority,
+                log_extra=log_extra,
+            )
+        return node_id
+
+    def _get_topological_order(self) -> list[str]:
+        for node in self.nodes.values():
+            node.dependents = []
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self.nodes:
+                    raise ValueError(f"Task {node.node_id} depends on {dependency}, which is not in the graph.")
+                self.nodes[dependency].dependents.append(node.node_id)
+
+        nof_pending_dependencies = {node_id: len(node.dependencies) for node_id, node in self.nodes.items()}
+        order = [node_id for node_id, count in nof_pending_dependencies.items() if count == 0]
+        for node_id in order: # the list grows while it is traversed
+            for dependent in self.nodes[node_id].dependents:
+                nof_pending_dependencies[dependent] -= 1
+                if nof_pending_dependencies[dependent] == 0:
+                    order.append(dependent)
+
+        if len(order) != len(self.nodes):
+            raise ValueError(f"The task graph has a cycle among {len(self.nodes) - len(order)} tasks.")
+        return order
+
+    def _get_tasks_to_run(self, order: list[str], max_workers: int) -> tuple[set[str], set[str]]:
+        """Returns the tasks that need to run and the tasks whose output is already stored."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        checked_node_ids = [node_id for node_id in order if self.nodes[node_id].is_done is not None]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            done_flags = executor.map(lambda node_id: self.nodes[node_id].is_done(), checked_node_ids)
+            done_node_ids = {node_id for node_id, is_done in zip(checked_node_ids, done_flags) if is_done}
+
+        # a task without a stored output is needed if any of its dependents is needed (or if it has none)
+        needed_node_ids = set()
+        for node_id in reversed(order):
+            node = self.nodes[node_id]
+            if node_id in done_node_ids:
+                continue
+            if node.is_done is not None or not node.dependents or any(
+                dependent in needed_node_ids for dependent in node.dependents
+            ):
+                needed_node_ids.add(node_id)
+        return needed_node_ids, done_node_ids
+
+    def run(self, max_workers: int = 4, stage_max_workers: Optional[Dict[PipelineStage, int]] = None) -> Dict[str, list[str]]:
+        """Runs the tasks of the graph.
+
+        Args:
+            max_workers (int, optional): the number of tasks that run at the same time. Defaults to 4.
+            stage_max_workers (dict[PipelineStage, int], optional): the number of tasks of a stage that run
+            at the same time. Defaults to no limit per stage.
+
+        Returns:
+            dict[str, list[str]]: the IDs of the 'completed', 'cached', 'skipped' and 'failed' tasks.
+        """
+        import heapq
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        stage_max_workers = stage_max_workers or dict()
+        if max_workers < 1 or any(limit < 1 for limit in stage_max_workers.values()):
+            raise ValueError(f"The number of workers must be positive. Got {max_workers} and {stage_max_workers}.")
+        order = self._get_topological_order()
+        needed_node_ids, done_node_ids = self._get_tasks_to_run(order, max_workers)
+        LOG.info(f"Running {len(needed_node_ids)} tasks of {len(self.nodes)}; {len(done_node_ids)} are already stored.")
+
+        position = {node_id: index for index, node_id in enumerate(order)}
+        nof_pending_dependencies = {
+            node_id: sum(dependency in needed_node_ids for dependency in self.nodes[node_id].dependencies)
+            for node_id in needed_node_ids
+        }
+        nof_pending_dependents = {
+            node_id: sum(dependent in needed_node_ids for dependent in self.nodes[node_id].dependents)
+            for node_id in needed_node_ids
+        }
+        outputs: Dict[str, Any] = dict()
+        results = {'completed': [], 'cached': sorted(done_node_ids, key=position.get), 'skipped': [], 'failed': []}
+
+        ready = []
+        def push_if_ready(node_id: str) -> None:
+            if nof_pending_dependencies[node_id] == 0:
+                node = self.nodes[node_id]
+                heapq.heappush(ready, (-self._STAGE_ORDER.index(node.stage), -node.priority, position[node_id], node_id))
+
+        for node_id in needed_node_ids:
+            push_if_ready(node_id)
+
+        def release_dependencies(node_id: str) -> None:
+            for dependency in self.nodes[node_id].dependencies:
+                if dependency in nof_pending_dependents:
+                    nof_pending_dependents[dependency] -= 1
+                    if nof_pending_dependents[dependency] == 0:
+                        outputs.pop(dependency, None)
+
+        def skip_dependents(node_id: str) -> None:
+            stack = list(self.nodes[node_id].dependents)
+            while stack:
+                dependent = stack.pop()
+                if dependent not in nof_pending_dependencies or nof_pending_dependencies[dependent] < 0:
+                    continue
+                nof_pending_dependencies[dependent] = -1 # never becomes ready
+                results['skipped'].append(dependent)
+                release_dependencies(dependent)
+                stack.extend(self.nodes[dependent].dependents)
+
+        def run_task(node: TaskNode) -> Any:
+            inputs = {dependency: outputs.get(dependency) for dependency in node.dependencies}
+            return node.run(inputs)
+
+        running = dict() # future -> node ID
+        running_per_stage = {stage: 0 for stage in self._STAGE_ORDER}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while ready or running:
+                deferred = []
+                while ready and len(running) < max_workers:
+                    entry = heapq.heappop(ready)
+                    node = self.nodes[entry[-1]]
+                    if running_per_stage[node.stage] >= stage_max_workers.get(node.stage, max_workers):
+                        deferred.append(entry)
+                        continue
+                    running[executor.submit(run_task, node)] = node.node_id
+                    running_per_stage[node.stage] += 1
+                for entry in deferred:
+                    heapq.heappush(ready, entry)
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node_id = running.pop(future)
+                    node = self.nodes[node_id]
+                    running_per_stage[node.stage] -= 1
+                    try:
+                        output = future.result()
+                    except SkippedTask as e:
+                        LOG.info(f"Task {node_id} was skipped: {e}")
+                        results['skipped'].append(node_id)
+                        skip_dependents(node_id)
+                    except Exception as e:
+                        LOG.error(f"Task {node_id} failed and its {len(node.dependents)} dependent tasks are skipped. Error: {e}",
+                                  extra=node.log_extra or dict())
+                        results['failed'].append(node_id)
+                        skip_dependents(node_id)
+                    else:
+                        results['completed'].append(node_id)
+                        if nof_pending_dependents[node_id] > 0:
+                            outputs[node_id] = output
+                        for dependent in node.dependents:
+                            if dependent in nof_pending_dependencies and nof_pending_dependencies[dependent] > 0:
+                                nof_pending_dependencies[dependent] -= 1
+                                push_if_ready(dependent)
+                    release_dependencies(node_id)
+
+        LOG.info(
+            f"Task graph finished: {len(results['completed'])} completed, {len(results['cached'])} cached, "
+            f"{len(results['skipped'])} skipped and {len(results['failed'])} failed."
+        )
+        return results
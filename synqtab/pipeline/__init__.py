@@ -0,0 +1,13 @@
+"""
+Pipeline package for SynQTab project.
+Contains the task graph that links the split, corruption, generation and evaluation stages of the experiments.
+"""
+from .NormalPipeline import NormalPipeline
+from .TaskGraph import SkippedTask, TaskGraph, TaskNode
+
+__all__ = [
+    'NormalPipeline',
+    'SkippedTask',
+    'TaskGraph',
+    'TaskNode',
+]
\ No newline at end of file
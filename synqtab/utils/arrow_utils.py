@@ -0,0 +1,38 @@
+from typing import Optional
+
+import pandas as pd
+
+
+def dictionary_encode(column):
+    """Dictionary-encodes an Arrow column with sorted, non-null categories, i.e., the categories that
+    pandas' `astype('category')` would infer, so that category codes do not depend on the read path."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    column = column.combine_chunks()
+    categories = pc.drop_null(pc.unique(column))
+    categories = categories.take(pc.array_sort_indices(categories))
+    codes = pc.index_in(column, value_set=categories).cast(pa.int32())
+    return pa.DictionaryArray.from_arrays(codes, categories)
+
+
+def arrow_table_to_pandas(table, categorical_columns: Optional[list[str]] = None, **pandas_kwargs) -> pd.DataFrame:
+    """Converts an Arrow table to pandas exactly once. The categorical columns are dictionary-encoded in Arrow
+    first, so they arrive as `category` without an `astype('category')` pass; columns that do not exist in the
+    table are ignored and columns that are already dictionaries keep their stored categories.
+
+    Args:
+        table (pyarrow.Table): the table to convert.
+        categorical_columns (list[str], optional): the columns to return as `category`. Defaults to None.
+        pandas_kwargs: passed to `pyarrow.Table.to_pandas()`.
+
+    Returns:
+        pd.DataFrame: the dataframe.
+    """
+    import pyarrow as pa
+
+    for column in categorical_columns or []:
+        column_index = table.schema.get_field_index(column)
+        if column_index != -1 and not pa.types.is_dictionary(table.schema.field(column_index).type):
+            table = table.set_column(column_index, column, dictionary_encode(table.column(column_index)))
+    return table.to_pandas(**pandas_kwargs)
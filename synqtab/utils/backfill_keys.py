@@ -0,0 +1,30 @@
+"""Fills in the typed key columns (e.g., `experiment_key`, `seed`, `error_rate_pct`) of the rows that were written
+before the columns existed. Run it once after applying the ALTER TABLE statements of `postgres/init.sql` to an
+existing database: the existence checks look the rows up by their keys, so, until then, they do not find the rows
+without keys and compute them again. Embedded stores (SQLite, DuckDB) add the columns and backfill them by
+themselves, when they are opened.
+
+Example:
+    python -m synqtab.utils.backfill_keys --backend postgres
+"""
+import argparse
+
+
+if __name__ == '__main__':
+    from synqtab.data.clients.ResultsClient import ResultsClient
+    from synqtab.environment import RESULTS_BACKEND
+
+    parser = argparse.ArgumentParser(description='Fill in the typed key columns of the existing results.')
+    parser.add_argument('--backend', choices=['postgres', 'sqlite', 'duckdb'], default=RESULTS_BACKEND,
+                        help='the store to backfill. Defaults to RESULTS_BACKEND.')
+    parser.add_argument('--database-path', default=None, help='the database file of an embedded store.')
+    parser.add_argument('--tables', nargs='*', default=None, help='the tables to backfill. Defaults to all tables.')
+    parser.add_argument('--batch-size', type=int, default=1000, help='rows per transaction.')
+    args = parser.parse_args()
+
+    results_store = ResultsClient.resolve_backend(args.backend)
+    if args.database_path:
+        results_store.set_database_path(args.database_path)
+
+    for table_name, nof_rows in results_store.backfill_key_columns(args.tables, args.batch_size).items():
+        print(f"{table_name}: {nof_rows} rows")
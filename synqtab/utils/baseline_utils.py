@@ -0,0 +1,146 @@
+from typing import Any, Callable, Optional
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+_BASELINES: dict[str, dict] = dict()
+
+
+def get_or_fit_baseline(
+    evaluation_method: str,
+    baseline_id: str,
+    fit_baseline: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Returns the real-data baseline of an ML evaluator, e.g., the validation metrics of a model trained on the real
+    training data. Baselines only depend on the data they are trained on (e.g., '<dataset_name>/<random_seed>'), so they
+    are computed once and then looked up in the process cache first and in the MinIO models bucket second. Keep them
+    small: store the metrics, not the fitted models.
+
+    Args:
+        evaluation_method (str): the short name of the evaluator that owns the baseline, e.g., 'AR2'.
+        baseline_id (str): the identifier of the baseline, e.g., '<dataset_name>/<random_seed>/<learner>'.
+        fit_baseline (Callable): computes the baseline; must return a small, picklable dictionary.
+
+    Returns:
+        dict[str, Any]: the baseline, as returned by `fit_baseline`.
+    """
+    import pickle
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket, MinioFolder
+    
+    object_name = MinioFolder.create_prefix(evaluation_method, f"{baseline_id}.pkl")
+    if object_name in _BASELINES:
+        return _BASELINES[object_name]
+    
+    if StorageClient.object_exists(bucket_name=MinioBucket.MODELS, object_name=object_name):
+        LOG.info(f"Loading baseline '{object_name}' from MinIO.")
+        baseline = pickle.loads(
+            StorageClient.read_bytes_from_bucket(bucket_name=MinioBucket.MODELS, object_name=object_name)
+        )
+    else:
+        LOG.info(f"Fitting baseline '{object_name}'.")
+        baseline = fit_baseline()
+        StorageClient.upload_bytes_to_bucket(
+            data=pickle.dumps(baseline),
+            bucket_name=MinioBucket.MODELS,
+            object_name=object_name,
+        )
+    
+    _BASELINES[object_name] = baseline
+    return baseline
+
+
+def compute_augmentation_breakdown(
+    metric,
+    real_training_data,
+    synthetic_data,
+    real_validation_data,
+    metadata: dict[str, Any],
+    prediction_column_name: str,
+    minority_class_label: Any,
+    evaluation_method: str,
+    baseline_id: Optional[str] = None,
+    classifier: str = 'XGBoost',
+    fixed_value: float = 0.9,
+) -> dict[str, Any]:
+    """Computes the same breakdown as `metric.compute_breakdown()` of SDMetrics' ML augmentation metrics, e.g.,
+    `BinaryClassifierPrecisionEfficacy`, but trains the `'real_data_baseline'` classifier only once per `baseline_id`
+    (see `get_or_fit_baseline`). The baseline only depends on the real training and validation data, since SDMetrics
+    fits its preprocessing on the real training data and transforms each table on its own.
+
+    Args:
+        metric (type): the SDMetrics metric class, e.g., `BinaryClassifierRecallEfficacy`.
+        real_training_data (pd.DataFrame): the real data used to train the generator.
+        synthetic_data (pd.DataFrame): the synthetic data generated by the generator.
+        real_validation_data (pd.DataFrame): the data to use for validation (unseen by the generator).
+        metadata (dict[str, Any]): sdmetrics metadata.
+        prediction_column_name (str): the name of the target column.
+        minority_class_label (Any): the label of the minority class.
+        evaluation_method (str): the short name of the evaluator that owns the baseline, e.g., 'APR'.
+        baseline_id (str, optional): the identifier of the real training data. If None, the baseline is not
+        reused. Defaults to None.
+        classifier (str, optional): see the SDMetrics metric. Defaults to 'XGBoost'.
+        fixed_value (float, optional): the fixed recall (precision) value of the precision (recall) metric.
+        Defaults to 0.9.
+
+    Returns:
+        dict[str, Any]: the `'score'`, `'real_data_baseline'`, `'augmented_data'` and `'parameters'`.
+    """
+    import pandas as pd
+    from sdmetrics.single_table.data_augmentation.base import ClassifierTrainer
+    from sdmetrics.single_table.data_augmentation.utils import _validate_inputs
+    from sdmetrics.single_table.utils import _process_data_with_metadata_ml_efficacy_metrics
+    from synqtab.enums import MinioFolder
+    
+    _validate_inputs(
+        real_training_data, synthetic_data, real_validation_data, metadata,
+        prediction_column_name, minority_class_label, classifier, fixed_value,
+    )
+    real_training_data, synthetic_data, real_validation_data = _process_data_with_metadata_ml_efficacy_metrics(
+        real_training_data, synthetic_data, real_validation_data, metadata
+    )
+    preprocessed_tables = metric._fit_transform(
+        real_training_data, synthetic_data, real_validation_data,
+        metadata, prediction_column_name, minority_class_label,
+    )
+    get_trainer = lambda: ClassifierTrainer(
+        prediction_column_name, minority_class_label, classifier, fixed_value, metric.metric_name
+    )
+    
+    fit_baseline = lambda: get_trainer().get_scores(
+        preprocessed_tables['real_training_data'], preprocessed_tables['real_validation_data']
+    )
+    if baseline_id:
+        real_data_baseline = get_or_fit_baseline(
+            evaluation_method=evaluation_method,
+            baseline_id=MinioFolder.create_prefix(baseline_id, f"{classifier.lower()}_{fixed_value}"),
+            fit_baseline=fit_baseline,
+        )
+    else:
+        real_data_baseline = fit_baseline()
+    
+    trainer = get_trainer()
+    metric_to_fix = 'recall' if metric.metric_name == 'precision' else 'precision'
+    result = {
+        'real_data_baseline': real_data_baseline,
+        'augmented_data': trainer.get_scores(
+            pd.concat([
+                preprocessed_tables['real_training_data'],
+                preprocessed_tables['synthetic_data'],
+            ]).reset_index(drop=True),
+            preprocessed_tables['real_validation_data'],
+        ),
+        'parameters': {
+            'prediction_column_name': trainer.prediction_column_name,
+            'minority_class_label': trainer.minority_class_label,
+            'classifier': trainer._classifier_name,
+            f'fixed_{metric_to_fix}_value': trainer.fixed_value,
+        },
+    }
+    augmented_score = result['augmented_data'][f'{metric.metric_name}_score_validation']
+    baseline_score = result['real_data_baseline'][f'{metric.metric_name}_score_validation']
+    result['score'] = (augmented_score - baseline_score) / 2 + 0.5
+    return result
@@ -0,0 +1,154 @@
+"""Checkpoints of in-flight generator training, kept in MinIO and keyed by the experiment ID.
+
+A checkpoint is either a directory that the training library writes by itself (e.g., the Hugging Face
+`checkpoint-<step>` directories of REaLTabFormer), which is synced to MinIO periodically while training runs,
+or the bytes of a fitted model (e.g., a fitted Synthcity plugin). A restarted experiment restores the
+checkpoint before training and resumes from it. Checkpoints are deleted once the experiment is stored.
+"""
+import io
+import os
+import tarfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def _checkpoint_object_name(checkpoint_id: str, file_name: str) -> str:
+    from synqtab.enums import MinioFolder
+
+    return MinioFolder.create_prefix('checkpoints', checkpoint_id, file_name)
+
+
+def get_local_checkpoint_directory(checkpoint_id: str) -> Path:
+    """Returns a local working directory for the checkpoints of the experiment."""
+    import tempfile
+
+    local_directory = Path(tempfile.gettempdir()) / 'synqtab-checkpoints' / checkpoint_id.replace(os.sep, '_')
+    local_directory.mkdir(parents=True, exist_ok=True)
+    return local_directory
+
+
+def read_checkpoint_bytes(checkpoint_id: str, file_name: str) -> Optional[bytes]:
+    """Returns the bytes of a checkpoint file, or None if the experiment has no such checkpoint."""
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket
+
+    object_name = _checkpoint_object_name(checkpoint_id, file_name)
+    if not StorageClient.object_exists(bucket_name=MinioBucket.MODELS, object_name=object_name):
+        return None
+    LOG.info(f"Restoring checkpoint '{object_name}'.")
+    return StorageClient.read_bytes_from_bucket(bucket_name=MinioBucket.MODELS, object_name=object_name)
+
+
+def upload_checkpoint_bytes(data: bytes, checkpoint_id: str, file_name: str) -> None:
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket
+
+    object_name = _checkpoint_object_name(checkpoint_id, file_name)
+    StorageClient.upload_bytes_to_bucket(data=data, bucket_name=MinioBucket.MODELS, object_name=object_name)
+    LOG.info(f"Uploaded checkpoint '{object_name}' ({len(data) / 2**20:.1f} MiB).")
+
+
+def get_latest_checkpoint_subdirectory(local_directory: str | Path) -> Optional[Path]:
+    """Returns the `checkpoint-<step>` subdirectory with the highest step that was completely written, if any.
+    The trainer state is the last file that a Hugging Face trainer writes into a checkpoint."""
+    checkpoints = [
+        path for path in Path(local_directory).glob('checkpoint-*')
+        if path.name.split('-')[-1].isdigit() and (path / 'trainer_state.json').exists()
+    ]
+    return max(checkpoints, key=lambda path: int(path.name.split('-')[-1]), default=None)
+
+
+def upload_checkpoint_directory(local_directory: str | Path, checkpoint_id: str) -> None:
+    """Uploads the directory as one archive, with only its latest `checkpoint-<step>` subdirectory.
+    The archive replaces the previous one in a single PUT, so a restore never sees a partial checkpoint."""
+    local_directory = Path(local_directory)
+    latest_checkpoint = get_latest_checkpoint_subdirectory(local_directory)
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for path in local_directory.iterdir():
+            if path.name.startswith('checkpoint-') and path != latest_checkpoint:
+                continue
+            archive.add(path, arcname=path.name)
+    upload_checkpoint_bytes(buffer.getvalue(), checkpoint_id, 'checkpoint.tar.gz')
+
+
+def restore_checkpoint_directory(local_directory: str | Path, checkpoint_id: str) -> bool:
+    """Extracts the uploaded archive of the experiment into the directory. Returns whether there was one."""
+    data = read_checkpoint_bytes(checkpoint_id, 'checkpoint.tar.gz')
+    if data is None:
+        return False
+
+    with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as archive:
+        archive.extractall(local_directory, filter='data')
+    return True
+
+
+def delete_checkpoints(checkpoint_id: str) -> None:
+    """Deletes all checkpoints of the experiment, e.g., once its synthetic data are stored."""
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket
+
+    prefix = _checkpoint_object_name(checkpoint_id, '')
+    object_keys = [obj['Key'] for obj in StorageClient.list_bucket_objects(bucket_name=MinioBucket.MODELS, prefix=prefix)]
+    if object_keys:
+        StorageClient.delete_files_from_bucket(bucket_name=MinioBucket.MODELS, object_keys=object_keys)
+        LOG.info(f"Deleted {len(object_keys)} checkpoint objects of '{checkpoint_id}'.")
+
+
+class CheckpointDirectorySync:
+    """Uploads the checkpoint directory of a running training every `interval` seconds, whenever the library
+    has written a newer `checkpoint-<step>` subdirectory. Use as a context manager around the training call.
+
+    Example:
+        with CheckpointDirectorySync(local_directory, checkpoint_id=str(experiment)):
+            model.fit(df, resume_from_checkpoint=restored)
+    """
+
+    def __init__(self, local_directory: str | Path, checkpoint_id: str, interval: Optional[float] = None):
+        from synqtab.environment import GENERATOR_CHECKPOINT_INTERVAL
+
+        self.local_directory = Path(local_directory)
+        self.checkpoint_id = checkpoint_id
+        self.interval = GENERATOR_CHECKPOINT_INTERVAL if interval is None else interval
+        self._stopped = threading.Event()
+        self._thread = None
+        self._uploaded_checkpoint = get_latest_checkpoint_subdirectory(self.local_directory)
+
+    def sync(self) -> bool:
+        """Uploads the latest checkpoint if it is newer than the last uploaded one. Returns whether it did."""
+        latest_checkpoint = get_latest_checkpoint_subdirectory(self.local_directory)
+        if latest_checkpoint is None or latest_checkpoint == self._uploaded_checkpoint:
+            return False
+        try:
+            upload_checkpoint_directory(self.local_directory, self.checkpoint_id)
+        except Exception as e:
+            # e.g., the trainer rotated the checkpoint away while it was archived; the next round retries
+            LOG.warning(f"Could not upload the checkpoint of '{self.checkpoint_id}': {e}")
+            return False
+        self._uploaded_checkpoint = latest_checkpoint
+        return True
+
+    def _run(self) -> None:
+        next_sync = time.monotonic() + self.interval
+        while not self._stopped.wait(timeout=max(0.0, next_sync - time.monotonic())):
+            self.sync()
+            next_sync = time.monotonic() + self.interval
+
+    def __enter__(self) -> 'CheckpointDirectorySync':
+        if self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name=f'checkpoint-sync-{self.checkpoint_id}', daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,132 @@
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_COMPUTABLE_SDTYPES = {'numerical', 'datetime', 'categorical'}
+
+
+def encode_for_detection(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    metadata: Optional[dict[str, Any]] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Encodes the real and synthetic data into numeric matrices the same way SDMetrics' detection metrics do
+    internally (see `sdmetrics.utils.HyperTransformer`): numerical columns are mean-imputed, boolean columns are
+    mode-imputed, datetime columns are turned into integers and categorical columns are one-hot encoded.
+    All transformations are fitted on the real data. Columns whose sdtype cannot be modeled are dropped.
+
+    Unlike SDMetrics, the synthetic data is aligned to the column order of the real data and categories that
+    do not appear in the real data are encoded as all-zeros instead of raising an error.
+
+    Args:
+        real_data (pd.DataFrame): the real data.
+        synthetic_data (pd.DataFrame): the synthetic data.
+        metadata (dict[str, Any], optional): sdmetrics metadata. Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: the encoded real and synthetic matrices.
+    """
+    from sklearn.preprocessing import OneHotEncoder
+    
+    columns = list(real_data.columns)
+    if metadata is not None:
+        columns_metadata = metadata.get('columns', dict())
+        columns = [
+            column for column in columns
+            if columns_metadata.get(column, dict()).get('sdtype') in _COMPUTABLE_SDTYPES
+            and not columns_metadata.get(column, dict()).get('pii')
+        ]
+    
+    # numeric-like columns keep their position, one-hot encoded columns are appended at the end (as in SDMetrics)
+    real_numeric, synthetic_numeric = [], []
+    real_one_hot, synthetic_one_hot = [], []
+    for column in columns:
+        kind = real_data[column].dropna().infer_objects().dtype.kind
+        
+        if kind in ('i', 'f'):
+            mean = real_data[column].mean()
+            real_numeric.append(real_data[column].fillna(mean).to_numpy(dtype=float))
+            synthetic_numeric.append(
+                pd.to_numeric(synthetic_data[column], errors='coerce').fillna(mean).to_numpy(dtype=float)
+            )
+        
+        elif kind == 'b':
+            mode = pd.to_numeric(real_data[column], errors='coerce').astype(float).mode().iloc[0]
+            for data, output in ((real_data, real_numeric), (synthetic_data, synthetic_numeric)):
+                output.append(pd.to_numeric(data[column], errors='coerce').astype(float).fillna(mode).to_numpy())
+        
+        elif kind == 'O':
+            encoder = OneHotEncoder(handle_unknown='ignore')
+            encoder.fit(pd.DataFrame({'field': real_data[column]}))
+            real_one_hot.append(encoder.transform(pd.DataFrame({'field': real_data[column]})).toarray())
+            synthetic_one_hot.append(encoder.transform(pd.DataFrame({'field': synthetic_data[column]})).toarray())
+        
+        elif kind == 'M':
+            def _to_float(values: pd.Series) -> np.ndarray:
+                integers = pd.to_numeric(values, errors='coerce').to_numpy().astype(np.float64)
+                integers[values.isna().to_numpy()] = np.nan
+                return integers
+            
+            real_integers = _to_float(real_data[column])
+            mean = np.nanmean(real_integers)
+            real_numeric.append(np.where(np.isnan(real_integers), mean, real_integers))
+            synthetic_integers = _to_float(synthetic_data[column])
+            synthetic_numeric.append(np.where(np.isnan(synthetic_integers), mean, synthetic_integers))
+    
+    def _stack(numeric: list[np.ndarray], one_hot: list[np.ndarray], n_rows: int) -> np.ndarray:
+        blocks = [block.reshape(n_rows, -1) for block in numeric] + one_hot
+        if not blocks:
+            return np.empty((n_rows, 0))
+        return np.column_stack(blocks).astype(float)
+    
+    return (
+        _stack(real_numeric, real_one_hot, len(real_data)),
+        _stack(synthetic_numeric, synthetic_one_hot, len(synthetic_data)),
+    )
+
+
+def compute_detection_score(
+    real_matrix: np.ndarray,
+    synthetic_matrix: np.ndarray,
+    get_classifier: Callable[[], Any],
+    n_splits: int = 3,
+) -> float:
+    """Computes the detection score of SDMetrics' `DetectionMetric` on already encoded matrices (see
+    `encode_for_detection`): a classifier is trained to tell real from synthetic rows and is evaluated with
+    stratified cross validation. The score is one minus the average (rescaled) ROC AUC, so higher is better.
+
+    Args:
+        real_matrix (np.ndarray): the encoded real data.
+        synthetic_matrix (np.ndarray): the encoded synthetic data.
+        get_classifier (Callable): returns a new, unfitted scikit-learn classifier with `predict_proba`.
+        n_splits (int, optional): the number of cross validation folds. Defaults to 3.
+
+    Returns:
+        float: the detection score in [0, 1].
+    """
+    from sklearn.impute import SimpleImputer
+    from sklearn.metrics import roc_auc_score
+    from sklearn.model_selection import StratifiedKFold
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import RobustScaler
+    
+    X = np.concatenate([real_matrix, synthetic_matrix])
+    y = np.hstack([np.ones(len(real_matrix)), np.zeros(len(synthetic_matrix))])
+    X[np.isinf(X)] = np.nan
+    
+    scores = []
+    kf = StratifiedKFold(n_splits=n_splits, shuffle=True)
+    for train_index, test_index in kf.split(X, y):
+        model = Pipeline([
+            ('imputer', SimpleImputer()),
+            ('scalar', RobustScaler()),
+            ('classifier', get_classifier()),
+        ])
+        model.fit(X[train_index], y[train_index])
+        y_pred = model.predict_proba(X[test_index])[:, 1]
+        roc_auc = roc_auc_score(y[test_index], y_pred)
+        scores.append(max(0.5, roc_auc) * 2 - 1)
+    
+    return float(1 - np.mean(scores))
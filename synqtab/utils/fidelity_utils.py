@@ -0,0 +1,100 @@
+from typing import Callable, Optional
+
+from synqtab.enums import EvaluationMethod, EvaluationTarget
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def successive_halving(
+    experiments: list,
+    evaluation_method: EvaluationMethod,
+    evaluation_targets: tuple[EvaluationTarget, ...],
+    fidelity_levels: Optional[list[float]] = None,
+    eta: int = 3,
+    key: Optional[Callable[[float], float]] = None,
+    maximize: bool = True,
+    force: bool = False,
+) -> dict[float, dict[str, float]]:
+    """Evaluates many experiments (e.g., different generator and data error configurations) cheaply with successive
+    halving: all experiments are evaluated on the lowest fidelity level (fraction of rows); only the best `1/eta` of
+    them, according to `key`, are promoted to the next fidelity level, and so on up to the highest level. Every result
+    is stored in Postgres with its fidelity level, so reduced-fidelity results never mix with full ones. The perfect
+    baselines (e.g., R-S) of non-perfect experiments are evaluated on their perfect counterpart, and experiments without
+    a result (e.g., skipped computations) are promoted without being ranked.
+
+    Args:
+        experiments (list[Experiment]): the experiments to evaluate; their synthetic data must already exist.
+        evaluation_method (EvaluationMethod): the evaluation method to rank the experiments by.
+        evaluation_targets (tuple[EvaluationTarget, ...]): the evaluation targets, e.g., `(EvaluationTarget.R, EvaluationTarget.SH)`.
+        fidelity_levels (list[float], optional): the increasing fidelity levels. Defaults to `FIDELITY_LEVELS` of the environment.
+        eta (int, optional): the reduction factor between consecutive levels. Defaults to 3.
+        key (Callable[[float], float], optional): maps a result to how interesting it is, e.g., `abs` to promote the most
+        extreme results. Defaults to None, i.e., the result itself.
+        maximize (bool, optional): whether higher `key` values are more interesting. Defaults to True.
+        force (bool, optional): passed to `Evaluation.run()`. Defaults to False.
+
+    Returns:
+        dict[float, dict[str, float]]: the results of each fidelity level, keyed by experiment id.
+    """
+    import math
+    from synqtab.data import ResultsClient
+    from synqtab.environment import FIDELITY_LEVELS
+    from synqtab.evaluators import Evaluation
+
+    fidelity_levels = sorted(fidelity_levels if fidelity_levels is not None else FIDELITY_LEVELS)
+    key = key if key is not None else (lambda result: result)
+
+    survivors = list(experiments)
+    results_per_fidelity = dict()
+    for level, fidelity in enumerate(fidelity_levels):
+        results, unscored_ids = dict(), set()
+        for experiment in survivors:
+            evaluation = Evaluation(
+                *evaluation_targets,
+                experiment=experiment,
+                evaluation_method=evaluation_method,
+                fidelity=fidelity,
+            )
+            if not evaluation._is_valid():
+                continue
+            if experiment.data_error is not None and evaluation.is_perfect_baseline():
+                # the perfect baselines (R-S) are computed and stored by the perfect experiment
+                evaluation = Evaluation(
+                    *evaluation_targets,
+                    experiment=experiment.perfect_counterpart(),
+                    evaluation_method=evaluation_method,
+                    fidelity=fidelity,
+                )
+            try:
+                evaluation.run(force=force)
+            except Exception as e:
+                LOG.error(
+                    f"Evaluation {str(evaluation)}/{str(experiment)} failed and will not be promoted. Error: {e}",
+                    extra={'experiment_id': str(experiment)}
+                )
+                continue
+
+            # already existing evaluations are skipped by run(), so their result is read back from Postgres
+            result = evaluation.result
+            if result is None:
+                result = ResultsClient.read_evaluation_result(str(evaluation), str(evaluation.experiment))
+            if result is not None:
+                results[str(experiment)] = result
+            else:
+                # e.g., a computation that was recorded as skipped; it cannot be ranked, so it is not dropped either
+                LOG.warning(f"Evaluation {str(evaluation)}/{str(evaluation.experiment)} has no result; it is promoted unranked.")
+                unscored_ids.add(str(experiment))
+
+        results_per_fidelity[fidelity] = results
+        if level == len(fidelity_levels) - 1:
+            break
+
+        nof_promoted = max(1, math.ceil(len(results) / eta))
+        promoted_ids = set(sorted(results, key=lambda experiment_id: key(results[experiment_id]), reverse=maximize)[:nof_promoted])
+        survivors = [experiment for experiment in survivors if str(experiment) in promoted_ids | unscored_ids]
+        LOG.info(f"Promoted {len(survivors)} of {len(results) + len(unscored_ids)} experiments from fidelity {fidelity} to "
+                 f"{fidelity_levels[level + 1]} ({len(unscored_ids)} of them unranked).")
+
+    return results_per_fidelity
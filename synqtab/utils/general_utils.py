@@ -19,42 +19,46 @@ def get_experimental_params_for_normal() -> dict[str, Any]:
     from pprint import pp
     import random
 
-    from synqtab.data import MinioClient
+    from synqtab.data import StorageClient
     from synqtab.enums import (
         DataErrorType, DataPerfectness,
         QUALITY_EVALUATORS, ML_FOCUSED_EVALUATORS,
         GENERIC_MODELS, MinioBucket, MinioFolder
     )
-    from synqtab.environment import RANDOM_SEEDS, ERROR_RATES
-    
-    random_seeds = copy.deepcopy(RANDOM_SEEDS); random.shuffle(random_seeds)
+    from synqtab.environment import RANDOM_SEEDS, ERROR_RATES, JOB_ORDERING
+
+    # with cost-aware ordering the jobs are ordered by their predicted runtime, so the parameters are only
+    # sorted to keep the enumeration deterministic across workers
+    shuffle = random.shuffle if JOB_ORDERING == 'random' else lambda values: values.sort(key=str)
+
+    random_seeds = copy.deepcopy(RANDOM_SEEDS); shuffle(random_seeds)
     pp(f"{random_seeds=}")
 
-    dataset_names = MinioClient.list_files_in_bucket_by_file_extension(
+    dataset_names = StorageClient.list_files_in_bucket_by_file_extension(
         bucket_name=MinioBucket.REAL.value,
         file_extension='parquet',
         prefix=MinioFolder.create_prefix(MinioFolder.PERFECT, MinioFolder.DATA),
-    ); random.shuffle(dataset_names)
+    ); shuffle(dataset_names)
     pp(f"{dataset_names=}", compact=True); print()
 
-    models = copy.deepcopy(GENERIC_MODELS); random.shuffle(models)
+    models = copy.deepcopy(GENERIC_MODELS); shuffle(models)
     models = [model for model in models if model != GeneratorModel.TABEBM] # temporarily exclude tabebm
     # models = [model for model in models if model != GeneratorModel.TABPFN] # temporarily exclude tabpfn
     models = [model for model in models if model != GeneratorModel.ARF] # ARF only utilizes CPU and wastes quota
     models = [model for model in models if model != GeneratorModel.REALTABFORMER] # realtabformer.realtabformer.REaLTabFormer.sample() argument after ** must be a mapping, not NoneType'
     pp(f"{models=}", compact=True); print()
 
-    error_types = [error for error in DataErrorType]; random.shuffle(error_types)
+    error_types = [error for error in DataErrorType]; shuffle(error_types)
     pp(f"{error_types=}", compact=True); print()
 
-    error_rates = copy.deepcopy(ERROR_RATES); random.shuffle(error_rates)
+    error_rates = copy.deepcopy(ERROR_RATES); shuffle(error_rates)
     pp(f"{error_rates=}")
 
     data_perfectness_levels = [DataPerfectness.IMPERFECT, DataPerfectness.SEMIPERFECT]
-    random.shuffle(data_perfectness_levels)
+    shuffle(data_perfectness_levels)
     pp(f"{data_perfectness_levels=}", compact=True); print()
 
-    evaluation_methods = copy.deepcopy(QUALITY_EVALUATORS + ML_FOCUSED_EVALUATORS); random.shuffle(evaluation_methods)
+    evaluation_methods = copy.deepcopy(QUALITY_EVALUATORS + ML_FOCUSED_EVALUATORS); shuffle(evaluation_methods)
     pp(f"{evaluation_methods=}", compact=True); print()
     
     return {
@@ -65,4 +69,11 @@ def get_experimental_params_for_normal() -> dict[str, Any]:
         'error_rates': error_rates,
         'data_perfectness_levels': data_perfectness_levels,
         'evaluation_methods': evaluation_methods,
-    }
\ No newline at end of file
+    }
+
+def stable_hash64(text: str) -> int:
+    """A 64-bit hash of the text that is the same in every process and Python version (unlike `hash()`), as a
+    signed integer that fits a BIGINT column, e.g., the `experiment_key` of an experiment ID."""
+    from hashlib import blake2b
+
+    return int.from_bytes(blake2b(text.encode(), digest_size=8).digest(), 'big', signed=True)
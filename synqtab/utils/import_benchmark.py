@@ -0,0 +1,108 @@
+"""Measures how long it takes to import the synqtab modules that every worker imports, each in a fresh
+interpreter, and which heavy frameworks they pull in. Exits with a non-zero status if an import exceeds
+the time budget or loads a heavy framework, so that slow startups do not creep back in.
+
+Example:
+    python -m synqtab.utils.import_benchmark --max-seconds 3
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Optional
+
+
+# modules that are imported by every evaluation and generation worker
+DEFAULT_MODULES = [
+    'synqtab.enums',
+    'synqtab.reproducibility',
+    'synqtab.errors',
+    'synqtab.mappings',
+    'synqtab.evaluators',
+    'synqtab.generators',
+    'synqtab.experiments',
+]
+
+# frameworks that must only be imported when a generator or evaluator that needs them runs
+HEAVY_MODULES = ['torch', 'tensorflow', 'synthcity', 'matplotlib', 'realtabformer', 'tabpfn', 'tabebm']
+
+_MEASUREMENT_CODE = """
+import json, sys, time
+start = time.perf_counter()
+import {module_name}
+elapsed_time = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed_time,
+    'heavy_modules': [name for name in {heavy_modules!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_import_time(module_name: str, repeats: int = 3) -> dict:
+    """Imports the module in `repeats` fresh interpreters and returns the best time in seconds and the
+    heavy frameworks that the import loaded. If the import fails, returns its `returncode` and `error`
+    (the last line of its stderr) instead, and `seconds` is None."""
+    measurements = []
+    for _ in range(repeats):
+        completed_process = subprocess.run(
+            [sys.executable, '-c', _MEASUREMENT_CODE.format(module_name=module_name, heavy_modules=HEAVY_MODULES)],
+            capture_output=True, text=True,
+        )
+        if completed_process.returncode != 0:
+            stderr_lines = completed_process.stderr.strip().splitlines()
+            return {
+                'module': module_name,
+                'seconds': None,
+                'heavy_modules': [],
+                'returncode': completed_process.returncode,
+                'error': stderr_lines[-1] if stderr_lines else '',
+            }
+        measurements.append(json.loads(completed_process.stdout.strip().splitlines()[-1]))
+
+    return {
+        'module': module_name,
+        'seconds': min(measurement['seconds'] for measurement in measurements),
+        'heavy_modules': measurements[0]['heavy_modules'],
+    }
+
+
+def run_import_benchmark(
+    module_names: Optional[list[str]] = None, repeats: int = 3, max_seconds: Optional[float] = None
+) -> tuple[list[dict], bool]:
+    """Measures every module and returns the measurements and whether all of them are within budget."""
+    module_names = module_names if module_names else DEFAULT_MODULES
+    results = [measure_import_time(module_name, repeats=repeats) for module_name in module_names]
+
+    passed = True
+    for result in results:
+        result['passed'] = (
+            result['seconds'] is not None
+            and not result['heavy_modules']
+            and (max_seconds is None or result['seconds'] <= max_seconds)
+        )
+        passed = passed and result['passed']
+    return results, passed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the import time of the synqtab modules.')
+    parser.add_argument('modules', nargs='*', help=f'the modules to import. Defaults to {DEFAULT_MODULES}.')
+    parser.add_argument('--repeats', type=int, default=3, help='fresh interpreters per module; the best time is kept.')
+    parser.add_argument('--max-seconds', type=float, default=None, help='the time budget of each import.')
+    parser.add_argument('--output', default=None, help='a JSON file to write the measurements to.')
+    args = parser.parse_args()
+
+    results, passed = run_import_benchmark(args.modules, repeats=args.repeats, max_seconds=args.max_seconds)
+    for result in results:
+        status = 'OK' if result['passed'] else 'FAIL'
+        if result['seconds'] is None:
+            print(f"[{status}] {result['module']}: import failed with exit code {result['returncode']}: {result['error']}")
+            continue
+        heavy_modules = f" (loads {', '.join(result['heavy_modules'])})" if result['heavy_modules'] else ''
+        print(f"[{status}] {result['module']}: {result['seconds']:.3f}s{heavy_modules}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    sys.exit(0 if passed else 1)
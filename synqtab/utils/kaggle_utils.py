@@ -4,7 +4,7 @@ import subprocess
 import time
 from pathlib import Path
 import yaml
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 from dotenv import load_dotenv
@@ -36,7 +36,9 @@ def execute_single_script(
         enable_gpu: bool = False,
         enable_internet: bool = True,
         is_private: bool = True,
-        accelerator: str = "NvidiaTeslaT4"
+        accelerator: str = "NvidiaTeslaT4",
+        credential_name: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
 ) -> KernelStatus:
     """
     Execute a Python script on Kaggle using the Kaggle Kernels API.
@@ -49,6 +51,8 @@ def execute_single_script(
         enable_internet: Whether to enable internet
         is_private: Whether the kernel should be private
         accelerator: Accelerator ID (e.g., "NvidiaTeslaP100", "NvidiaTeslaT4", "TpuV6E8"), defaults to "NvidiaTeslaT4"
+        credential_name: Credential file to push with (see `set_kaggle_credentials`); defaults to the active kaggle.json
+        environment: Environment variables to set in a first cell of the pushed notebook, e.g., WORKER_INDEX
     """
     script_path = Path(script_path)
 
@@ -75,8 +79,8 @@ def execute_single_script(
     }
 
     # Create temp directory for kernel files
-    temp_dir = Path("temp_kaggle_kernel")
-    temp_dir.mkdir(exist_ok=True)
+    import tempfile
+    temp_dir = Path(tempfile.mkdtemp(prefix="temp_kaggle_kernel-"))
 
     # Write metadata
     metadata_path = temp_dir / "kernel-metadata.json"
@@ -90,6 +94,8 @@ def execute_single_script(
 
     # Fix notebook metadata to ensure Kaggle compatibility
     fix_notebook_metadata(temp_notebook_path)
+    if environment:
+        prepend_environment_cell(temp_notebook_path, environment)
 
     # 6. Push to Kaggle
     push_command = ["kaggle", "kernels", "push", "-p", str(temp_dir)]
@@ -101,7 +107,8 @@ def execute_single_script(
     result = subprocess.run(
         push_command,
         capture_output=True,
-        text=True
+        text=True,
+        env=get_kaggle_credentials_env(credential_name) if credential_name else None,
     )
 
     # Cleanup
@@ -144,13 +151,27 @@ def fix_notebook_metadata(file_path):
         nbformat.write(nb, f)
 
 
-def get_kaggle_kernel_status(kernel_slug: str, username: str) -> dict:
+def prepend_environment_cell(file_path, environment: Dict[str, str]):
+    import nbformat
+    with open(file_path, 'r', encoding='utf-8') as f:
+        nb = nbformat.read(f, as_version=4)
+
+    environment = {str(name): str(value) for name, value in environment.items()}
+    nb.cells.insert(0, nbformat.v4.new_code_cell(f"import os\nos.environ.update({environment!r})"))
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        nbformat.write(nb, f)
+
+
+def get_kaggle_kernel_status(kernel_slug: str, username: str, credential_name: Optional[str] = None) -> dict:
     """
     Get the current status of a Kaggle kernel.
 
     Args:
         kernel_slug: The kernel slug (derived from title)
         username: The Kaggle username for this kernel
+        credential_name: Credential file to check with; defaults to the active kaggle.json.
+                         Unlike `set_kaggle_credentials`, this is safe to use from many threads.
 
     Returns:
         dict: Dictionary containing status information
@@ -160,7 +181,8 @@ def get_kaggle_kernel_status(kernel_slug: str, username: str) -> dict:
     result = subprocess.run(
         ["kaggle", "kernels", "status", kernel_ref],
         capture_output=True,
-        text=True
+        text=True,
+        env=get_kaggle_credentials_env(credential_name) if credential_name else None,
     )
 
     if result.returncode != 0:
@@ -184,22 +206,62 @@ def get_kaggle_kernel_status(kernel_slug: str, username: str) -> dict:
 # MULTI-PROFILE SUPPORT
 @dataclass
 class ProfileJob:
-    """Represents a job for a specific Kaggle profile."""
-    profile_name: str
+    """Represents a script in the global queue. `profile_name` is the profile that runs (or last ran) it."""
+    profile_name: Optional[str]
     script_path: str
-    kernel_slug: str
+    kernel_slug: Optional[str]
     status: KernelStatus
     retry_count: int = 0
+    estimated_seconds: Optional[float] = None
+    started_at: Optional[float] = None
+    worker_index: int = 0
+    worker_count: int = 1
+
+
+def get_script_runtime_estimates(script_paths: list[str]) -> Dict[str, float]:
+    """Estimates the runtime of each script as the mean runtime of its past complete runs in the results store.
+    Scripts without past runs are left out. Returns no estimates if the store is unreachable."""
+    from synqtab.data.clients.ResultsClient import ResultsClient
+
+    try:
+        return ResultsClient.read_script_runtime_estimates(script_paths)
+    except Exception as e:
+        logger.warning(f"Could not read past script runtimes; keeping the YAML order. Error: {e}")
+        return dict()
+
+
+def record_script_run(job: ProfileJob, status: KernelStatus) -> None:
+    """Records the runtime of a finished job, so that later schedules can order the scripts by it."""
+    from synqtab.data.clients.ResultsClient import ResultsClient
+
+    if job.started_at is None:
+        return
+    try:
+        ResultsClient.write_script_run(
+            script_path=job.script_path,
+            profile_name=job.profile_name,
+            kernel_slug=job.kernel_slug,
+            status=status.value,
+            runtime_seconds=time.time() - job.started_at,
+        )
+    except Exception as e:
+        logger.warning(f"Could not record the runtime of {job.script_path}. Error: {e}")
 
 
 def run_kaggle_scripts_multi_profile(
         yaml_path: str,
         max_retries: int = 3,
-        check_interval: int = 30
+        check_interval: int = 30,
+        max_status_workers: int = 8,
 ):
     """
     Execute multiple Kaggle scripts across different profiles based on YAML configuration.
 
+    All scripts go into one global queue, ordered longest-estimated-first by their past runtimes (scripts that
+    never ran go first, in YAML order). Whenever a profile has a free slot, it takes the next pending script,
+    so profiles with short scripts take over the work of busy profiles. Failed scripts are put back in the queue
+    and may be retried on any profile. The status of the running kernels is checked in parallel.
+
     The YAML file should have the following structure:
 
     profiles:
@@ -215,20 +277,30 @@ def run_kaggle_scripts_multi_profile(
         scripts:
           - path/to/script3.py
 
+    scripts:                  # optional; scripts without a preferred profile
+      - path/to/script4.py
+
     common_settings:
       title_prefix: experiment
       enable_gpu: true
       enable_internet: true
       is_private: true
 
+    The scripts of a profile are queued like the others; when its turn comes, a script runs on its own
+    profile if that has a free slot, else on the profile with the most free slots.
+
     Args:
         yaml_path: Path to YAML file with multi-profile Kaggle settings
         max_retries: Maximum retry attempts for failed scripts
         check_interval: Seconds between status checks
+        max_status_workers: Threads that check the status of the running kernels
 
     Returns:
         Dict with completed, failed scripts, and job details per profile
     """
+    import bisect
+    from concurrent.futures import ThreadPoolExecutor
+
     # Load YAML configuration
     with open(yaml_path, 'r') as f:
         config = yaml.safe_load(f)
@@ -246,36 +318,60 @@ def run_kaggle_scripts_multi_profile(
     is_private = common_settings.get('is_private', True)
     accelerator = common_settings.get('accelerator', 'NvidiaTeslaT4')
 
-    # Initialize jobs per profile
+    # Initialize profiles and the global job queue
     all_jobs: Dict[str, ProfileJob] = {}
     profile_info: Dict[str, Dict] = {}
 
     for profile_config in profiles_config:
         profile_name = profile_config['name']
         credential_name = profile_config['credential_name']
-        max_concurrent = profile_config.get('max_concurrent', 5)
-        scripts = profile_config.get('scripts', [])
 
         profile_info[profile_name] = {
             'credential_name': credential_name,
-            'max_concurrent': max_concurrent,
+            'max_concurrent': profile_config.get('max_concurrent', 5),
             'running': set(),
             'completed': set(),
             'failed': set(),
             'username': credential_name  # Credential name must match kaggle username
         }
 
-        # Create jobs for this profile
-        for idx, script_path in enumerate(scripts):
-            kernel_slug = f"{title_prefix}-{profile_name}-{idx}".lower().replace(' ', '-')
-            job_id = f"{profile_name}::{script_path}"
-
-            all_jobs[job_id] = ProfileJob(
-                profile_name=profile_name,
-                script_path=script_path,
-                kernel_slug=kernel_slug,
-                status=KernelStatus.PENDING
-            )
+    scripts_with_profiles = [
+        (profile_config['name'], script_path)
+        for profile_config in profiles_config
+        for script_path in profile_config.get('scripts', [])
+    ] + [(None, script_path) for script_path in config.get('scripts', [])]
+
+    for idx, (profile_name, script_path) in enumerate(scripts_with_profiles):
+        all_jobs[f"{idx}::{script_path}"] = ProfileJob(
+            profile_name=profile_name,
+            script_path=script_path,
+            kernel_slug=None,
+            status=KernelStatus.PENDING
+        )
+
+    # the copies of the same script are the workers of one sweep; each gets its share of the jobs
+    jobs_per_script: Dict[str, list] = {}
+    for job in all_jobs.values():
+        jobs_per_script.setdefault(job.script_path, []).append(job)
+    for copies in jobs_per_script.values():
+        for worker_index, job in enumerate(copies):
+            job.worker_index, job.worker_count = worker_index, len(copies)
+
+    runtime_estimates = get_script_runtime_estimates(sorted({job.script_path for job in all_jobs.values()}))
+    for job in all_jobs.values():
+        job.estimated_seconds = runtime_estimates.get(job.script_path)
+
+    def queue_key(job_id: str) -> float:
+        # longest first; unknown runtimes count as the longest
+        estimated_seconds = all_jobs[job_id].estimated_seconds
+        return -estimated_seconds if estimated_seconds is not None else float('-inf')
+
+    # the sort is stable, so ties keep the YAML order
+    pending_job_ids = sorted(all_jobs, key=queue_key)
+
+    def requeue(job_id: str) -> None:
+        """Put a job back in the queue, after the pending jobs with the same estimated runtime."""
+        bisect.insort(pending_job_ids, job_id, key=queue_key)
 
     # Calculate total jobs
     total_jobs = len(all_jobs)
@@ -295,69 +391,58 @@ def run_kaggle_scripts_multi_profile(
         job.status = KernelStatus.FAILED
         total_failed += 1
 
-    def submit_job(job_id: str) -> bool:
-        """Submit a job to Kaggle for a specific profile. Returns True if successful."""
+    def retry_or_fail(job_id: str) -> None:
         job = all_jobs[job_id]
-        profile = profile_info[job.profile_name]
+        if job.retry_count < max_retries:
+            job.retry_count += 1
+            job.status = KernelStatus.PENDING
+            requeue(job_id)
+            logger.info(f"⟳ Retry {job.retry_count}/{max_retries} [{job.profile_name}]: {job.script_path}")
+        else:
+            mark_failed(job_id)
+            logger.error(f"✗ Failed permanently [{job.profile_name}]: {job.script_path}")
+
+    def submit_job(job_id: str, profile_name: str) -> bool:
+        """Submit a job to Kaggle on a specific profile. Returns True if successful."""
+        job = all_jobs[job_id]
+        profile = profile_info[profile_name]
+        job.profile_name = profile_name
+        job.kernel_slug = f"{title_prefix}-{profile_name}-{job_id.split('::')[0]}".lower().replace(' ', '-')
 
         try:
-            # Set credentials for this profile before submission
-            set_kaggle_credentials(profile['credential_name'])
-
-            status = execute_single_script(
+            job.status = execute_single_script(
                 script_path=job.script_path,
                 username=profile['username'],
                 title=f"{job.kernel_slug}",
                 enable_gpu=enable_gpu,
                 enable_internet=enable_internet,
                 is_private=is_private,
-                accelerator=accelerator
+                accelerator=accelerator,
+                credential_name=profile['credential_name'],
+                environment={'WORKER_INDEX': job.worker_index, 'WORKER_COUNT': job.worker_count},
             )
-
-            job.status = status
             if job.status == KernelStatus.FAILED:
-                if job.retry_count < max_retries:
-                    job.retry_count += 1
-                    job.status = KernelStatus.PENDING
-                    logger.info(
-                        f"⟳ Retry {job.retry_count}/{max_retries} [{job.profile_name}]: {job.script_path}"
-                    )
-                else:
-                    mark_failed(job_id)
-                    logger.error(
-                        f"✗ Failed permanently [{job.profile_name}]: {job.script_path}"
-                    )
+                retry_or_fail(job_id)
                 return False
-            
+
+            job.status = KernelStatus.RUNNING
+            job.started_at = time.time()
             profile['running'].add(job_id)
             logger.info(f"✓ Started [{job.profile_name}]: {job.script_path} (slug: {job.kernel_slug})")
             return True
 
         except Exception as e:
             logger.error(f"✗ Failed to submit [{job.profile_name}] {job.script_path}: {e}")
-            if job.retry_count < max_retries:
-                job.retry_count += 1
-                job.status = KernelStatus.PENDING
-                logger.info(
-                    f"⟳ Retry {job.retry_count}/{max_retries} [{job.profile_name}]: {job.script_path}"
-                )
-            else:
-                mark_failed(job_id)
-                logger.error(
-                    f"✗ Failed permanently [{job.profile_name}]: {job.script_path}"
-                )
+            retry_or_fail(job_id)
             return False
 
     def check_job_status(job_id: str) -> KernelStatus:
-        """Check status of a running job. Swaps credentials before checking."""
+        """Check status of a running job with the credentials of its profile. Safe to run in parallel."""
         job = all_jobs[job_id]
         profile = profile_info[job.profile_name]
 
         try:
-            # Swap credentials before checking status
-            set_kaggle_credentials(profile['credential_name'])
-
-            status_info = get_kaggle_kernel_status(job.kernel_slug, profile['username'])
+            status_info = get_kaggle_kernel_status(job.kernel_slug, profile['username'], profile['credential_name'])
 
             if status_info['is_complete']:
                 return KernelStatus.COMPLETE
@@ -373,59 +458,57 @@ def run_kaggle_scripts_multi_profile(
             return KernelStatus.FAILED
 
     # Main execution loop
-    while total_completed + total_failed < total_jobs:
-        # Check status of all running jobs across all profiles
-        for job_id in list(all_jobs.keys()):
-            job = all_jobs[job_id]
-            profile = profile_info[job.profile_name]
+    with ThreadPoolExecutor(max_workers=max_status_workers) as status_executor:
+        while total_completed + total_failed < total_jobs:
+            # Check status of all running jobs across all profiles, in parallel
+            running_job_ids = [job_id for profile in profile_info.values() for job_id in profile['running']]
+            statuses = status_executor.map(check_job_status, running_job_ids)
 
-            if job_id in profile['running']:
-                status = check_job_status(job_id)
+            for job_id, status in zip(running_job_ids, statuses):
+                job = all_jobs[job_id]
+                profile = profile_info[job.profile_name]
 
                 if status == KernelStatus.COMPLETE:
                     job.status = KernelStatus.COMPLETE
                     profile['running'].remove(job_id)
                     profile['completed'].add(job_id)
                     total_completed += 1
+                    record_script_run(job, KernelStatus.COMPLETE)
                     logger.info(f"✓ Completed [{job.profile_name}]: {job.script_path}")
                     notify_script_complete(job.script_path, job.kernel_slug)
 
                 elif status == KernelStatus.FAILED:
                     job.status = KernelStatus.FAILED
                     profile['running'].remove(job_id)
-                    
-                    if job.retry_count < max_retries:
-                        job.retry_count += 1
-                        job.status = KernelStatus.PENDING
-                        logger.info(f"⟳ Retry {job.retry_count}/{max_retries} [{job.profile_name}]: {job.script_path}")
-                        notify_script_failed(job.script_path, job.kernel_slug, job.retry_count, max_retries)
-                    else:
-                        mark_failed(job_id)
-                        logger.error(f"✗ Failed permanently [{job.profile_name}]: {job.script_path}")
-                        notify_script_failed(job.script_path, job.kernel_slug, job.retry_count, max_retries)
-
-        # Submit new jobs for each profile if slots available
-        for profile_name, profile in profile_info.items():
-            available_slots = profile['max_concurrent'] - len(profile['running'])
-
-            if available_slots > 0:
-                # Find pending jobs for this profile
-                pending_jobs = [
-                    job_id for job_id, job in all_jobs.items()
-                    if job.profile_name == profile_name
-                    and job.status == KernelStatus.PENDING
-                    and job_id not in profile['running']
-                ]
-
-                # Submit up to available_slots jobs
-                for job_id in pending_jobs[:available_slots]:
-                    submit_job(job_id)
-
-        # Wait before next check
-        any_running = any(len(p['running']) > 0 for p in profile_info.values())
-
-        if any_running:
-            time.sleep(check_interval)
+                    record_script_run(job, KernelStatus.FAILED)
+                    retry_or_fail(job_id)
+                    notify_script_failed(job.script_path, job.kernel_slug, job.retry_count, max_retries)
+
+            # Any profile with a free slot takes the next pending job. The profile with the most free slots goes
+            # first, and a profile whose submission fails is skipped until the next round (e.g., out of quota)
+            skipped_profiles = set()
+            while pending_job_ids:
+                free_slots = {
+                    profile_name: profile['max_concurrent'] - len(profile['running'])
+                    for profile_name, profile in profile_info.items()
+                    if profile_name not in skipped_profiles
+                }
+                free_slots = {profile_name: slots for profile_name, slots in free_slots.items() if slots > 0}
+                if not free_slots:
+                    break
+
+                job_id = pending_job_ids.pop(0)
+                preferred_profile = all_jobs[job_id].profile_name
+                profile_name = preferred_profile if preferred_profile in free_slots \
+                    else max(free_slots, key=free_slots.get)
+                if not submit_job(job_id, profile_name):
+                    skipped_profiles.add(profile_name)
+
+            # Wait before next check
+            any_running = any(len(p['running']) > 0 for p in profile_info.values())
+
+            if any_running:
+                time.sleep(check_interval)
 
     # Summary
     print(f"\n{'='*70}")
@@ -433,13 +516,12 @@ def run_kaggle_scripts_multi_profile(
     print(f"{'='*70}")
 
     for profile_name, profile in profile_info.items():
-        profile_total = len([j for j in all_jobs.values() if j.profile_name == profile_name])
         profile_completed = len(profile['completed'])
         profile_failed = len(profile['failed'])
 
         print(f"\nProfile: {profile_name}")
-        print(f"  Completed: {profile_completed}/{profile_total}")
-        print(f"  Failed: {profile_failed}/{profile_total}")
+        print(f"  Completed: {profile_completed}")
+        print(f"  Failed: {profile_failed}")
 
         if profile['failed']:
             print(f"  Failed scripts:")
@@ -457,6 +539,36 @@ def run_kaggle_scripts_multi_profile(
 
     notify_batch_summary(total_completed, total_failed, total_jobs, all_failed_scripts)
 
+    return {
+        'completed': [all_jobs[jid].script_path for p in profile_info.values() for jid in p['completed']],
+        'failed': all_failed_scripts,
+        'jobs': all_jobs,
+    }
+
+
+def _get_credential_file(credential_name: str) -> Path:
+    project_root = Path(__file__).parent.parent  # Go up from utils/ to project root
+    credential_file = project_root / "utils" / "kaggle_credentials" / f"{credential_name}.json"
+
+    # Validate credential file exists
+    if not credential_file.exists():
+        raise FileNotFoundError(f"Credential file not found at {credential_file}")
+    return credential_file
+
+
+def get_kaggle_credentials_env(credential_name: str) -> Dict[str, str]:
+    """
+    Return the environment for a Kaggle CLI call with the credentials of the credential pool.
+    The CLI reads KAGGLE_USERNAME and KAGGLE_KEY before kaggle.json, so calls with different
+    credentials can run concurrently without swapping the active kaggle.json.
+
+    Args:
+        credential_name: Name of the credential file (without .json extension), as in `set_kaggle_credentials`
+    """
+    with open(_get_credential_file(credential_name)) as f:
+        credentials = json.load(f)
+    return {**os.environ, 'KAGGLE_USERNAME': credentials['username'], 'KAGGLE_KEY': credentials['key']}
+
 
 def set_kaggle_credentials(credential_name: str):
     """
@@ -478,13 +590,7 @@ def set_kaggle_credentials(credential_name: str):
     current_file = kaggle_dir / "kaggle.json"
 
     # Credential file location in project
-    project_root = Path(__file__).parent.parent  # Go up from utils/ to project root
-    credentials_dir = project_root / "utils" / "kaggle_credentials"
-    credential_file = credentials_dir / f"{credential_name}.json"
-
-    # Validate credential file exists
-    if not credential_file.exists():
-        raise FileNotFoundError(f"Credential file not found at {credential_file}")
+    credential_file = _get_credential_file(credential_name)
 
     try:
         # Copy credential to active location
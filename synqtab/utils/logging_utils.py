@@ -1,31 +1,285 @@
 import logging
-from typing import Optional
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+
+def _record_to_runtime_error(handler: logging.Handler, record: logging.LogRecord) -> dict[str, Any]:
+    """Converts an ERROR record to the row of the `errors` table."""
+    from datetime import datetime
+    from zoneinfo import ZoneInfo
+
+    error_msg = record.getMessage()
+    if record.exc_info:
+        error_msg += f"\nTraceback: {handler.format(record)}"
+
+    return {
+        'experiment_id': getattr(record, "experiment_id", "SYSTEM_LOG"),
+        'file_path': f"{record.name}:{record.lineno}",
+        'error_message': error_msg,
+        # keep the time of the error, not the time of the (possibly delayed) write; same zone as the table default
+        'created_at': datetime.fromtimestamp(record.created, ZoneInfo('Europe/Athens')).replace(tzinfo=None).isoformat(),
+    }
 
 
 class PostgresDatabaseHandler(logging.Handler):
     """
     Custom logging handler that sends ERROR logs to the Postgres database.
+    Writes synchronously, one record per INSERT; see `AsyncPostgresDatabaseHandler` for the handler
+    that `get_logger()` uses.
     """
     def emit(self, record):
-        from synqtab.data.clients.PostgresClient import PostgresClient 
+        from synqtab.data.clients.ResultsClient import ResultsClient
 
         try:
-            file_info = f"{record.name}:{record.lineno}"
-            experiment_id = getattr(record, "experiment_id", "SYSTEM_LOG")
-            
-            error_msg = record.getMessage()
-            if record.exc_info:
-                error_msg += f"\nTraceback: {self.format(record)}"
-
-            PostgresClient.write_runtime_error(
-                experiment_id=experiment_id,
-                file_path=file_info,
-                error_message=error_msg
+            runtime_error = _record_to_runtime_error(self, record)
+            ResultsClient.write_runtime_error(
+                experiment_id=runtime_error['experiment_id'],
+                file_path=runtime_error['file_path'],
+                error_message=runtime_error['error_message'],
             )
         except Exception:
             self.handleError(record)
 
 
+class _PostgresBatchHandler(logging.Handler):
+    """The target handler of the queue listener. Buffers the rows of the records it receives and writes them
+    in one transaction once the batch is full or the queue is drained. While Postgres is unreachable, the rows
+    are appended to a JSON-lines fallback file (and Postgres is not retried before `retry_interval` seconds);
+    the fallback files are replayed after the next successful write.
+    """
+    _FALLBACK_FILE_PREFIX = 'synqtab-error-logs-'
+    _FALLBACK_FILE_SUFFIX = '.jsonl'
+
+    def __init__(
+        self,
+        record_queue: queue.Queue,
+        batch_size: int,
+        retry_interval: float,
+        fallback_directory: str,
+        pop_dropped_records: Callable[[], int],
+    ):
+        super().__init__()
+        self.record_queue = record_queue
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.fallback_directory = fallback_directory
+        self.pop_dropped_records = pop_dropped_records
+        self.writer_thread_id = None
+        self._buffer = []
+        self._retry_at = 0.0
+
+    def emit(self, record):
+        self.writer_thread_id = threading.get_ident()
+        try:
+            self._buffer.append(_record_to_runtime_error(self, record))
+        except Exception:
+            self.handleError(record)
+            return
+
+        if len(self._buffer) >= self.batch_size or self.record_queue.empty():
+            self.flush()
+
+    def flush(self):
+        import time
+
+        runtime_errors, self._buffer = self._buffer, []
+        nof_dropped_records = self.pop_dropped_records()
+        if nof_dropped_records:
+            runtime_errors.append({
+                'experiment_id': 'SYSTEM_LOG',
+                'file_path': f"{__name__}:{self.__class__.__name__}",
+                'error_message': f"Dropped {nof_dropped_records} error log records because the log buffer was full.",
+            })
+        if not runtime_errors:
+            return
+
+        if time.monotonic() < self._retry_at:
+            self._write_to_fallback_file(runtime_errors)
+            return
+
+        try:
+            self._write_to_postgres(runtime_errors)
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.retry_interval
+            self._write_to_fallback_file(runtime_errors)
+            sys.stderr.write(f"Could not write {len(runtime_errors)} error logs to Postgres; kept them locally. Error: {e}\n")
+            return
+
+        self._replay_fallback_files()
+
+    def _write_to_postgres(self, runtime_errors: list[dict[str, Any]]) -> None:
+        from synqtab.data.clients.ResultsClient import ResultsClient
+
+        ResultsClient.write_runtime_errors(runtime_errors)
+
+    def _get_fallback_file_path(self) -> str:
+        return os.path.join(
+            self.fallback_directory, f"{self._FALLBACK_FILE_PREFIX}{os.getpid()}{self._FALLBACK_FILE_SUFFIX}"
+        )
+
+    def _write_to_fallback_file(self, runtime_errors: list[dict[str, Any]]) -> None:
+        import json
+
+        try:
+            os.makedirs(self.fallback_directory, exist_ok=True)
+            with open(self._get_fallback_file_path(), 'a') as f:
+                for runtime_error in runtime_errors:
+                    f.write(json.dumps(runtime_error) + '\n')
+        except OSError as e:
+            sys.stderr.write(f"Lost {len(runtime_errors)} error logs; could not write the fallback file. Error: {e}\n")
+
+    def _replay_fallback_files(self) -> None:
+        """Writes the rows of every fallback file in the directory, including those of other (e.g., crashed)
+        processes. A file is claimed by renaming it first, so that no two processes replay the same file."""
+        import json
+
+        if not os.path.isdir(self.fallback_directory):
+            return
+
+        for file_name in sorted(os.listdir(self.fallback_directory)):
+            if not (file_name.startswith(self._FALLBACK_FILE_PREFIX) and file_name.endswith(self._FALLBACK_FILE_SUFFIX)):
+                continue
+
+            file_path = os.path.join(self.fallback_directory, file_name)
+            claimed_file_path = f"{file_path}.replaying-{os.getpid()}"
+            try:
+                os.rename(file_path, claimed_file_path)
+            except OSError:
+                continue # claimed by another process
+
+            with open(claimed_file_path) as f:
+                runtime_errors = [json.loads(line) for line in f if line.strip()]
+            try:
+                self._write_to_postgres(runtime_errors)
+            except Exception:
+                # put the rows back; they are replayed after the next successful write
+                self._write_to_fallback_file(runtime_errors)
+                os.remove(claimed_file_path)
+                return
+            os.remove(claimed_file_path)
+
+
+class AsyncPostgresDatabaseHandler(logging.handlers.QueueHandler):
+    """
+    Logging handler that sends ERROR logs to the Postgres database without blocking the caller.
+    Records are put on a bounded queue and written in batches by a background `QueueListener` thread.
+    When the queue is full, records are dropped and counted; the count is logged with the next batch.
+    When Postgres is unreachable, the rows are kept in a local fallback file and replayed later.
+
+    One handler is shared by all loggers of a process; a forked process starts its own listener.
+    The settings that are not given are read from the ERROR_LOG_* environment variables when the
+    listener starts, i.e., on the first error, so creating a logger does not load the environment.
+    """
+    def __init__(
+        self,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        retry_interval: Optional[float] = None,
+        fallback_directory: Optional[str] = None,
+    ):
+        super().__init__(queue.Queue())
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.fallback_directory = fallback_directory
+        self.dropped_records = 0
+        self._dropped_records_lock = threading.Lock()
+        self._listener = None
+        self._batch_handler = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_listener(self) -> None:
+        if self._pid == os.getpid():
+            return
+
+        import atexit
+        from synqtab.environment.postgres import (
+            ERROR_LOG_QUEUE_SIZE, ERROR_LOG_BATCH_SIZE,
+            ERROR_LOG_RETRY_INTERVAL, ERROR_LOG_FALLBACK_DIRECTORY,
+        )
+
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # a forked process inherits the queue and the listener object but not its thread
+            self.queue = queue.Queue(maxsize=self.queue_size or ERROR_LOG_QUEUE_SIZE)
+            self._batch_handler = _PostgresBatchHandler(
+                record_queue=self.queue,
+                batch_size=self.batch_size or ERROR_LOG_BATCH_SIZE,
+                retry_interval=self.retry_interval if self.retry_interval is not None else ERROR_LOG_RETRY_INTERVAL,
+                fallback_directory=self.fallback_directory or ERROR_LOG_FALLBACK_DIRECTORY,
+                pop_dropped_records=self._pop_dropped_records,
+            )
+            self._batch_handler.setFormatter(self.formatter)
+            self._listener = logging.handlers.QueueListener(self.queue, self._batch_handler)
+            self._listener.start()
+            atexit.register(self._stop_listener)
+            self._pid = os.getpid()
+
+    def _stop_listener(self) -> None:
+        """Stops the listener after it has written the queued records."""
+        import time
+
+        if self._listener is None or self._pid != os.getpid():
+            return
+
+        listener, self._listener = self._listener, None
+        for _ in range(100):
+            try:
+                listener.stop()
+                return
+            except queue.Full:
+                time.sleep(0.1) # the stop sentinel needs a free slot; the listener is still draining the queue
+
+    def _pop_dropped_records(self) -> int:
+        with self._dropped_records_lock:
+            dropped_records, self.dropped_records = self.dropped_records, 0
+        return dropped_records
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_records_lock:
+                self.dropped_records += 1
+
+    def emit(self, record):
+        self._ensure_listener()
+        # errors raised while writing error logs must not be written again
+        if record.thread == self._batch_handler.writer_thread_id:
+            return
+        super().emit(record)
+
+    def prepare(self, record):
+        # unlike QueueHandler.prepare, keep exc_info, so that the batch handler formats the traceback itself
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def close(self):
+        self._stop_listener()
+        super().close()
+
+
+_ASYNC_DB_HANDLER: Optional[AsyncPostgresDatabaseHandler] = None
+_ASYNC_DB_HANDLER_LOCK = threading.Lock()
+
+
+def _get_async_db_handler() -> AsyncPostgresDatabaseHandler:
+    global _ASYNC_DB_HANDLER
+
+    with _ASYNC_DB_HANDLER_LOCK:
+        if _ASYNC_DB_HANDLER is None:
+            _ASYNC_DB_HANDLER = AsyncPostgresDatabaseHandler()
+            _ASYNC_DB_HANDLER.setLevel(logging.ERROR)
+    return _ASYNC_DB_HANDLER
+
+
 def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging.Logger:
     """
     Return a configured logger to be used across the project.
@@ -47,12 +301,10 @@ def get_logger(name: Optional[str] = None, level: int = logging.INFO) -> logging
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-        
-        # 2. Automated Postgres Logging only for ERROR
-        db_handler = PostgresDatabaseHandler()
-        db_handler.setLevel(logging.ERROR)
-        logger.addHandler(db_handler)
-        
+
+        # 2. Automated Postgres Logging only for ERROR; batched in a background thread of the process
+        logger.addHandler(_get_async_db_handler())
+
         # Prevent double logging if root logger is also configured.
         logger.propagate = False
 
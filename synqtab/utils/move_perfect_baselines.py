@@ -0,0 +1,27 @@
+"""Moves the perfect baselines (the R-S evaluations) of an existing database to the perfect experiments. They used
+to be written under the non-perfect experiments of the first error rate; now they belong to the perfect experiment
+of the same (dataset, seed, generator), so, until they are moved, the existence checks do not find them and the
+baselines are computed again. Run it once, after `python -m synqtab.utils.backfill_keys`.
+
+Example:
+    python -m synqtab.utils.move_perfect_baselines --backend postgres
+"""
+import argparse
+
+
+if __name__ == '__main__':
+    from synqtab.data.clients.ResultsClient import ResultsClient
+    from synqtab.environment import RESULTS_BACKEND
+
+    parser = argparse.ArgumentParser(description='Move the perfect baselines of the existing results to the perfect experiments.')
+    parser.add_argument('--backend', choices=['postgres', 'sqlite', 'duckdb'], default=RESULTS_BACKEND,
+                        help='the store to migrate. Defaults to RESULTS_BACKEND.')
+    parser.add_argument('--database-path', default=None, help='the database file of an embedded store.')
+    args = parser.parse_args()
+
+    results_store = ResultsClient.resolve_backend(args.backend)
+    if args.database_path:
+        results_store.set_database_path(args.database_path)
+
+    for outcome, nof_rows in results_store.move_perfect_baselines().items():
+        print(f"{outcome}: {nof_rows} rows")
@@ -1,5 +1,14 @@
+from typing import Any, Callable, Optional
+
+import numpy as np
 import pandas as pd
 
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
 def handle_categorical(data:pd.DataFrame, method:str = 'onehot') -> pd.DataFrame:
     """Handles categorical data for outlier detection.
     Methods supported are:
@@ -38,4 +47,140 @@ def handle_categorical(data:pd.DataFrame, method:str = 'onehot') -> pd.DataFrame
     elif method == 'only_numerical':
         return data.select_dtypes(include='number')
     else:
-        raise ValueError(f"Unsupported method '{method}' for handling categorical data. Supported methods are: 'onehot', 'label', 'only_numerical'.")
\ No newline at end of file
+        raise ValueError(f"Unsupported method '{method}' for handling categorical data. Supported methods are: 'onehot', 'label', 'only_numerical'.")
+
+
+_REFERENCE_MODELS: dict[str, dict] = dict()
+
+
+def fit_onehot_encoder(data: pd.DataFrame):
+    """Fits a one-hot encoder on the categorical features of `data`, so that other tables can later be
+    encoded in exactly the same feature space (see `apply_onehot_encoder`).
+
+    Args:
+        data (pd.DataFrame): the reference data to fit the encoder on.
+
+    Returns:
+        OneHotEncoder | None: the fitted encoder, or None if `data` has no categorical features.
+    """
+    from sklearn.preprocessing import OneHotEncoder
+    
+    categorical_cols = data.select_dtypes(include=['object', 'category']).columns
+    if len(categorical_cols) == 0:
+        return None
+    
+    encoder = OneHotEncoder(sparse_output=False, handle_unknown='ignore')
+    encoder.fit(data[categorical_cols])
+    return encoder
+
+
+def apply_onehot_encoder(data: pd.DataFrame, encoder, feature_names: Optional[list[str]] = None) -> pd.DataFrame:
+    """Encodes `data` with an encoder returned by `fit_onehot_encoder`. Categories unseen during fitting are
+    encoded as all-zeros. If `feature_names` is given, the output columns are aligned to it.
+
+    Args:
+        data (pd.DataFrame): the data to encode.
+        encoder (OneHotEncoder | None): the fitted encoder. None means that there is nothing to encode.
+        feature_names (list[str], optional): the expected output columns. Defaults to None.
+
+    Returns:
+        pd.DataFrame: the encoded data.
+    """
+    data_copy = data.copy()
+    if encoder is not None:
+        categorical_cols = list(encoder.feature_names_in_)
+        encoded_cols = encoder.transform(data_copy[categorical_cols])
+        encoded_col_names = encoder.get_feature_names_out(categorical_cols)
+        encoded_df = pd.DataFrame(encoded_cols, columns=encoded_col_names, index=data_copy.index)
+        data_copy = data_copy.drop(columns=categorical_cols)
+        data_copy = pd.concat([data_copy, encoded_df], axis=1)
+    
+    if feature_names is not None:
+        data_copy = data_copy.reindex(columns=feature_names, fill_value=0)
+    return data_copy
+
+
+def get_or_fit_reference_model(
+    evaluation_method: str,
+    reference_id: str,
+    reference_data: pd.DataFrame,
+    fit_model: Callable[[pd.DataFrame], tuple[Any, np.ndarray]],
+) -> dict[str, Any]:
+    """Returns the outlier model that has been fitted on the reference data `reference_id` (e.g., the real perfect
+    training data of a dataset for a given random seed). The model is looked up in the process cache first and in
+    the MinIO models bucket second. Only if it is found in neither, it is fitted via `fit_model` and persisted in both.
+
+    Args:
+        evaluation_method (str): the short name of the evaluator that owns the model, e.g., 'IFO'.
+        reference_id (str): the identifier of the reference data, e.g., '<dataset_name>/<random_seed>'.
+        reference_data (pd.DataFrame): the reference data. Only used if the model must be fitted.
+        fit_model (Callable): fits a model on the encoded reference data and returns it together with
+        the scores of the reference data themselves.
+
+    Returns:
+        dict[str, Any]: a dictionary with the keys 'encoder', 'feature_names', 'model' and 'reference_scores'.
+    """
+    import pickle
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket, MinioFolder
+    
+    object_name = MinioFolder.create_prefix(evaluation_method, f"{reference_id}.pkl")
+    if object_name in _REFERENCE_MODELS:
+        return _REFERENCE_MODELS[object_name]
+    
+    if StorageClient.object_exists(bucket_name=MinioBucket.MODELS, object_name=object_name):
+        LOG.info(f"Loading reference outlier model '{object_name}' from MinIO.")
+        reference_model = pickle.loads(
+            StorageClient.read_bytes_from_bucket(bucket_name=MinioBucket.MODELS, object_name=object_name)
+        )
+    else:
+        LOG.info(f"Fitting reference outlier model '{object_name}'.")
+        encoder = fit_onehot_encoder(reference_data)
+        encoded_reference_data = apply_onehot_encoder(reference_data, encoder)
+        model, reference_scores = fit_model(encoded_reference_data)
+        reference_model = {
+            'encoder': encoder,
+            'feature_names': list(encoded_reference_data.columns),
+            'model': model,
+            'reference_scores': np.asarray(reference_scores),
+        }
+        StorageClient.upload_bytes_to_bucket(
+            data=pickle.dumps(reference_model),
+            bucket_name=MinioBucket.MODELS,
+            object_name=object_name,
+        )
+    
+    _REFERENCE_MODELS[object_name] = reference_model
+    return reference_model
+
+
+def score_with_reference_model(
+    reference_model: dict[str, Any], data: pd.DataFrame, is_reference_data: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """Scores `data` with a model returned by `get_or_fit_reference_model`. Predictions are derived from the
+    stored threshold (`offset_`) of the model, exactly as sklearn's `predict` does, without scoring twice.
+
+    Args:
+        reference_model (dict[str, Any]): the reference model.
+        data (pd.DataFrame): the data to score.
+        is_reference_data (bool, optional): whether `data` is the reference data itself. If True, the scores
+        that were computed during fitting are reused. Defaults to False.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: predictions (-1 for outliers, 1 for inliers) and scores (lower is more abnormal).
+    """
+    model = reference_model['model']
+    if is_reference_data:
+        scores = reference_model['reference_scores']
+    else:
+        encoded_data = apply_onehot_encoder(data, reference_model['encoder'], reference_model['feature_names'])
+        scores = model.score_samples(encoded_data)
+    
+    return threshold_outlier_scores(scores, model.offset_), scores
+
+
+def threshold_outlier_scores(scores: np.ndarray, offset: float) -> np.ndarray:
+    """Turns outlier scores into predictions the same way sklearn's outlier detectors do:
+    -1 for outliers (score below the offset), 1 for inliers.
+    """
+    return np.where(np.asarray(scores) < offset, -1, 1)
@@ -0,0 +1,375 @@
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+
+_DISTANCE_SDTYPES = {'numerical', 'datetime', 'categorical', 'boolean'}
+
+
+def _to_float_array(column: pd.Series, column_metadata: dict[str, Any]) -> np.ndarray:
+    """Converts a numerical or datetime column to floats (datetimes to seconds); missing values become NaN."""
+    if column_metadata['sdtype'] == 'datetime' and not pd.api.types.is_datetime64_any_dtype(column):
+        column = pd.to_datetime(column, format=column_metadata.get('datetime_format'), errors='coerce')
+    if pd.api.types.is_datetime64_any_dtype(column):
+        values = column.to_numpy(dtype='datetime64[ns]')
+        return np.where(np.isnat(values), np.nan, values.astype('int64') / 1e9)
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+
+def encode_for_dcr(
+    data: pd.DataFrame,
+    reference_data: pd.DataFrame,
+    metadata: dict[str, Any],
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Encodes the data and the reference data for the distance to closest record (DCR) computation of
+    SDMetrics (see `sdmetrics.single_table.privacy.dcr_utils.calculate_dcr`). Numerical and datetime columns
+    are divided by their range in the reference data; categorical and boolean columns are turned into integer
+    codes that are shared by both tables, with missing values sharing one code.
+
+    Args:
+        data (pd.DataFrame): the data to compute the DCR of, e.g., the synthetic data.
+        reference_data (pd.DataFrame): the data to measure the distances from, e.g., the real training data.
+        metadata (dict[str, Any]): sdmetrics metadata.
+
+    Returns:
+        tuple[dict[str, np.ndarray], dict[str, np.ndarray]]: the encoded data and reference data, each with
+        the keys `'numerical'` (range-normalized floats), `'constant'` (floats of the zero-range columns) and
+        `'categorical'` (integer codes), holding one column per feature.
+    """
+    columns = [
+        column_name for column_name, column_metadata in metadata['columns'].items()
+        if column_metadata['sdtype'] in _DISTANCE_SDTYPES and column_name in data and column_name in reference_data
+    ]
+    if not columns:
+        raise ValueError('There are no overlapping statistical columns to measure.')
+
+    encoded = {'numerical': [], 'constant': [], 'categorical': []}
+    encoded_reference = {'numerical': [], 'constant': [], 'categorical': []}
+    for column_name in columns:
+        column_metadata = metadata['columns'][column_name]
+        if column_metadata['sdtype'] in {'numerical', 'datetime'}:
+            values = _to_float_array(data[column_name], column_metadata)
+            reference_values = _to_float_array(reference_data[column_name], column_metadata)
+            column_range = np.nanmax(reference_values) - np.nanmin(reference_values) if not np.isnan(reference_values).all() else np.nan
+            if column_range == 0:
+                # any difference counts as a full mismatch for constant columns
+                encoded['constant'].append(values)
+                encoded_reference['constant'].append(reference_values)
+            else:
+                encoded['numerical'].append(values / column_range)
+                encoded_reference['numerical'].append(reference_values / column_range)
+        else:
+            codes, _ = pd.factorize(
+                np.concatenate([data[column_name].to_numpy(dtype=object), reference_data[column_name].to_numpy(dtype=object)])
+            )
+            encoded['categorical'].append(codes[:len(data)])
+            encoded_reference['categorical'].append(codes[len(data):])
+
+    empty_columns = {'numerical': 'float64', 'constant': 'float64', 'categorical': 'int64'}
+    for key, dtype in empty_columns.items():
+        encoded[key] = np.column_stack(encoded[key]) if encoded[key] else np.empty((len(data), 0), dtype=dtype)
+        encoded_reference[key] = (
+            np.column_stack(encoded_reference[key]) if encoded_reference[key] else np.empty((len(reference_data), 0), dtype=dtype)
+        )
+    return encoded, encoded_reference
+
+
+def _block_distances(block: dict[str, np.ndarray], reference_block: dict[str, np.ndarray]) -> np.ndarray:
+    """Sums the per-column distances of every (row, reference row) pair of two encoded blocks."""
+    distances = np.zeros((len(block['categorical']), len(reference_block['categorical'])), dtype='float64')
+
+    for column in range(block['numerical'].shape[1]):
+        values, reference_values = block['numerical'][:, column], reference_block['numerical'][:, column]
+        difference = np.minimum(np.abs(values[:, None] - reference_values[None, :]), 1.0)
+        # exactly one missing value is a full mismatch, two missing values are a full match
+        missing = np.isnan(values)[:, None] != np.isnan(reference_values)[None, :]
+        distances += np.where(np.isnan(difference), missing, difference)
+
+    for column in range(block['constant'].shape[1]):
+        values, reference_values = block['constant'][:, column], reference_block['constant'][:, column]
+        difference = values[:, None] != reference_values[None, :]
+        both_missing = np.isnan(values)[:, None] & np.isnan(reference_values)[None, :]
+        distances += difference & ~both_missing
+
+    for column in range(block['categorical'].shape[1]):
+        distances += block['categorical'][:, column][:, None] != reference_block['categorical'][:, column][None, :]
+
+    return distances
+
+
+def calculate_dcr(
+    encoded_data: dict[str, np.ndarray],
+    encoded_reference_data: dict[str, np.ndarray],
+    chunk_size: int = 2000,
+) -> np.ndarray:
+    """Computes the distance to closest record of every row of the encoded data (see `encode_for_dcr`), i.e.,
+    the minimum over the reference rows of the average per-column distance. The distances are computed in
+    blocks of `chunk_size` x `chunk_size` rows, so memory stays bounded regardless of the table sizes.
+
+    Args:
+        encoded_data (dict[str, np.ndarray]): the encoded data.
+        encoded_reference_data (dict[str, np.ndarray]): the encoded reference data.
+        chunk_size (int, optional): the number of rows per block of each table. Defaults to 2000.
+
+    Returns:
+        np.ndarray: the DCR of every row of the data, in [0, 1].
+    """
+    nof_columns = sum(matrix.shape[1] for matrix in encoded_data.values())
+    nof_rows = len(encoded_data['categorical'])
+    nof_reference_rows = len(encoded_reference_data['categorical'])
+
+    dcr = np.full(nof_rows, np.inf)
+    for start in range(0, nof_rows, chunk_size):
+        block = {key: matrix[start:start + chunk_size] for key, matrix in encoded_data.items()}
+        for reference_start in range(0, nof_reference_rows, chunk_size):
+            reference_block = {
+                key: matrix[reference_start:reference_start + chunk_size] for key, matrix in encoded_reference_data.items()
+            }
+            block_dcr = _block_distances(block, reference_block).min(axis=1)
+            np.minimum(dcr[start:start + chunk_size], block_dcr, out=dcr[start:start + chunk_size])
+
+    return dcr / nof_columns
+
+
+def generate_random_baseline(
+    real_data: pd.DataFrame, num_samples: int, random_generator: np.random.Generator
+) -> pd.DataFrame:
+    """Generates uniformly random data within the bounds of the real data, the same way as the baseline of
+    SDMetrics' `DCRBaselineProtection`: integers and floats are drawn from the [min, max] range of each column,
+    datetimes from the [min, max] time span, other columns from their observed values, and each column keeps
+    the missing value ratio of the real data.
+
+    Args:
+        real_data (pd.DataFrame): the real data.
+        num_samples (int): the number of rows to generate.
+        random_generator (np.random.Generator): the source of randomness.
+
+    Returns:
+        pd.DataFrame: the random data.
+    """
+    random_data = dict()
+    for column_name in real_data.columns:
+        column = real_data[column_name]
+        if pd.api.types.is_integer_dtype(column):
+            random_values = random_generator.integers(low=column.min(), high=column.max() + 1, size=num_samples)
+        elif pd.api.types.is_float_dtype(column):
+            random_values = random_generator.uniform(low=column.min(), high=column.max(), size=num_samples)
+        elif pd.api.types.is_datetime64_any_dtype(column):
+            min_date, max_date = column.min(), column.max()
+            random_values = min_date + pd.to_timedelta(
+                random_generator.uniform(low=0, high=(max_date - min_date).total_seconds(), size=num_samples), unit='s'
+            )
+        else:
+            random_values = random_generator.choice(column.dropna().unique(), size=num_samples)
+
+        random_values = pd.Series(random_values)
+        random_values[random_generator.random(num_samples) < column.isna().mean()] = (
+            pd.NaT if pd.api.types.is_datetime64_any_dtype(column) else np.nan
+        )
+        random_data[column_name] = random_values
+
+    return pd.DataFrame(random_data)
+
+
+def compute_dcr_baseline_protection(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    metadata: dict[str, Any],
+    num_rows_subsample: Optional[int] = None,
+    num_iterations: int = 1,
+    confidence_level: float = 0.95,
+    chunk_size: int = 2000,
+    random_seed: Optional[int] = None,
+) -> dict[str, Any]:
+    """Computes the score of SDMetrics' `DCRBaselineProtection`: the median DCR of the synthetic data to the real
+    data divided by the median DCR of uniformly random data to the real data, capped at 1.
+
+    In exact mode (`num_rows_subsample` is None) all rows are used. In subsampled mode, each of the
+    `num_iterations` iterations samples `num_rows_subsample` rows of each table; the score is the average over
+    the iterations and a normal-approximation confidence interval of it is reported as well.
+
+    Args:
+        real_data (pd.DataFrame): the real data used to train the generator.
+        synthetic_data (pd.DataFrame): the synthetic data.
+        metadata (dict[str, Any]): sdmetrics metadata.
+        num_rows_subsample (int, optional): the number of rows to sample per iteration. Defaults to None.
+        num_iterations (int, optional): the number of subsampling iterations. Defaults to 1.
+        confidence_level (float, optional): the confidence level of the interval. Defaults to 0.95.
+        chunk_size (int, optional): see `calculate_dcr`. Defaults to 2000.
+        random_seed (int, optional): the seed of the random baseline and of the subsampling. Defaults to None.
+
+    Returns:
+        dict[str, Any]: the `'score'`, the `'median_DCR_to_real_data'` of the synthetic and the random data
+        (averaged over the iterations) and, in subsampled mode, the `'confidence_interval'` of the score.
+    """
+    from scipy.stats import norm
+
+    if num_rows_subsample is not None and num_rows_subsample >= min(len(real_data), len(synthetic_data)):
+        num_rows_subsample, num_iterations = None, 1
+
+    random_generator = np.random.default_rng(random_seed)
+    random_data = generate_random_baseline(real_data, len(synthetic_data), random_generator)
+
+    # in exact mode the tables are encoded once; the categorical codes are shared within a pair of tables only,
+    # so the real data is encoded separately against the synthetic and against the random data
+    if num_rows_subsample is None:
+        encoded_synthetic, encoded_real = encode_for_dcr(synthetic_data, real_data, metadata)
+        encoded_random, encoded_real_for_random = encode_for_dcr(random_data, real_data, metadata)
+
+    scores, synthetic_medians, random_medians = [], [], []
+    for _ in range(num_iterations):
+        if num_rows_subsample is not None:
+            real_sample = real_data.iloc[random_generator.choice(len(real_data), num_rows_subsample, replace=False)]
+            synthetic_sample = synthetic_data.iloc[random_generator.choice(len(synthetic_data), num_rows_subsample, replace=False)]
+            random_sample = random_data.iloc[random_generator.choice(len(random_data), num_rows_subsample, replace=False)]
+            encoded_synthetic, encoded_real = encode_for_dcr(synthetic_sample, real_sample, metadata)
+            encoded_random, encoded_real_for_random = encode_for_dcr(random_sample, real_sample, metadata)
+
+        synthetic_median = float(np.median(calculate_dcr(encoded_synthetic, encoded_real, chunk_size)))
+        random_median = float(np.median(calculate_dcr(encoded_random, encoded_real_for_random, chunk_size)))
+        synthetic_medians.append(synthetic_median)
+        random_medians.append(random_median)
+        scores.append(min(synthetic_median / random_median, 1.0) if random_median != 0.0 else np.nan)
+
+    result = {
+        'score': float(np.mean(scores)) if sum(random_medians) != 0.0 else np.nan,
+        'median_DCR_to_real_data': {
+            'synthetic_data': float(np.mean(synthetic_medians)),
+            'random_data_baseline': float(np.mean(random_medians)),
+        },
+    }
+    if num_rows_subsample is not None:
+        margin = norm.ppf(0.5 + confidence_level / 2) * np.std(scores, ddof=1) / np.sqrt(num_iterations) if num_iterations > 1 else np.nan
+        result['confidence_interval'] = {
+            'confidence_level': confidence_level,
+            'lower': float(max(result['score'] - margin, 0.0)),
+            'upper': float(min(result['score'] + margin, 1.0)),
+        }
+    return result
+
+
+_CAP_METHODS = {'cap', 'zero_cap', 'generalized_cap'}
+
+
+def _discretize_column(real_column: pd.Series, synthetic_column: pd.Series, num_bins: int) -> tuple[np.ndarray, np.ndarray]:
+    """Bins a continuous column into `num_bins` equal-width bins of the real data, as SDMetrics'
+    `DisclosureProtection` does; synthetic values outside the real range fall into the outermost bins."""
+    bin_labels = [str(x) for x in range(num_bins)]
+    real_binned, bins = pd.cut(pd.to_numeric(real_column.to_numpy()), num_bins, labels=bin_labels, retbins=True)
+    bins[0], bins[-1] = -np.inf, np.inf
+    synthetic_binned = pd.cut(pd.to_numeric(synthetic_column.to_numpy()), bins, labels=bin_labels)
+    return real_binned.to_numpy(), synthetic_binned.to_numpy()
+
+
+def _encode_column_tuples(real_columns: list[np.ndarray], synthetic_columns: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray, int]:
+    """Maps every row's tuple of values to one integer key that is shared by the real and synthetic data.
+    Missing values are a value of their own. Returns the real keys, the synthetic keys and the number of keys."""
+    nof_real_rows = len(real_columns[0])
+    keys = np.zeros(nof_real_rows + len(synthetic_columns[0]), dtype='int64')
+    nof_keys = 1
+    for real_column, synthetic_column in zip(real_columns, synthetic_columns):
+        codes, uniques = pd.factorize(np.concatenate([real_column, synthetic_column]), use_na_sentinel=False)
+        # re-factorizing keeps the combined keys dense, so they never overflow
+        keys, key_uniques = pd.factorize(keys * len(uniques) + codes)
+        nof_keys = len(key_uniques)
+    return keys[:nof_real_rows], keys[nof_real_rows:], nof_keys
+
+
+def compute_disclosure_protection(
+    real_data: pd.DataFrame,
+    synthetic_data: pd.DataFrame,
+    known_column_names: list[str],
+    sensitive_column_names: list[str],
+    computation_method: str = 'cap',
+    continuous_column_names: Optional[list[str]] = None,
+    num_discrete_bins: int = 10,
+) -> dict[str, float]:
+    """Computes the breakdown of SDMetrics' `DisclosureProtection` with grouped counts instead of row-by-row
+    lookups. The known and sensitive column tuples of every row are hashed into integer keys; the CAP attacker
+    is then the frequency of each (known, sensitive) key pair among the synthetic rows with the same known key.
+
+    Args:
+        real_data (pd.DataFrame): the real data used to train the generator.
+        synthetic_data (pd.DataFrame): the synthetic data.
+        known_column_names (list[str]): the columns that an attacker already knows.
+        sensitive_column_names (list[str]): the columns that an attacker wants to guess.
+        computation_method (str, optional): `'cap'`, `'zero_cap'` or `'generalized_cap'`. The latter is
+        delegated to SDMetrics. Defaults to 'cap'.
+        continuous_column_names (list[str], optional): the columns to discretize. Defaults to None.
+        num_discrete_bins (int, optional): the number of bins of the discretized columns. Defaults to 10.
+
+    Returns:
+        dict[str, float]: the `'score'`, `'cap_protection'` and `'baseline_protection'`.
+    """
+    if not known_column_names:
+        raise ValueError('Must provide at least 1 known column name.')
+    if not sensitive_column_names:
+        raise ValueError('Must provide at least 1 sensitive column name.')
+    missing_columns = set(known_column_names + sensitive_column_names + (continuous_column_names or [])) - set(real_data.columns)
+    if missing_columns:
+        raise ValueError(f"Column(s) {sorted(missing_columns)} are missing from the real data.")
+    if computation_method.lower() not in _CAP_METHODS:
+        raise ValueError(f"Unknown computation method '{computation_method}'. Please use one of {sorted(_CAP_METHODS)}.")
+
+    if computation_method.lower() == 'generalized_cap':
+        from sdmetrics.single_table import DisclosureProtection
+        return DisclosureProtection.compute_breakdown(
+            real_data=real_data,
+            synthetic_data=synthetic_data,
+            known_column_names=known_column_names,
+            sensitive_column_names=sensitive_column_names,
+            computation_method=computation_method,
+            continuous_column_names=continuous_column_names,
+            num_discrete_bins=num_discrete_bins,
+        )
+
+    # discretize the continuous columns once, for both the known and the sensitive side
+    continuous_column_names = set(continuous_column_names or [])
+    real_columns, synthetic_columns = dict(), dict()
+    for column_name in dict.fromkeys(known_column_names + sensitive_column_names):
+        if column_name in continuous_column_names:
+            real_columns[column_name], synthetic_columns[column_name] = _discretize_column(
+                real_data[column_name], synthetic_data[column_name], num_discrete_bins
+            )
+        else:
+            real_columns[column_name] = real_data[column_name].to_numpy(dtype=object)
+            synthetic_columns[column_name] = synthetic_data[column_name].to_numpy(dtype=object)
+
+    real_known, synthetic_known, nof_known_keys = _encode_column_tuples(
+        [real_columns[column_name] for column_name in known_column_names],
+        [synthetic_columns[column_name] for column_name in known_column_names],
+    )
+    real_sensitive, synthetic_sensitive, nof_sensitive_keys = _encode_column_tuples(
+        [real_columns[column_name] for column_name in sensitive_column_names],
+        [synthetic_columns[column_name] for column_name in sensitive_column_names],
+    )
+
+    baseline_protection = 1 - float(1 / np.prod([
+        pd.Series(real_columns[column_name]).nunique(dropna=False) for column_name in sensitive_column_names
+    ]))
+
+    # P(real sensitive value | real known value) among the synthetic rows, for every real row
+    synthetic_known_counts = np.bincount(synthetic_known, minlength=nof_known_keys)
+    synthetic_pairs, synthetic_pair_counts = np.unique(
+        synthetic_known * nof_sensitive_keys + synthetic_sensitive, return_counts=True
+    )
+    real_pairs = real_known * nof_sensitive_keys + real_sensitive
+    positions = np.minimum(np.searchsorted(synthetic_pairs, real_pairs), len(synthetic_pairs) - 1)
+    real_pair_counts = np.where(synthetic_pairs[positions] == real_pairs, synthetic_pair_counts[positions], 0)
+    real_known_counts = synthetic_known_counts[real_known]
+    is_matched = real_known_counts > 0
+    row_scores = np.divide(real_pair_counts, real_known_counts, out=np.zeros(len(real_pairs)), where=is_matched)
+
+    if computation_method.lower() == 'zero_cap':
+        # unmatched known values count as failed attacks
+        cap_protection = 1.0 - row_scores.mean() if len(row_scores) else np.nan
+    else:
+        # unmatched known values are ignored
+        cap_protection = 1.0 - row_scores[is_matched].mean() if is_matched.any() else np.nan
+
+    return {
+        'score': np.nan if baseline_protection == 0 else float(min(cap_protection / baseline_protection, 1)),
+        'cap_protection': float(cap_protection),
+        'baseline_protection': baseline_protection,
+    }
@@ -3,77 +3,76 @@ warnings.filterwarnings("ignore") # mitigates synthcity's annoying verbosity
 
 
 from synqtab.data import Dataset
-from synqtab.enums import DataPerfectness, DataErrorType, ProblemType
-from synqtab.experiments.Experiment import Experiment
+from synqtab.enums import EvaluationInput
+from synqtab.environment import REFERENCE_FIT
+from synqtab.evaluators import EvaluationTaskGraph
 from synqtab.experiments import NormalExperiment
 from synqtab.reproducibility import ReproducibleOperations
 from synqtab.utils import get_logger, get_experimental_params_for_normal
+from synqtab.utils.scheduling_utils import claim_normal_experiment, schedule_normal_experiment_jobs
 
 
 LOG = get_logger(__file__)
 
 
 experimental_params = get_experimental_params_for_normal()
+datasets = dict()
 
-# First, generate all perfect synthetic data (S)
-for random_seed in experimental_params.get('random_seeds'):
-    ReproducibleOperations.set_random_seed(random_seed)
-    for dataset_name in experimental_params.get('dataset_names'):
-        dataset = Dataset(dataset_name)
-        for model in experimental_params.get('models'):
-            try:
-                normal_experiment = NormalExperiment(
-                    dataset=dataset,
-                    generator=model,
-                    data_error_type=None,
-                    data_error_rate=None,
-                    data_perfectness=DataPerfectness.PERFECT, # only perfect data at first
-                    evaluation_methods=None,
-                )
+def get_dataset(dataset_name: str) -> Dataset:
+    if dataset_name not in datasets:
+        datasets[dataset_name] = Dataset(dataset_name)
+    return datasets[dataset_name]
 
-                normal_experiment.run() # force-compute the regression datasets
-            except Exception as e:
-                LOG.error(
-                    f'The experiment {str(normal_experiment)} failed but I will continue to the next one.' +
-                    f'Error: {e}.',
-                    extra={'experiment_id': str(normal_experiment)}
-                )
-                # exit(0)
-                continue
+# First, generate all perfect synthetic data (S)
+for job in schedule_normal_experiment_jobs(experimental_params, perfect=True):
+    ReproducibleOperations.set_random_seed(job.random_seed)
+    normal_experiment = None
+    try:
+        normal_experiment = NormalExperiment(
+            dataset=get_dataset(job.dataset_name),
+            generator=job.generator,
+            data_error_type=None,
+            data_error_rate=None,
+            data_perfectness=job.data_perfectness, # only perfect data at first
+            evaluation_methods=None,
+        )
+        if normal_experiment._should_compute and not claim_normal_experiment(str(normal_experiment)):
+            LOG.info(f"The experiment {str(normal_experiment)} is run by another worker.")
+            continue
 
-# exit(0)
+        normal_experiment.run() # force-compute the regression datasets
+    except Exception as e:
+        LOG.error(
+            f'The experiment {str(normal_experiment)} failed but I will continue to the next one.' +
+            f'Error: {e}.',
+            extra={'experiment_id': str(normal_experiment)}
+        )
+        continue
 
 # Then, generate all imperfect (S_hat) and semi-perfect (S_semi) and populate evaluation tasks
-for random_seed in experimental_params.get('random_seeds'):
-    ReproducibleOperations.set_random_seed(random_seed)
-    for dataset_name in experimental_params.get('dataset_names'):
-        dataset = Dataset(dataset_name)
-        for model in experimental_params.get('models'):
-            for error in experimental_params.get('error_types'):
-                for error_rate in experimental_params.get('error_rates'):
-                    for perfectness_level in experimental_params.get('data_perfectness_levels'):
-                        try:
-                            if perfectness_level == DataPerfectness.SEMIPERFECT and error_rate != 0.4:
-                                # We investigate the cleaning dilemma only for 0.4 error rate
-                                continue
+# The graph is shared, so that each perfect baseline (R-S) is published once for all of its imperfect experiments
+task_graph = EvaluationTaskGraph()
+for job in schedule_normal_experiment_jobs(experimental_params, perfect=False):
+    ReproducibleOperations.set_random_seed(job.random_seed)
+    normal_experiment = None
+    try:
+        normal_experiment = NormalExperiment(
+            dataset=get_dataset(job.dataset_name),
+            generator=job.generator,
+            data_error_type=job.data_error_type,
+            data_error_rate=job.data_error_rate,
+            data_perfectness=job.data_perfectness,
+            evaluation_methods=experimental_params.get('evaluation_methods'),
+            options={str(EvaluationInput.REFERENCE_FIT): REFERENCE_FIT},
+        )
+        if normal_experiment._should_compute and not claim_normal_experiment(str(normal_experiment)):
+            LOG.info(f"The experiment {str(normal_experiment)} is run by another worker.")
+            continue
+        normal_experiment.run().publish_tasks(task_graph=task_graph)
 
-                            if perfectness_level == DataPerfectness.SEMIPERFECT and error == DataErrorType.NEAR_DUPLICATE:
-                                # Semi-perfect for near duplicates is the same as perfect, no need to compute
-                                continue
-                            
-                            normal_experiment = NormalExperiment(
-                                dataset=dataset,
-                                generator=model,
-                                data_error_type=error,
-                                data_error_rate=error_rate,
-                                data_perfectness=perfectness_level,
-                                evaluation_methods=experimental_params.get('evaluation_methods'),
-                            )
-                            normal_experiment.run().publish_tasks()
-                            
-                        except Exception as e:
-                            LOG.error(
-                                f"The experiment failed but I will continue to the next one. Error: {e}",
-                                extra={'experiment_id': str(normal_experiment)}
-                            )
-                            continue
+    except Exception as e:
+        LOG.error(
+            f"The experiment failed but I will continue to the next one. Error: {e}",
+            extra={'experiment_id': str(normal_experiment)}
+        )
+        continue
@@ -3,6 +3,7 @@ warnings.filterwarnings("ignore") # mitigates synthcity's annoying verbosity
 
 
 from synqtab.data import Dataset
+from synqtab.evaluators import EvaluationTaskGraph
 from synqtab.enums import DataPerfectness, DataErrorType, ProblemType, GeneratorModel
 from synqtab.experiments.Experiment import Experiment
 from synqtab.experiments import NormalExperiment
@@ -44,6 +45,7 @@ for random_seed in experimental_params.get('random_seeds'):
 exit(0)
 
 # Then, generate all imperfect (S_hat) and semi-perfect (S_semi) and populate evaluation tasks
+task_graph = EvaluationTaskGraph()
 for random_seed in experimental_params.get('random_seeds'):
     ReproducibleOperations.set_random_seed(random_seed)
     for dataset_name in experimental_params.get('dataset_names'):
@@ -73,7 +75,7 @@ for random_seed in experimental_params.get('random_seeds'):
                                 data_perfectness=perfectness_level,
                                 evaluation_methods=experimental_params.get('evaluation_methods'),
                             )
-                            normal_experiment.run().publish_tasks()
+                            normal_experiment.run().publish_tasks(task_graph=task_graph)
                             
                         except Exception as e:
                             LOG.error(
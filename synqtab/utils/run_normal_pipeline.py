@@ -0,0 +1,37 @@
+import warnings
+warnings.filterwarnings("ignore") # mitigates synthcity's annoying verbosity
+
+
+from synqtab.environment import REFERENCE_FIT
+from synqtab.pipeline import NormalPipeline
+from synqtab.reproducibility import ReproducibleOperations
+from synqtab.utils import get_logger, get_experimental_params_for_normal
+from synqtab.utils.scheduling_utils import schedule_normal_pipeline_jobs
+
+
+LOG = get_logger(__file__)
+
+
+# Unlike run_normal_experiment.py, the generations and the evaluations of a seed run as one task graph, so every
+# experiment is evaluated as soon as its synthetic data (and that of its perfect counterpart) exists. The pipeline
+# generates in spawned processes, which import this module again, so the sweep only runs in the main process.
+if __name__ == '__main__':
+    experimental_params = get_experimental_params_for_normal()
+    # the jobs that share a perfect experiment stay on one worker, which generates it once
+    jobs = schedule_normal_pipeline_jobs(experimental_params)
+
+    for random_seed in dict.fromkeys(job.random_seed for job in jobs):
+        ReproducibleOperations.set_random_seed(random_seed)
+        pipeline = NormalPipeline(
+            evaluation_methods=experimental_params.get('evaluation_methods'), reference_fit=REFERENCE_FIT)
+        seed_jobs = [job for job in jobs if job.random_seed == random_seed]
+        for position, job in enumerate(seed_jobs):
+            try:
+                # the jobs come in the order of the schedule, e.g., longest predicted runtime first
+                pipeline.add_job(job, priority=len(seed_jobs) - position)
+            except Exception as e:
+                LOG.error(f"The job {job} could not be added to the pipeline but I will continue to the next one. Error: {e}")
+                continue
+
+        results = pipeline.run()
+        LOG.info(f"Random seed {random_seed}: " + ', '.join(f"{len(node_ids)} {status}" for status, node_ids in results.items()))
@@ -0,0 +1,403 @@
+"""Orders and distributes the jobs of the experimental sweep by their predicted runtime.
+
+The runtime of a generator (or an evaluator) is modelled as a power law of the size of its input,
+`seconds = exp(a) * (rows x columns) ** b`, fitted in log space on the `execution_time` of the past runs
+in the results store. The jobs are then ordered longest-first (LPT) and packed greedily into one bin per
+worker, so that the long jobs do not all end up on the same worker at the end of the sweep.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Optional
+
+from synqtab.enums import DataErrorType, DataPerfectness, GeneratorModel
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+class RuntimeModel:
+    """A per-key power law of the runtime against the input size, with a pooled fit for the unseen keys."""
+
+    MIN_EXPONENT = 0.0
+    MAX_EXPONENT = 3.0
+
+    def __init__(self):
+        self.coefficients: dict[Hashable, tuple[float, float]] = dict()
+        self.pooled: Optional[tuple[float, float]] = None
+
+    @classmethod
+    def _fit_log_linear(
+        cls, sizes: list[float], seconds: list[float], exponent: Optional[float] = None
+    ) -> tuple[float, float]:
+        import numpy as np
+
+        log_sizes, log_seconds = np.log(sizes), np.log(seconds)
+        if exponent is None and np.ptp(log_sizes) > 0:
+            exponent = float(np.polyfit(log_sizes, log_seconds, deg=1)[0])
+        exponent = min(max(exponent if exponent is not None else 1.0, cls.MIN_EXPONENT), cls.MAX_EXPONENT)
+        # with the exponent fixed, the least-squares intercept is the mean residual
+        return float(np.mean(log_seconds - exponent * log_sizes)), exponent
+
+    def fit(self, samples: Iterable[tuple[Hashable, float, float]]) -> 'RuntimeModel':
+        """Fits the model on (key, size, seconds) samples; samples with a non-positive size or runtime are ignored.
+
+        Keys with a single distinct size cannot estimate an exponent, so they borrow the pooled one.
+        """
+        samples_per_key: dict[Hashable, tuple[list[float], list[float]]] = dict()
+        for key, size, seconds in samples:
+            if size and seconds and size > 0 and seconds > 0:
+                sizes, runtimes = samples_per_key.setdefault(key, ([], []))
+                sizes.append(float(size)); runtimes.append(float(seconds))
+
+        if not samples_per_key:
+            return self
+
+        all_sizes = [size for sizes, _ in samples_per_key.values() for size in sizes]
+        all_runtimes = [seconds for _, runtimes in samples_per_key.values() for seconds in runtimes]
+        self.pooled = self._fit_log_linear(all_sizes, all_runtimes)
+
+        for key, (sizes, runtimes) in samples_per_key.items():
+            exponent = None if len(set(sizes)) > 1 else self.pooled[1]
+            self.coefficients[key] = self._fit_log_linear(sizes, runtimes, exponent=exponent)
+        return self
+
+    def predict(self, key: Hashable, size: float) -> float:
+        """Predicts the runtime in seconds; without any history the size itself is the cost."""
+        if size <= 0:
+            return 0.0
+        intercept, exponent = self.coefficients.get(key) or self.pooled or (0.0, 1.0)
+        return math.exp(intercept + exponent * math.log(size))
+
+
+@dataclass(frozen=True)
+class NormalExperimentJob:
+    random_seed: int
+    dataset_name: str
+    generator: GeneratorModel
+    data_perfectness: DataPerfectness
+    data_error_type: Optional[DataErrorType] = None
+    data_error_rate: Optional[float] = None
+
+    def sort_key(self) -> str:
+        """A deterministic tie-breaker for jobs with the same predicted runtime."""
+        return '|'.join(str(value) for value in (
+            self.dataset_name, self.generator, self.data_perfectness,
+            self.data_error_type, self.data_error_rate, self.random_seed,
+        ))
+
+
+@dataclass(frozen=True)
+class NormalPipelineJobGroup:
+    """The jobs of a (random seed, dataset, generator), which share the perfect experiment of the pipeline."""
+    random_seed: int
+    dataset_name: str
+    generator: GeneratorModel
+
+    @classmethod
+    def of(cls, job: NormalExperimentJob) -> 'NormalPipelineJobGroup':
+        return cls(job.random_seed, job.dataset_name, job.generator)
+
+    def sort_key(self) -> str:
+        return '|'.join(str(value) for value in (self.dataset_name, self.generator, self.random_seed))
+
+    def get_worker_index(self, worker_count: int) -> int:
+        """The worker of the group. It only depends on the group, so every worker of the sweep agrees on it."""
+        from synqtab.utils.general_utils import stable_hash64
+
+        return stable_hash64(self.sort_key()) % max(1, worker_count)
+
+
+def get_normal_experiment_jobs(experimental_params: dict[str, Any], perfect: bool) -> list[NormalExperimentJob]:
+    """Enumerates the jobs of the sweep in the nested-loop order of the parameters.
+
+    Args:
+        experimental_params (dict[str, Any]): as returned by `get_experimental_params_for_normal`.
+        perfect (bool): whether to enumerate the perfect jobs (S) or the imperfect and semi-perfect ones (S_hat, S_semi).
+    """
+    jobs = []
+    for random_seed in experimental_params.get('random_seeds'):
+        for dataset_name in experimental_params.get('dataset_names'):
+            for model in experimental_params.get('models'):
+                if perfect:
+                    jobs.append(NormalExperimentJob(random_seed, dataset_name, model, DataPerfectness.PERFECT))
+                    continue
+
+                for error in experimental_params.get('error_types'):
+                    for error_rate in experimental_params.get('error_rates'):
+                        for perfectness_level in experimental_params.get('data_perfectness_levels'):
+                            if perfectness_level == DataPerfectness.SEMIPERFECT and error_rate != 0.4:
+                                # We investigate the cleaning dilemma only for 0.4 error rate
+                                continue
+
+                            if perfectness_level == DataPerfectness.SEMIPERFECT and error == DataErrorType.NEAR_DUPLICATE:
+                                # Semi-perfect for near duplicates is the same as perfect, no need to compute
+                                continue
+
+                            jobs.append(NormalExperimentJob(
+                                random_seed, dataset_name, model, perfectness_level, error, error_rate))
+    return jobs
+
+
+def get_dataset_shapes(dataset_names: list[str], max_workers: int = 16) -> dict[str, tuple[int, int]]:
+    """Reads the (rows, columns) of the real perfect datasets from their parquet footers only."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from synqtab.data import StorageClient
+    from synqtab.enums import MinioBucket, MinioFolder
+
+    def _read_shape(dataset_name: str) -> tuple[int, int]:
+        return StorageClient.read_parquet_shape(
+            bucket_name=MinioBucket.REAL.value,
+            object_name=MinioFolder.create_prefix(MinioFolder.PERFECT, MinioFolder.DATA, f"{dataset_name}.parquet"),
+        )
+
+    dataset_names = list(dataset_names)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dataset_names)))) as executor:
+        return dict(zip(dataset_names, executor.map(_read_shape, dataset_names)))
+
+
+def fit_generator_runtime_model(dataset_shapes: dict[str, tuple[int, int]]) -> tuple[RuntimeModel, float]:
+    """Fits the runtime of every generator against the training rows x columns of the past experiments.
+
+    Returns:
+        tuple[RuntimeModel, float]: the model and the median fraction of the dataset rows that are used for training.
+    """
+    from statistics import median
+
+    from synqtab.data import ResultsClient
+
+    samples, training_fractions = [], []
+    for row in ResultsClient.read_experiment_execution_times():
+        nof_rows, nof_columns = dataset_shapes.get(row['dataset_name'], (0, 0))
+        training_size = float(row['training_size'] or 0)
+        samples.append((str(row['generator']), training_size * nof_columns, float(row['execution_time'] or 0)))
+        if nof_rows:
+            training_fractions.append(training_size / nof_rows)
+
+    runtime_model = RuntimeModel().fit(samples)
+    LOG.info(f"Fitted the runtime of {len(runtime_model.coefficients)} generators on {len(samples)} past experiments.")
+    return runtime_model, (median(training_fractions) if training_fractions else 1.0)
+
+
+def fit_evaluator_runtime_model(dataset_shapes: dict[str, tuple[int, int]]) -> RuntimeModel:
+    """Fits the runtime of every evaluation method against the training rows x columns of the past experiments.
+    The runtime of a method is the total of its evaluations (all targets and fidelities) within an experiment.
+    """
+    from synqtab.data import ResultsClient
+    from synqtab.evaluators.EvaluationKey import EvaluationKey
+
+    seconds_per_method_experiment, sizes_per_experiment = dict(), dict()
+    for row in ResultsClient.read_evaluation_execution_times():
+        nof_columns = dataset_shapes.get(row['dataset_name'], (0, 0))[1]
+        evaluation_method = EvaluationKey.from_str(row['evaluation_id']).evaluation_method
+        key = (evaluation_method, row['experiment_id'])
+        seconds_per_method_experiment[key] = (
+            seconds_per_method_experiment.get(key, 0.0) + float(row['execution_time'] or 0)
+        )
+        sizes_per_experiment[row['experiment_id']] = float(row['training_size'] or 0) * nof_columns
+
+    runtime_model = RuntimeModel().fit(
+        (evaluation_method, sizes_per_experiment[experiment_id], seconds)
+        for (evaluation_method, experiment_id), seconds in seconds_per_method_experiment.items()
+    )
+    LOG.info(
+        f"Fitted the runtime of {len(runtime_model.coefficients)} evaluation methods on "
+        f"{len(sizes_per_experiment)} past experiments."
+    )
+    return runtime_model
+
+
+def predict_normal_experiment_job_seconds(
+    jobs: list[NormalExperimentJob],
+    runtime_model: RuntimeModel,
+    dataset_shapes: dict[str, tuple[int, int]],
+    training_fraction: float = 1.0,
+    evaluator_runtime_model: Optional[RuntimeModel] = None,
+    evaluation_methods: Optional[list] = None,
+) -> dict[NormalExperimentJob, float]:
+    """Predicts the runtime of every job; the jobs that will be skipped for their size cost nothing. The imperfect
+    and semi-perfect jobs also evaluate their experiment, so they cost their generation plus the predicted
+    runtime of each evaluation method; the perfect jobs only generate."""
+    from synqtab.environment import MAX_TRAINING_ROWS
+
+    predicted_seconds = dict()
+    for job in jobs:
+        nof_rows, nof_columns = dataset_shapes.get(job.dataset_name, (0, 0))
+        training_rows = nof_rows * training_fraction
+        if training_rows > MAX_TRAINING_ROWS:
+            predicted_seconds[job] = 0.0
+            continue
+        training_size = training_rows * nof_columns
+        predicted_seconds[job] = runtime_model.predict(str(job.generator), training_size)
+        if evaluator_runtime_model is not None and job.data_perfectness != DataPerfectness.PERFECT:
+            predicted_seconds[job] += sum(
+                evaluator_runtime_model.predict(str(evaluation_method), training_size)
+                for evaluation_method in evaluation_methods or []
+            )
+    return predicted_seconds
+
+
+def order_longest_first(jobs: list, predicted_seconds: dict) -> list:
+    """Orders the jobs by decreasing predicted runtime (LPT)."""
+    return sorted(jobs, key=lambda job: (-predicted_seconds.get(job, 0.0), job.sort_key()))
+
+
+def pack_into_bins(jobs: list, predicted_seconds: dict, nof_bins: int) -> list[list]:
+    """Packs the jobs longest-first into the bin with the least predicted load so far."""
+    import heapq
+
+    bins = [[] for _ in range(max(1, nof_bins))]
+    loads = [(0.0, index) for index in range(len(bins))]
+    for job in order_longest_first(jobs, predicted_seconds):
+        load, index = heapq.heappop(loads)
+        bins[index].append(job)
+        heapq.heappush(loads, (load + predicted_seconds.get(job, 0.0), index))
+    return bins
+
+
+def get_worker_schedule(bins: list[list], worker_index: int) -> list:
+    """Returns the jobs of the worker's own bin, followed by the jobs of the other bins from their shortest end.
+
+    A worker that finishes early thus steals the work that the other workers would reach last. A job that was
+    already computed is skipped by the existence check of the experiment, and a job that another worker has
+    started is skipped by its claim (see `claim_normal_experiment`).
+    """
+    worker_index = worker_index % len(bins)
+    stolen_jobs = [
+        job
+        for offset in range(1, len(bins))
+        for job in reversed(bins[(worker_index + offset) % len(bins)])
+    ]
+    return bins[worker_index] + stolen_jobs
+
+
+def predict_jobs_seconds(
+    experimental_params: dict[str, Any], jobs: list[NormalExperimentJob]
+) -> Optional[dict[NormalExperimentJob, float]]:
+    """Predicts the runtime of the jobs from the past runs in the results store. Returns None if the results store
+    or the object storage is unreachable."""
+    evaluates = any(job.data_perfectness != DataPerfectness.PERFECT for job in jobs)
+    try:
+        dataset_shapes = get_dataset_shapes(experimental_params.get('dataset_names'))
+        runtime_model, training_fraction = fit_generator_runtime_model(dataset_shapes)
+        evaluator_runtime_model = fit_evaluator_runtime_model(dataset_shapes) if evaluates else None
+    except Exception as e:
+        LOG.warning(f"Could not predict the runtime of the jobs; they are scheduled without predictions. Error: {e}")
+        return None
+    return predict_normal_experiment_job_seconds(
+        jobs, runtime_model, dataset_shapes, training_fraction,
+        evaluator_runtime_model=evaluator_runtime_model,
+        evaluation_methods=experimental_params.get('evaluation_methods'),
+    )
+
+
+def claim_normal_experiment(experiment_id: str, worker_index: Optional[int] = None) -> bool:
+    """Claims an experiment for this worker of the sweep before it runs. Returns False if another worker has
+    already started it, e.g., because one of them stole it from the other's schedule.
+
+    Without sharding, or if the results store is unreachable, every experiment is this worker's.
+
+    Args:
+        experiment_id (str): the ID of the experiment.
+        worker_index (int, optional): the index of this worker. Defaults to WORKER_INDEX.
+    """
+    from synqtab.data import ResultsClient
+    from synqtab.environment import WORKER_INDEX, WORKER_COUNT
+
+    if WORKER_COUNT <= 1:
+        return True
+    worker_index = WORKER_INDEX if worker_index is None else worker_index
+    try:
+        return ResultsClient.claim_computation(experiment_id, worker_index)
+    except Exception as e:
+        LOG.warning(f"Could not claim experiment {experiment_id}; running it anyway. Error: {e}")
+        return True
+
+
+def schedule_normal_experiment_jobs(
+    experimental_params: dict[str, Any],
+    perfect: bool,
+    worker_index: Optional[int] = None,
+    worker_count: Optional[int] = None,
+    job_ordering: Optional[str] = None,
+) -> list[NormalExperimentJob]:
+    """Returns the jobs of the sweep in the order that this worker should run them.
+
+    Args:
+        experimental_params (dict[str, Any]): as returned by `get_experimental_params_for_normal`.
+        perfect (bool): whether to schedule the perfect jobs or the imperfect and semi-perfect ones.
+        worker_index (int, optional): the index of this worker. Defaults to WORKER_INDEX.
+        worker_count (int, optional): the number of workers of the sweep. Defaults to WORKER_COUNT.
+        job_ordering (str, optional): 'cost' to pack by predicted runtime or 'random' to keep the order of
+            the (shuffled) parameters. Defaults to JOB_ORDERING. If the results store or the object storage is
+            unreachable, every job costs the same, so the workers still split the jobs deterministically.
+    """
+    from synqtab.environment import JOB_ORDERING, WORKER_INDEX, WORKER_COUNT
+
+    worker_index = WORKER_INDEX if worker_index is None else worker_index
+    worker_count = WORKER_COUNT if worker_count is None else worker_count
+    job_ordering = job_ordering or JOB_ORDERING
+
+    jobs = get_normal_experiment_jobs(experimental_params, perfect=perfect)
+    if job_ordering == 'random':
+        return jobs
+    if job_ordering != 'cost':
+        raise ValueError(f"Unknown job ordering '{job_ordering}'. Expected 'cost' or 'random'.")
+
+    predicted_seconds = predict_jobs_seconds(experimental_params, jobs)
+    if predicted_seconds is None:
+        # with unit costs, every worker packs the jobs the same way, so the workers still split them
+        predicted_seconds = {job: 1.0 for job in jobs}
+    bins = pack_into_bins(jobs, predicted_seconds, nof_bins=worker_count)
+    LOG.info(
+        f"Packed {len(jobs)} jobs into {len(bins)} workers with predicted loads of "
+        f"{[round(sum(predicted_seconds[job] for job in jobs_of_bin)) for jobs_of_bin in bins]} seconds."
+    )
+    return get_worker_schedule(bins, worker_index)
+
+
+def schedule_normal_pipeline_jobs(
+    experimental_params: dict[str, Any],
+    worker_index: Optional[int] = None,
+    worker_count: Optional[int] = None,
+    job_ordering: Optional[str] = None,
+) -> list[NormalExperimentJob]:
+    """Returns the perfect, imperfect and semi-perfect jobs that this worker adds to its `NormalPipeline`,
+    longest-first.
+
+    A pipeline generates the perfect counterpart of every imperfect job that it evaluates, so the jobs of a
+    (random seed, dataset, generator) stay on one worker, and workers do not steal each other's groups.
+    Otherwise, two workers would generate the same perfect experiment and conflict on its primary key. The worker
+    of a group is a stable hash of the group, not of the runtime history, which workers that start at different
+    times see differently; so every group is run by exactly one worker. The runtime predictions only order the
+    jobs of the worker.
+
+    Args:
+        experimental_params (dict[str, Any]): as returned by `get_experimental_params_for_normal`.
+        worker_index (int, optional): the index of this worker. Defaults to WORKER_INDEX.
+        worker_count (int, optional): the number of workers of the sweep. Defaults to WORKER_COUNT.
+        job_ordering (str, optional): 'cost' or 'random'. Defaults to JOB_ORDERING.
+    """
+    from synqtab.environment import JOB_ORDERING, WORKER_INDEX, WORKER_COUNT
+
+    worker_index = WORKER_INDEX if worker_index is None else worker_index
+    worker_count = WORKER_COUNT if worker_count is None else worker_count
+    job_ordering = job_ordering or JOB_ORDERING
+    if job_ordering not in {'cost', 'random'}:
+        raise ValueError(f"Unknown job ordering '{job_ordering}'. Expected 'cost' or 'random'.")
+
+    jobs = (
+        get_normal_experiment_jobs(experimental_params, perfect=True) +
+        get_normal_experiment_jobs(experimental_params, perfect=False)
+    )
+    worker_jobs = [
+        job for job in jobs
+        if NormalPipelineJobGroup.of(job).get_worker_index(worker_count) == worker_index % max(1, worker_count)
+    ]
+    LOG.info(f"This worker runs {len(worker_jobs)} of the {len(jobs)} jobs, in the groups that hash to it.")
+    if job_ordering == 'random':
+        return worker_jobs
+
+    predicted_seconds = predict_jobs_seconds(experimental_params, worker_jobs)
+    return worker_jobs if predicted_seconds is None else order_longest_first(worker_jobs, predicted_seconds)
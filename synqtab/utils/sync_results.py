@@ -0,0 +1,89 @@
+"""Pushes the results of a local results store (SQLite or DuckDB) into the central Postgres.
+
+The experiments and the evaluations are inserted with ON CONFLICT DO NOTHING and kept locally, so syncing
+is idempotent and can be repeated at any time. The rows of the log tables (errors, skipped_computations)
+have no natural key, so they are moved batch by batch: each batch is deleted locally in the transaction that
+reads it, once the target has committed it.
+
+Example:
+    python -m synqtab.utils.sync_results --source sqlite --database-path ~/.synqtab/results.sqlite
+"""
+import argparse
+from typing import Optional
+
+from synqtab.utils.logging_utils import get_logger
+
+
+LOG = get_logger(__file__)
+
+
+def _move_rows(source, target, table_name: str, batch_size: int) -> int:
+    """Moves the rows of a table that is keyed by a serial id, batch by batch. Each batch is deleted in the
+    source transaction that reads it, right after the target commits it, so an interrupted sync leaves at most
+    the batch in flight to be sent twice instead of every row sent so far."""
+    nof_moved_rows = 0
+    while True:
+        with source._engine.begin() as connection:
+            rows = source.read_first_rows(table_name, batch_size=batch_size, connection=connection)
+            if not rows:
+                return nof_moved_rows
+            ids = [row.pop('id') for row in rows]
+            target.insert_rows(table_name, rows)
+            source.delete_rows_by_id(table_name, ids, connection=connection)
+        nof_moved_rows += len(rows)
+
+
+def sync_results(
+    source,
+    target,
+    table_names: Optional[list[str]] = None,
+    batch_size: int = 1000,
+) -> dict[str, int]:
+    """Copies the rows of the tables from the source to the target results store.
+
+    Args:
+        source (type[ResultsStore]): the store to read from, e.g., `SQLiteClient`.
+        target (type[ResultsStore]): the store to write to, e.g., `PostgresClient`.
+        table_names (list[str], optional): the tables to sync. Defaults to all tables of the schema.
+        batch_size (int, optional): rows per read and per target transaction. Defaults to 1000.
+
+    Returns:
+        dict[str, int]: the number of rows that were sent to the target, per table.
+    """
+    table_names = table_names or list(source.TABLE_KEYS)
+
+    synced_rows = dict()
+    for table_name in table_names:
+        synced_rows[table_name] = 0
+        if source.TABLE_KEYS.get(table_name) is None:
+            synced_rows[table_name] = _move_rows(source, target, table_name, batch_size)
+        else:
+            for rows in source.iter_table_rows(table_name, batch_size=batch_size):
+                target.insert_rows(table_name, rows, ignore_conflicts=True)
+                synced_rows[table_name] += len(rows)
+        LOG.info(f"Synced {synced_rows[table_name]} rows of '{table_name}'.")
+    return synced_rows
+
+
+if __name__ == '__main__':
+    from synqtab.data.clients.ResultsClient import ResultsClient
+    from synqtab.environment import RESULTS_BACKEND
+
+    parser = argparse.ArgumentParser(description='Push the results of a local results store into Postgres.')
+    parser.add_argument('--source', choices=['sqlite', 'duckdb'], default=RESULTS_BACKEND if RESULTS_BACKEND != 'postgres' else 'sqlite',
+                        help='the local store to read from. Defaults to RESULTS_BACKEND, or sqlite.')
+    parser.add_argument('--database-path', default=None, help='the database file. Defaults to RESULTS_DATABASE_PATH.')
+    parser.add_argument('--target', choices=['postgres', 'sqlite', 'duckdb'], default='postgres', help='the store to write to.')
+    parser.add_argument('--tables', nargs='*', default=None, help='the tables to sync. Defaults to all tables.')
+    parser.add_argument('--batch-size', type=int, default=1000, help='rows per read and per target transaction.')
+    args = parser.parse_args()
+
+    source_store = ResultsClient.resolve_backend(args.source)
+    if args.database_path:
+        source_store.set_database_path(args.database_path)
+    target_store = ResultsClient.resolve_backend(args.target)
+    if target_store is source_store:
+        parser.error('The source and the target store must differ.')
+
+    for table_name, nof_rows in sync_results(source_store, target_store, args.tables, args.batch_size).items():
+        print(f"{table_name}: {nof_rows} rows")
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_table(random_seed: int, n_rows: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(random_seed)
+    income = random_generator.normal(50, 15, size=n_rows).round(1)
+    region = random_generator.choice(['north', 'south', 'east'], size=n_rows).astype(object)
+    noise = random_generator.normal(0, 10, size=n_rows)
+    return pd.DataFrame({
+        'income': income,
+        'tenure': random_generator.integers(0, 30, size=n_rows),
+        'region': region,
+        'churn': np.where(income + np.where(region == 'south', 15, 0) + noise > 70, 'yes', 'no').astype(object),
+    })
+
+
+METADATA = {
+    'columns': {
+        'income': {'sdtype': 'numerical'},
+        'tenure': {'sdtype': 'numerical'},
+        'region': {'sdtype': 'categorical'},
+        'churn': {'sdtype': 'categorical'},
+    },
+}
+
+
+@pytest.mark.parametrize('metric_name, fixed_value_name', [
+    ('BinaryClassifierPrecisionEfficacy', 'fixed_recall_value'),
+    ('BinaryClassifierRecallEfficacy', 'fixed_precision_value'),
+])
+def test_augmentation_breakdown_matches_sdmetrics(metric_name, fixed_value_name):
+    pytest.importorskip('xgboost')
+
+    from sdmetrics.single_table import data_augmentation
+    from synqtab.utils.baseline_utils import compute_augmentation_breakdown
+
+    metric = getattr(data_augmentation, metric_name)
+    tables = dict(
+        real_training_data=_make_table(random_seed=0, n_rows=200),
+        synthetic_data=_make_table(random_seed=1, n_rows=150),
+        real_validation_data=_make_table(random_seed=2, n_rows=100),
+        metadata=METADATA,
+        prediction_column_name='churn',
+        minority_class_label='yes',
+    )
+    expected = metric.compute_breakdown(**tables, classifier='XGBoost', **{fixed_value_name: 0.8})
+
+    result = compute_augmentation_breakdown(
+        metric, **tables, evaluation_method='TEST', classifier='XGBoost', fixed_value=0.8)
+
+    assert result['score'] == pytest.approx(expected['score'])
+    assert {key: value for key, value in result.items() if key != 'score'} == {
+        key: value for key, value in expected.items() if key != 'score'
+    }
@@ -0,0 +1,17 @@
+import pytest
+
+
+def test_corruption_benchmarks_run_with_the_default_seed():
+    """The default seed must be usable by ReproducibleOperations, so that no corruption case fails."""
+    pytest.importorskip('boto3')
+
+    from synqtab.benchmarks.suites import run_benchmarks
+    from synqtab.enums import DataErrorType, ProblemType
+
+    report = run_benchmarks(row_counts=[200], problem_types=[ProblemType.CLASSIFICATION], suites=['corruption'])
+
+    corruption_results = report['results']
+    assert sorted(result['name'] for result in corruption_results) == sorted(str(error) for error in DataErrorType)
+    assert [result for result in corruption_results if result['error']] == []
+    assert all(result['suite'] == 'corruption' and result['n_rows'] == 200 for result in corruption_results)
+    assert all(result['seconds'] is not None for result in corruption_results)
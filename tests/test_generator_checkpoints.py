@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+
+def _count_training_steps(monkeypatch) -> list:
+    from transformers import Trainer
+
+    training_steps = []
+    train_step = Trainer.training_step
+
+    def counted_training_step(self, *args, **kwargs):
+        training_steps.append(self.state.global_step)
+        return train_step(self, *args, **kwargs)
+
+    monkeypatch.setattr(Trainer, 'training_step', counted_training_step)
+    return training_steps
+
+
+class _RecordingRealTabFormer:
+    def __init__(self):
+        self.fit_kwargs = []
+
+    def fit(self, df, **kwargs):
+        self.fit_kwargs.append(kwargs)
+
+    def sample(self, n_samples):
+        return pd.DataFrame({'a': range(n_samples)})
+
+
+@pytest.mark.parametrize('checkpoint_interval, restored, expected_fit_kwargs', [
+    (0.0, False, {}),
+    (3600.0, False, {}),
+    (3600.0, True, {'n_critic': 0, 'resume_from_checkpoint': True}),
+])
+def test_realtabformer_trains_with_the_critic_unless_it_resumes(
+    tmp_path, monkeypatch, checkpoint_interval, restored, expected_fit_kwargs
+):
+    """Only a run that restored a checkpoint leaves REaLTabFormer's critic rounds (the default `n_critic`)."""
+    pytest.importorskip('dotenv')
+
+    import synqtab.environment
+    from synqtab.generators.RealTabTransformer import RealTabTransformer
+    from synqtab.reproducibility import ReproducibleOperations
+    from synqtab.utils import checkpoint_utils
+
+    model = _RecordingRealTabFormer()
+    monkeypatch.setattr(synqtab.environment, 'GENERATOR_CHECKPOINT_INTERVAL', checkpoint_interval)
+    monkeypatch.setattr(ReproducibleOperations, 'get_realtabformer_model', staticmethod(lambda **kwargs: model))
+    monkeypatch.setattr(checkpoint_utils, 'get_local_checkpoint_directory', lambda checkpoint_id: tmp_path / 'checkpoints')
+    monkeypatch.setattr(checkpoint_utils, 'restore_checkpoint_directory', lambda local_directory, checkpoint_id: restored)
+
+    X = pd.DataFrame({'a': range(8)})
+    y = pd.DataFrame({'target': [index % 2 for index in range(8)]})
+    samples = RealTabTransformer().generate(
+        X, y, n_samples=4, metadata=dict(), checkpoint_id='NOR#toy#42#PERF#NULL#NULL#realtabformer')
+
+    assert model.fit_kwargs == [expected_fit_kwargs]
+    assert len(samples) == 4
+
+
+def test_realtabformer_resumes_from_the_restored_checkpoint(tmp_path, monkeypatch):
+    """A restarted REaLTabFormer training restores the uploaded checkpoint and only runs the remaining steps."""
+    pytest.importorskip('boto3')
+    pytest.importorskip('realtabformer')
+    torch = pytest.importorskip('torch')
+    if not torch.cuda.is_available():
+        pytest.skip('REaLTabFormer trains on CUDA by default.')
+
+    from realtabformer import REaLTabFormer
+
+    from synqtab.data import StorageClient
+    from synqtab.data.clients.LocalStorageClient import LocalStorageClient
+    from synqtab.generators.RealTabTransformer import RealTabTransformer
+    from synqtab.reproducibility import ReproducibleOperations
+    from synqtab.utils.checkpoint_utils import get_latest_checkpoint_subdirectory, upload_checkpoint_directory
+
+    import synqtab.environment
+
+    monkeypatch.setattr(synqtab.environment, 'GENERATOR_CHECKPOINT_INTERVAL', 3600.0)
+    LocalStorageClient.set_root_directory(str(tmp_path / 'storage'))
+    previous_backend = StorageClient.use_backend(LocalStorageClient)
+    ReproducibleOperations.set_random_seed(42)
+
+    def get_small_realtabformer_model(epochs: int):
+        def get_realtabformer_model(model_type='tabular', checkpoints_dir=None, **kwargs):
+            return REaLTabFormer(
+                model_type=model_type, epochs=epochs, batch_size=8, save_strategy='epoch',
+                random_state=42, checkpoints_dir=checkpoints_dir,
+            )
+        return get_realtabformer_model
+
+    X = pd.DataFrame({'a': range(64), 'b': [index % 3 for index in range(64)]})
+    y = pd.DataFrame({'target': [index % 2 for index in range(64)]})
+    checkpoint_id = 'NOR#toy#42#PERF#NULL#NULL#realtabformer'
+    try:
+        # an interrupted run: one epoch of training, checkpointed and uploaded
+        training_steps = _count_training_steps(monkeypatch)
+        first_checkpoints_directory = tmp_path / 'first'
+        get_small_realtabformer_model(epochs=1)(checkpoints_dir=str(first_checkpoints_directory)).fit(
+            pd.concat([X, y], axis=1), n_critic=0)
+        steps_per_epoch = len(training_steps)
+        restored_checkpoint = get_latest_checkpoint_subdirectory(first_checkpoints_directory)
+        assert restored_checkpoint is not None
+        upload_checkpoint_directory(first_checkpoints_directory, checkpoint_id)
+
+        # the restarted run of two epochs continues from the restored step
+        training_steps.clear()
+        monkeypatch.setattr(
+            ReproducibleOperations, 'get_realtabformer_model', staticmethod(get_small_realtabformer_model(epochs=2)))
+        RealTabTransformer().generate(X, y, n_samples=8, metadata=dict(), checkpoint_id=checkpoint_id)
+
+        assert len(training_steps) == steps_per_epoch
+        assert training_steps[0] == int(restored_checkpoint.name.split('-')[-1])
+    finally:
+        StorageClient.use_backend(previous_backend)
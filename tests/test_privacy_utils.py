@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_table(random_seed: int, n_rows: int = 120) -> pd.DataFrame:
+    random_generator = np.random.default_rng(random_seed)
+    df = pd.DataFrame({
+        'amount': random_generator.normal(100, 25, size=n_rows).round(1),
+        'age': random_generator.integers(18, 80, size=n_rows),
+        'city': random_generator.choice(['athens', 'patras', 'volos', 'chania'], size=n_rows).astype(object),
+        'plan': random_generator.choice(['basic', 'premium'], size=n_rows, p=[0.7, 0.3]).astype(object),
+        'joined': pd.Timestamp('2020-01-01') + pd.to_timedelta(random_generator.integers(0, 1000, size=n_rows), unit='D'),
+    })
+    df.loc[random_generator.random(n_rows) < 0.1, 'amount'] = np.nan
+    df.loc[random_generator.random(n_rows) < 0.1, 'city'] = None
+    return df
+
+
+METADATA = {
+    'columns': {
+        'amount': {'sdtype': 'numerical'},
+        'age': {'sdtype': 'numerical'},
+        'city': {'sdtype': 'categorical'},
+        'plan': {'sdtype': 'categorical'},
+        'joined': {'sdtype': 'datetime'},
+    },
+}
+
+
+@pytest.fixture
+def real_data() -> pd.DataFrame:
+    return _make_table(random_seed=0)
+
+
+@pytest.fixture
+def synthetic_data() -> pd.DataFrame:
+    return _make_table(random_seed=1, n_rows=100)
+
+
+def test_dcr_matches_sdmetrics(real_data, synthetic_data):
+    from sdmetrics.single_table.privacy.dcr_utils import calculate_dcr as sdmetrics_calculate_dcr
+    from synqtab.utils.privacy_utils import calculate_dcr, encode_for_dcr
+
+    expected_dcr = sdmetrics_calculate_dcr(dataset=synthetic_data, reference_dataset=real_data, metadata=METADATA)
+
+    encoded_synthetic, encoded_real = encode_for_dcr(synthetic_data, real_data, METADATA)
+    # blocks smaller than the tables, so that the chunked minimum is exercised
+    dcr = calculate_dcr(encoded_synthetic, encoded_real, chunk_size=32)
+
+    np.testing.assert_allclose(dcr, expected_dcr.to_numpy(), atol=1e-12)
+
+
+def test_dcr_baseline_protection_matches_sdmetrics(real_data, synthetic_data, monkeypatch):
+    from sdmetrics.single_table import DCRBaselineProtection
+    from synqtab.utils.privacy_utils import compute_dcr_baseline_protection, generate_random_baseline
+
+    # both sides score against the same random baseline, which SDMetrics draws from numpy's global random state
+    random_data = generate_random_baseline(real_data, len(synthetic_data), np.random.default_rng(42))
+    monkeypatch.setattr(DCRBaselineProtection, '_generate_random_data', classmethod(lambda cls, *args: random_data))
+    expected = DCRBaselineProtection.compute_breakdown(real_data, synthetic_data, METADATA)
+
+    result = compute_dcr_baseline_protection(real_data, synthetic_data, METADATA, chunk_size=32, random_seed=42)
+
+    assert result['score'] == pytest.approx(expected['score'])
+    assert result['median_DCR_to_real_data'] == pytest.approx(expected['median_DCR_to_real_data'])
+
+
+@pytest.mark.parametrize('computation_method', ['cap', 'zero_cap'])
+@pytest.mark.parametrize('known_column_names, sensitive_column_names, continuous_column_names', [
+    (['city'], ['plan'], None),
+    (['city', 'age'], ['plan'], ['age']),
+    (['plan', 'amount'], ['city', 'age'], ['amount', 'age']),
+])
+def test_disclosure_protection_matches_sdmetrics(
+    real_data, synthetic_data, computation_method, known_column_names, sensitive_column_names, continuous_column_names
+):
+    from sdmetrics.single_table import DisclosureProtection
+    from synqtab.utils.privacy_utils import compute_disclosure_protection
+
+    parameters = dict(
+        known_column_names=known_column_names,
+        sensitive_column_names=sensitive_column_names,
+        computation_method=computation_method,
+        continuous_column_names=continuous_column_names,
+        num_discrete_bins=5,
+    )
+    expected = DisclosureProtection.compute_breakdown(real_data=real_data, synthetic_data=synthetic_data, **parameters)
+
+    result = compute_disclosure_protection(real_data, synthetic_data, **parameters)
+
+    assert result == pytest.approx(expected)